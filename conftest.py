@@ -0,0 +1,7 @@
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def _synchronous_view_counter_flush(settings):
+    # No background flusher threads in tests; counters flush at request end.
+    settings.VIEW_COUNTER_BACKGROUND_FLUSH = False
@@ -0,0 +1,147 @@
+"""
+Funding totals in one base currency.
+
+Projects carry their own currency, so totals convert raised and target
+amounts through the exchange_rates table in SQL. One grouped query yields
+every startup's totals plus the platform-wide total (GROUPING SETS).
+Results are cached per startup and for the platform, and a project save
+drops the affected keys so the next read recomputes them.
+"""
+
+from decimal import Decimal
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connection, transaction
+
+from .models import ExchangeRate
+
+
+PLATFORM_KEY = "funding:platform"
+
+FUNDING_SQL = """
+SELECT p.startup_profile_id,
+       GROUPING(p.startup_profile_id) = 1 AS is_total,
+       COALESCE(ROUND(SUM(p.raised_amount * r.rate), 2), 0),
+       COALESCE(ROUND(SUM(p.target_amount * r.rate), 2), 0),
+       COALESCE(array_agg(DISTINCT upper(p.currency)) FILTER (WHERE r.rate IS NULL), '{{}}')
+FROM projects AS p
+LEFT JOIN (
+    SELECT currency, rate FROM exchange_rates WHERE currency <> %(base)s
+    UNION ALL
+    SELECT %(base)s, 1
+) AS r ON r.currency = upper(p.currency)
+WHERE NOT p.is_deleted AND p.visibility = 'public' {filter}
+GROUP BY GROUPING SETS ((p.startup_profile_id), ())
+"""
+
+
+def base_currency():
+    return getattr(settings, "FUNDING_BASE_CURRENCY", "UAH").upper()
+
+
+def _startup_key(startup_profile_id):
+    return f"funding:startup:{startup_profile_id}"
+
+
+def _cache_ttl():
+    return int(getattr(settings, "FUNDING_CACHE_TTL", 60 * 60))
+
+
+def _totals(raised=0, target=0, unconverted=()):
+    return {
+        "currency": base_currency(),
+        "raised_amount": f"{Decimal(raised):.2f}",
+        "target_amount": f"{Decimal(target):.2f}",
+        "progress": round(float(raised / target * 100), 1) if target else None,
+        "unconverted_currencies": sorted(unconverted),
+    }
+
+
+def convert_amounts(amounts):
+    """
+    Sum ``{currency: amount}`` in the base currency. Returns ``(total,
+    unconverted_currencies)``; currencies without a rate are left out.
+    """
+    base = base_currency()
+    rates = dict(
+        ExchangeRate.objects
+        .filter(currency__in=[currency for currency in amounts if currency != base])
+        .values_list("currency", "rate")
+    )
+    rates[base] = Decimal(1)
+
+    total = sum(
+        (Decimal(amount) * rates[currency] for currency, amount in amounts.items() if currency in rates),
+        Decimal(0),
+    )
+    return round(total, 2), sorted(set(amounts) - set(rates))
+
+
+def compute_funding(startup_profile_ids=None):
+    """
+    Return ``(per_startup, platform)`` totals. With ``startup_profile_ids``
+    only those startups are aggregated and ``platform`` covers just them.
+    """
+    params = {"base": base_currency()}
+    row_filter = ""
+    if startup_profile_ids is not None:
+        row_filter = "AND p.startup_profile_id = ANY(%(ids)s)"
+        params["ids"] = list(startup_profile_ids)
+
+    per_startup = {}
+    platform = _totals()
+    with connection.cursor() as cursor:
+        cursor.execute(FUNDING_SQL.format(filter=row_filter), params)
+        for startup_profile_id, is_total, raised, target, unconverted in cursor.fetchall():
+            if is_total:
+                platform = _totals(raised, target, unconverted)
+            else:
+                per_startup[startup_profile_id] = _totals(raised, target, unconverted)
+
+    for startup_profile_id in startup_profile_ids or ():
+        per_startup.setdefault(startup_profile_id, _totals())
+    return per_startup, platform
+
+
+def refresh_funding_rollups():
+    """
+    Recompute and cache every startup's totals and the platform total.
+    Returns the platform total.
+    """
+    per_startup, platform = compute_funding()
+    cache.set_many({_startup_key(pk): totals for pk, totals in per_startup.items()}, _cache_ttl())
+    cache.set(PLATFORM_KEY, platform, _cache_ttl())
+    return platform
+
+
+def get_startup_funding_many(startup_profile_ids):
+    """``{startup_profile_id: totals}``, computing cache misses in one query."""
+    keys = {_startup_key(pk): pk for pk in startup_profile_ids}
+    cached = cache.get_many(list(keys))
+    result = {keys[key]: totals for key, totals in cached.items()}
+
+    missing = [pk for pk in startup_profile_ids if pk not in result]
+    if missing:
+        computed, _ = compute_funding(missing)
+        cache.set_many({_startup_key(pk): totals for pk, totals in computed.items()}, _cache_ttl())
+        result.update(computed)
+    return result
+
+
+def get_startup_funding(startup_profile_id):
+    return get_startup_funding_many([startup_profile_id])[startup_profile_id]
+
+
+def get_platform_funding():
+    platform = cache.get(PLATFORM_KEY)
+    if platform is None:
+        platform = refresh_funding_rollups()
+    return platform
+
+
+def invalidate_funding(startup_profile_id=None):
+    keys = [PLATFORM_KEY]
+    if startup_profile_id is not None:
+        keys.append(_startup_key(startup_profile_id))
+    transaction.on_commit(lambda: cache.delete_many(keys))
@@ -0,0 +1,12 @@
+from django.core.management.base import BaseCommand
+
+from analytics.rollups import build_daily_rollups
+
+
+class Command(BaseCommand):
+    help = "Fold new views, saves, messages and funding changes into per-startup daily stats."
+
+    def handle(self, *args, **options):
+        for source, rows in build_daily_rollups().items():
+            self.stdout.write(f"{source}: {rows} rows")
+        self.stdout.write(self.style.SUCCESS("Daily rollups are up to date."))
@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from analytics.trending import compute_trending_scores
+
+
+class Command(BaseCommand):
+    help = "Recompute startup trending scores from recent views, saves and project activity."
+
+    def handle(self, *args, **options):
+        scored = compute_trending_scores()
+        self.stdout.write(self.style.SUCCESS(f"Scored {scored} startups."))
@@ -0,0 +1,55 @@
+import csv
+import json
+from decimal import Decimal, InvalidOperation
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from analytics.funding import refresh_funding_rollups
+from analytics.models import ExchangeRate
+
+
+class Command(BaseCommand):
+    help = (
+        "Load exchange rates into the base currency from a CSV file "
+        "(currency,rate per line) or a JSON object {\"USD\": 41.2, ...}."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("path")
+
+    def handle(self, *args, **options):
+        path = Path(options["path"])
+        if not path.exists():
+            raise CommandError(f"{path} does not exist.")
+
+        if path.suffix.lower() == ".json":
+            rows = json.loads(path.read_text()).items()
+        else:
+            with path.open(newline="") as handle:
+                rows = [row[:2] for row in csv.reader(handle) if row and not row[0].startswith("#")]
+
+        rates = []
+        for currency, rate in rows:
+            currency = currency.strip().upper()
+            if currency == "CURRENCY":
+                continue
+            try:
+                rate = Decimal(str(rate).strip())
+            except InvalidOperation:
+                raise CommandError(f"Invalid rate for {currency}: {rate!r}")
+            if len(currency) != 3 or rate <= 0:
+                raise CommandError(f"Invalid rate for {currency}: {rate}")
+            rates.append(ExchangeRate(currency=currency, rate=rate))
+
+        with transaction.atomic():
+            ExchangeRate.objects.bulk_create(
+                rates,
+                update_conflicts=True,
+                unique_fields=["currency"],
+                update_fields=["rate", "updated_at"],
+            )
+        refresh_funding_rollups()
+
+        self.stdout.write(self.style.SUCCESS(f"Loaded {len(rates)} exchange rates."))
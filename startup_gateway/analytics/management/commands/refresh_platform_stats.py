@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+
+from analytics.platform_stats import refresh_platform_stats
+
+
+class Command(BaseCommand):
+    help = "Refresh the platform_stats materialized view shown on the landing page."
+
+    def handle(self, *args, **options):
+        stats = refresh_platform_stats()
+        self.stdout.write(self.style.SUCCESS(
+            f"{stats['startups']} startups, {stats['investors']} investors, "
+            f"{stats['projects']} projects ({stats['funded_projects']} funded)."
+        ))
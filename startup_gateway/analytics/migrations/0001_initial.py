@@ -0,0 +1,43 @@
+# Generated by Django 5.2.10 on 2026-10-19 11:12
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('projects', '0004_partition_project_audit'),
+        ('startups', '0003_region_startupprofile_region'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ProjectDailyViews',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.DateField()),
+                ('views', models.PositiveBigIntegerField(default=0)),
+                ('project', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='daily_views', to='projects.project')),
+            ],
+            options={
+                'db_table': 'project_daily_views',
+                'constraints': [models.UniqueConstraint(fields=('project', 'day'), name='unique_project_views_per_day')],
+            },
+        ),
+        migrations.CreateModel(
+            name='StartupDailyViews',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.DateField()),
+                ('views', models.PositiveBigIntegerField(default=0)),
+                ('startup_profile', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='daily_views', to='startups.startupprofile')),
+            ],
+            options={
+                'db_table': 'startup_daily_views',
+                'constraints': [models.UniqueConstraint(fields=('startup_profile', 'day'), name='unique_startup_views_per_day')],
+            },
+        ),
+    ]
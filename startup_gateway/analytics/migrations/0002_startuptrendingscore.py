@@ -0,0 +1,27 @@
+# Generated by Django 5.2.10 on 2026-10-19 11:15
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('analytics', '0001_initial'),
+        ('startups', '0003_region_startupprofile_region'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='StartupTrendingScore',
+            fields=[
+                ('startup_profile', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='trending_score', serialize=False, to='startups.startupprofile')),
+                ('score', models.FloatField(default=0)),
+                ('computed_at', models.DateTimeField()),
+            ],
+            options={
+                'db_table': 'startup_trending_scores',
+                'indexes': [models.Index(fields=['-score'], name='startup_trending_score_idx')],
+            },
+        ),
+    ]
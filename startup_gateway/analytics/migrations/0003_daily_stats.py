@@ -0,0 +1,42 @@
+# Generated by Django 5.2.10 on 2026-10-19 11:24
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('analytics', '0002_startuptrendingscore'),
+        ('startups', '0003_region_startupprofile_region'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RollupWatermark',
+            fields=[
+                ('name', models.CharField(max_length=50, primary_key=True, serialize=False)),
+                ('position', models.DateTimeField()),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'db_table': 'analytics_rollup_watermarks',
+            },
+        ),
+        migrations.CreateModel(
+            name='StartupDailyStats',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.DateField()),
+                ('views', models.PositiveBigIntegerField(default=0)),
+                ('saves', models.PositiveIntegerField(default=0)),
+                ('messages_received', models.PositiveIntegerField(default=0)),
+                ('raised_amount_change', models.DecimalField(decimal_places=2, default=0, max_digits=14)),
+                ('startup_profile', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='daily_stats', to='startups.startupprofile')),
+            ],
+            options={
+                'db_table': 'startup_daily_stats',
+                'constraints': [models.UniqueConstraint(fields=('startup_profile', 'day'), name='unique_startup_stats_per_day')],
+            },
+        ),
+    ]
@@ -0,0 +1,48 @@
+from django.db import migrations, models
+
+
+CREATE_PLATFORM_STATS = """
+CREATE MATERIALIZED VIEW platform_stats AS
+SELECT 1::smallint AS id,
+       (SELECT COUNT(*) FROM startup_profiles) AS startups,
+       (SELECT COUNT(*) FROM investor_profiles) AS investors,
+       COUNT(*) AS projects,
+       COUNT(*) FILTER (WHERE status = 'funded') AS funded_projects,
+       NOW() AS refreshed_at
+FROM projects
+WHERE NOT is_deleted AND visibility = 'public';
+
+-- REFRESH ... CONCURRENTLY needs a unique index.
+CREATE UNIQUE INDEX platform_stats_id_idx ON platform_stats (id);
+"""
+
+DROP_PLATFORM_STATS = "DROP MATERIALIZED VIEW IF EXISTS platform_stats;"
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('analytics', '0004_exchangerate'),
+        ('investors', '0001_initial'),
+        ('projects', '0004_partition_project_audit'),
+        ('startups', '0003_region_startupprofile_region'),
+    ]
+
+    operations = [
+        migrations.RunSQL(CREATE_PLATFORM_STATS, DROP_PLATFORM_STATS),
+        migrations.CreateModel(
+            name='PlatformStats',
+            fields=[
+                ('id', models.PositiveSmallIntegerField(primary_key=True, serialize=False)),
+                ('startups', models.PositiveIntegerField()),
+                ('investors', models.PositiveIntegerField()),
+                ('projects', models.PositiveIntegerField()),
+                ('funded_projects', models.PositiveIntegerField()),
+                ('refreshed_at', models.DateTimeField()),
+            ],
+            options={
+                'db_table': 'platform_stats',
+                'managed': False,
+            },
+        ),
+    ]
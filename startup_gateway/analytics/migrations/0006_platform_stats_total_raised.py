@@ -0,0 +1,64 @@
+from django.db import migrations, models
+
+
+CREATE_PLATFORM_STATS = """
+DROP MATERIALIZED VIEW IF EXISTS platform_stats;
+
+CREATE MATERIALIZED VIEW platform_stats AS
+SELECT 1::smallint AS id,
+       (SELECT COUNT(*) FROM startup_profiles) AS startups,
+       (SELECT COUNT(*) FROM investor_profiles) AS investors,
+       COUNT(*) AS projects,
+       COUNT(*) FILTER (WHERE status = 'funded') AS funded_projects,
+       COALESCE(
+           (
+               SELECT jsonb_object_agg(currency, raised::text)
+               FROM (
+                   SELECT upper(currency) AS currency, SUM(raised_amount) AS raised
+                   FROM projects
+                   WHERE NOT is_deleted AND visibility = 'public'
+                   GROUP BY 1
+               ) AS per_currency
+           ),
+           '{}'::jsonb
+       ) AS raised_by_currency,
+       NOW() AS refreshed_at
+FROM projects
+WHERE NOT is_deleted AND visibility = 'public';
+
+-- REFRESH ... CONCURRENTLY needs a unique index.
+CREATE UNIQUE INDEX platform_stats_id_idx ON platform_stats (id);
+"""
+
+RESTORE_PLATFORM_STATS = """
+DROP MATERIALIZED VIEW IF EXISTS platform_stats;
+
+CREATE MATERIALIZED VIEW platform_stats AS
+SELECT 1::smallint AS id,
+       (SELECT COUNT(*) FROM startup_profiles) AS startups,
+       (SELECT COUNT(*) FROM investor_profiles) AS investors,
+       COUNT(*) AS projects,
+       COUNT(*) FILTER (WHERE status = 'funded') AS funded_projects,
+       NOW() AS refreshed_at
+FROM projects
+WHERE NOT is_deleted AND visibility = 'public';
+
+CREATE UNIQUE INDEX platform_stats_id_idx ON platform_stats (id);
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('analytics', '0005_platform_stats'),
+    ]
+
+    operations = [
+        migrations.RunSQL(CREATE_PLATFORM_STATS, RESTORE_PLATFORM_STATS),
+        migrations.AddField(
+            model_name='platformstats',
+            name='raised_by_currency',
+            field=models.JSONField(default=dict),
+            preserve_default=False,
+        ),
+    ]
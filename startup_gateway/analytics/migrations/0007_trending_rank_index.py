@@ -0,0 +1,21 @@
+# Generated by Django 5.2.10 on 2026-10-19 12:23
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('analytics', '0006_platform_stats_total_raised'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='startuptrendingscore',
+            name='startup_trending_score_idx',
+        ),
+        migrations.AddIndex(
+            model_name='startuptrendingscore',
+            index=models.Index(fields=['-score', '-startup_profile'], name='startup_trending_rank_idx'),
+        ),
+    ]
@@ -0,0 +1,155 @@
+from django.db import models
+
+
+class StartupDailyViews(models.Model):
+    startup_profile = models.ForeignKey(
+        'startups.StartupProfile',
+        on_delete=models.CASCADE,
+        related_name='daily_views'
+    )
+    day = models.DateField()
+    views = models.PositiveBigIntegerField(default=0)
+
+    class Meta:
+        db_table = 'startup_daily_views'
+        constraints = [
+            models.UniqueConstraint(
+                fields=['startup_profile', 'day'],
+                name='unique_startup_views_per_day'
+            ),
+        ]
+
+    def __str__(self):
+        return f'{self.startup_profile} on {self.day}: {self.views}'
+
+
+class ProjectDailyViews(models.Model):
+    project = models.ForeignKey(
+        'projects.Project',
+        on_delete=models.CASCADE,
+        related_name='daily_views'
+    )
+    day = models.DateField()
+    views = models.PositiveBigIntegerField(default=0)
+
+    class Meta:
+        db_table = 'project_daily_views'
+        constraints = [
+            models.UniqueConstraint(
+                fields=['project', 'day'],
+                name='unique_project_views_per_day'
+            ),
+        ]
+
+    def __str__(self):
+        return f'{self.project} on {self.day}: {self.views}'
+
+
+class StartupTrendingScore(models.Model):
+    """
+    Time-decayed popularity of a startup, recomputed periodically by
+    compute_trending_scores and read by ``?ordering=trending`` in index
+    order (score, then startup id, both descending).
+    """
+
+    startup_profile = models.OneToOneField(
+        'startups.StartupProfile',
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='trending_score'
+    )
+    score = models.FloatField(default=0)
+    computed_at = models.DateTimeField()
+
+    class Meta:
+        db_table = 'startup_trending_scores'
+        indexes = [
+            models.Index(fields=['-score', '-startup_profile'], name='startup_trending_rank_idx'),
+        ]
+
+    def __str__(self):
+        return f'{self.startup_profile}: {self.score:.2f}'
+
+
+class StartupDailyStats(models.Model):
+    """
+    Per-startup daily totals for the owner dashboard, filled incrementally
+    by build_daily_rollups.
+    """
+
+    startup_profile = models.ForeignKey(
+        'startups.StartupProfile',
+        on_delete=models.CASCADE,
+        related_name='daily_stats'
+    )
+    day = models.DateField()
+    views = models.PositiveBigIntegerField(default=0)
+    saves = models.PositiveIntegerField(default=0)
+    messages_received = models.PositiveIntegerField(default=0)
+    raised_amount_change = models.DecimalField(max_digits=14, decimal_places=2, default=0)
+
+    class Meta:
+        db_table = 'startup_daily_stats'
+        constraints = [
+            models.UniqueConstraint(
+                fields=['startup_profile', 'day'],
+                name='unique_startup_stats_per_day'
+            ),
+        ]
+
+    def __str__(self):
+        return f'{self.startup_profile} on {self.day}'
+
+
+class RollupWatermark(models.Model):
+    """How far a rollup source has been processed."""
+
+    name = models.CharField(max_length=50, primary_key=True)
+    position = models.DateTimeField()
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = 'analytics_rollup_watermarks'
+
+    def __str__(self):
+        return f'{self.name} @ {self.position}'
+
+
+class ExchangeRate(models.Model):
+    """
+    How many units of FUNDING_BASE_CURRENCY one unit of ``currency`` is
+    worth. Loaded from a file with load_exchange_rates.
+    """
+
+    currency = models.CharField(max_length=3, primary_key=True)
+    rate = models.DecimalField(max_digits=18, decimal_places=8)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = 'exchange_rates'
+
+    def __str__(self):
+        return f'{self.currency}: {self.rate}'
+
+
+class PlatformStats(models.Model):
+    """
+    Read-only view of the platform_stats materialized view, a single row
+    of platform-wide counts refreshed by refresh_platform_stats. Raised
+    amounts are summed per currency and converted when read.
+    """
+
+    id = models.PositiveSmallIntegerField(primary_key=True)
+    startups = models.PositiveIntegerField()
+    investors = models.PositiveIntegerField()
+    projects = models.PositiveIntegerField()
+    funded_projects = models.PositiveIntegerField()
+    raised_by_currency = models.JSONField()
+    refreshed_at = models.DateTimeField()
+
+    class Meta:
+        managed = False
+        db_table = 'platform_stats'
+
+    def __str__(self):
+        return f'Platform stats @ {self.refreshed_at}'
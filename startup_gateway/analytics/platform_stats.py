@@ -0,0 +1,67 @@
+"""
+Platform-wide numbers for the landing page.
+
+Counting every table on each anonymous landing hit is too expensive, so
+the counts live in the platform_stats materialized view. The
+refresh_platform_stats command rebuilds it CONCURRENTLY (readers are never
+blocked) and re-primes the cache; readers only ever hit the cache, or the
+one-row view on a miss. The view also sums raised amounts per currency, so
+total raised changes only on refresh and a project save never sends a
+landing hit into the funding aggregation.
+"""
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connection
+
+from .funding import base_currency, convert_amounts
+from .models import PlatformStats
+from .signals import platform_stats_refreshed
+
+
+STATS_KEY = "platform:stats"
+
+
+def _cache_ttl():
+    return int(getattr(settings, "PLATFORM_STATS_CACHE_TTL", 5 * 60))
+
+
+def _load_counts():
+    stats = PlatformStats.objects.first()
+    if stats is None:
+        return {
+            "startups": 0,
+            "investors": 0,
+            "projects": 0,
+            "funded_projects": 0,
+            "total_raised": {"amount": "0.00", "currency": base_currency()},
+            "refreshed_at": None,
+        }
+
+    raised, _ = convert_amounts(stats.raised_by_currency)
+    return {
+        "startups": stats.startups,
+        "investors": stats.investors,
+        "projects": stats.projects,
+        "funded_projects": stats.funded_projects,
+        "total_raised": {"amount": f"{raised:.2f}", "currency": base_currency()},
+        "refreshed_at": stats.refreshed_at.isoformat(),
+    }
+
+
+def refresh_platform_stats():
+    """Rebuild the materialized view and cache the new counts."""
+    with connection.cursor() as cursor:
+        cursor.execute("REFRESH MATERIALIZED VIEW CONCURRENTLY platform_stats")
+    counts = _load_counts()
+    cache.set(STATS_KEY, counts, _cache_ttl())
+    platform_stats_refreshed.send(sender=PlatformStats)
+    return counts
+
+
+def get_platform_stats():
+    counts = cache.get(STATS_KEY)
+    if counts is None:
+        counts = _load_counts()
+        cache.set(STATS_KEY, counts, _cache_ttl())
+    return counts
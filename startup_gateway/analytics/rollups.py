@@ -0,0 +1,115 @@
+"""
+Daily per-startup stats for owner dashboards.
+
+Each source is processed from its watermark up to ANALYTICS_ROLLUP_LAG_SECONDS
+(15 minutes by default) before now. Watermarks follow the rows' write
+timestamps, not commit order, so the lag is what lets transactions still in
+flight commit before their rows fall behind the watermark; a transaction
+that stays open longer than the lag has its rows skipped. The rollup upsert and the watermark move commit together, which
+makes every source row count exactly once. View counts are already daily,
+so the view source re-reads whole days from its watermark's day and
+overwrites them instead of adding.
+"""
+
+from datetime import datetime, timedelta, timezone as dt_timezone
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.utils import timezone
+
+from .models import RollupWatermark
+
+
+EPOCH = datetime(1970, 1, 1, tzinfo=dt_timezone.utc)
+
+UPSERT_SQL = """
+INSERT INTO startup_daily_stats
+    (startup_profile_id, day, views, saves, messages_received, raised_amount_change)
+SELECT startup_profile_id, day, {views}, {saves}, {messages_received}, {raised_amount_change}
+FROM ({source}) AS source (startup_profile_id, day, value)
+ON CONFLICT (startup_profile_id, day) DO UPDATE
+SET {column} = {update}
+"""
+
+SOURCES = {
+    "saves": """
+        SELECT startup_profile_id, (created_at AT TIME ZONE 'UTC')::date, COUNT(*)
+        FROM saved_startups
+        WHERE created_at >= %(since)s AND created_at < %(until)s
+        GROUP BY 1, 2
+    """,
+    "messages_received": """
+        SELECT p.startup_profile_id, (m.created_at AT TIME ZONE 'UTC')::date, COUNT(*)
+        FROM messages AS m
+        JOIN projects AS p ON p.id = m.project_id
+        JOIN startup_profiles AS s ON s.id = p.startup_profile_id AND s.user_id = m.receiver_id
+        WHERE m.created_at >= %(since)s AND m.created_at < %(until)s
+        GROUP BY 1, 2
+    """,
+    "raised_amount_change": """
+        SELECT p.startup_profile_id, (a.timestamp AT TIME ZONE 'UTC')::date,
+               SUM((a.changes->'raised_amount'->>1)::numeric - (a.changes->'raised_amount'->>0)::numeric)
+        FROM project_audit AS a
+        JOIN projects AS p ON p.id = a.project_id
+        WHERE a.changes ? 'raised_amount'
+          AND a.timestamp >= %(since)s AND a.timestamp < %(until)s
+        GROUP BY 1, 2
+    """,
+    "views": """
+        SELECT startup_profile_id, day, SUM(views)
+        FROM (
+            SELECT startup_profile_id, day, views
+            FROM startup_daily_views
+            WHERE day >= %(since)s::date
+            UNION ALL
+            SELECT p.startup_profile_id, v.day, v.views
+            FROM project_daily_views AS v
+            JOIN projects AS p ON p.id = v.project_id
+            WHERE v.day >= %(since)s::date
+        ) AS views
+        GROUP BY 1, 2
+    """,
+}
+
+STAT_COLUMNS = ("views", "saves", "messages_received", "raised_amount_change")
+
+
+def _upsert_sql(column):
+    values = {name: ("value" if name == column else "0") for name in STAT_COLUMNS}
+    # Views are re-read per day and overwrite; everything else accumulates.
+    update = (
+        f"EXCLUDED.{column}"
+        if column == "views"
+        else f"startup_daily_stats.{column} + EXCLUDED.{column}"
+    )
+    return UPSERT_SQL.format(source=SOURCES[column], column=column, update=update, **values)
+
+
+def roll_up(column, until):
+    """Process one source up to ``until`` and advance its watermark."""
+    with transaction.atomic():
+        watermark, _ = RollupWatermark.objects.select_for_update().get_or_create(
+            name=column, defaults={"position": EPOCH}
+        )
+        if watermark.position >= until:
+            return 0
+
+        with connection.cursor() as cursor:
+            cursor.execute(_upsert_sql(column), {"since": watermark.position, "until": until})
+            rows = cursor.rowcount
+
+        # Views keep re-reading today and yesterday, whose counters may
+        # still be flushed, so the watermark only advances by whole days.
+        if column == "views":
+            until = datetime.combine(until.date(), datetime.min.time(), tzinfo=dt_timezone.utc) - timedelta(days=1)
+        watermark.position = max(watermark.position, until)
+        watermark.save(update_fields=["position", "updated_at"])
+        return rows
+
+
+def build_daily_rollups(now=None):
+    """Bring every source up to date. Returns ``{source: rows upserted}``."""
+    now = now or timezone.now()
+    lag = int(getattr(settings, "ANALYTICS_ROLLUP_LAG_SECONDS", 15 * 60))
+    until = now - timedelta(seconds=lag)
+    return {column: roll_up(column, until) for column in STAT_COLUMNS}
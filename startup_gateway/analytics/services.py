@@ -0,0 +1,148 @@
+"""
+Write-behind page view counters.
+
+Detail views call ``record_view``, which only bumps an in-process counter.
+With VIEW_COUNTER_BACKGROUND_FLUSH a daemon thread writes the buffer to the
+daily rollup tables with one upsert per table every
+VIEW_COUNTER_FLUSH_SECONDS, or sooner once VIEW_COUNTER_MAX_PENDING distinct
+counters are buffered, so requests never wait on the upsert. Without it
+(as in tests) the buffer is flushed synchronously when a request finishes
+and a flush is due. Nothing is written at interpreter exit, so a stopped
+worker loses at most one interval of views.
+"""
+
+import logging
+import os
+import threading
+import time
+from collections import defaultdict
+
+from django.conf import settings
+from django.db import connection, connections, transaction
+from django.utils import timezone
+
+
+logger = logging.getLogger(__name__)
+
+# kind -> (rollup table, rollup column, target table, id type)
+VIEW_TARGETS = {
+    "startup": ("startup_daily_views", "startup_profile_id", "startup_profiles", "bigint"),
+    "project": ("project_daily_views", "project_id", "projects", "uuid"),
+}
+
+FLUSH_SQL = """
+INSERT INTO {table} ({column}, day, views)
+SELECT v.object_id, v.day, v.views
+FROM (VALUES {values}) AS v(object_id, day, views)
+JOIN {target} AS t ON t.id = v.object_id
+ON CONFLICT ({column}, day) DO UPDATE
+SET views = {table}.views + EXCLUDED.views
+"""
+
+
+def write_view_counts(counts):
+    """
+    Add ``{(kind, object_id, day): views}`` to the rollup tables. Views of
+    objects deleted in the meantime are dropped.
+    """
+    by_kind = defaultdict(list)
+    for (kind, object_id, day), views in counts.items():
+        by_kind[kind].append((object_id, day, views))
+
+    with transaction.atomic(), connection.cursor() as cursor:
+        for kind, rows in by_kind.items():
+            table, column, target, id_type = VIEW_TARGETS[kind]
+            values = ", ".join([f"(%s::{id_type}, %s::date, %s::bigint)"] * len(rows))
+            cursor.execute(
+                FLUSH_SQL.format(table=table, column=column, target=target, values=values),
+                [param for row in rows for param in row],
+            )
+
+
+class ViewCounter:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._pending = defaultdict(int)
+        self._wakeup = threading.Event()
+        self._flusher_lock = threading.Lock()
+        self._flusher = None
+        self._flusher_pid = None
+        self._last_flush = time.monotonic()
+
+    def record(self, kind, object_id):
+        if kind not in VIEW_TARGETS:
+            raise ValueError(f"Unknown view kind: {kind}")
+
+        max_pending = int(getattr(settings, "VIEW_COUNTER_MAX_PENDING", 1000))
+
+        with self._lock:
+            self._pending[(kind, str(object_id), timezone.localdate())] += 1
+            full = len(self._pending) >= max_pending
+
+        if getattr(settings, "VIEW_COUNTER_BACKGROUND_FLUSH", True):
+            self._ensure_flusher()
+            if full:
+                self._wakeup.set()
+
+    def flush_if_due(self):
+        """Flush when the interval has passed or too many counters are pending."""
+        with self._lock:
+            pending = len(self._pending)
+        if not pending:
+            return 0
+        due = (
+            pending >= int(getattr(settings, "VIEW_COUNTER_MAX_PENDING", 1000))
+            or time.monotonic() - self._last_flush >= float(getattr(settings, "VIEW_COUNTER_FLUSH_SECONDS", 30))
+        )
+        return self.flush() if due else 0
+
+    def _ensure_flusher(self):
+        # Threads do not survive fork(), so each worker process starts its own.
+        if self._flusher is not None and self._flusher_pid == os.getpid():
+            return
+
+        with self._flusher_lock:
+            if self._flusher is not None and self._flusher_pid == os.getpid():
+                return
+            self._flusher = threading.Thread(target=self._run, name="view-counter-flush", daemon=True)
+            self._flusher_pid = os.getpid()
+            self._flusher.start()
+
+    def _run(self):
+        while True:
+            self._wakeup.wait(float(getattr(settings, "VIEW_COUNTER_FLUSH_SECONDS", 30)))
+            self._wakeup.clear()
+            try:
+                self.flush()
+            finally:
+                connections.close_all()
+
+    def flush(self):
+        with self._lock:
+            pending, self._pending = self._pending, defaultdict(int)
+            self._last_flush = time.monotonic()
+
+        if not pending:
+            return 0
+
+        try:
+            write_view_counts(pending)
+        except Exception:
+            logger.exception("Failed to flush %s view counters", len(pending))
+            with self._lock:
+                for key, views in pending.items():
+                    self._pending[key] += views
+            return 0
+
+        return sum(pending.values())
+
+
+view_counter = ViewCounter()
+
+
+def record_view(kind, object_id):
+    view_counter.record(kind, object_id)
+
+
+def flush_view_counts():
+    return view_counter.flush()
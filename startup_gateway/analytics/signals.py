@@ -0,0 +1,25 @@
+from django.conf import settings
+from django.core.signals import request_finished
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import Signal, receiver
+
+from projects.models import Project
+from . import services
+from .funding import invalidate_funding
+
+
+# Sent after refresh_platform_stats rebuilt the platform_stats view.
+platform_stats_refreshed = Signal()
+
+
+@receiver(post_save, sender=Project)
+@receiver(post_delete, sender=Project)
+def invalidate_funding_on_project_change(sender, instance, **kwargs):
+    invalidate_funding(instance.startup_profile_id)
+
+
+@receiver(request_finished)
+def flush_view_counts_after_request(sender, **kwargs):
+    # The background thread owns flushing unless it is switched off.
+    if not getattr(settings, "VIEW_COUNTER_BACKGROUND_FLUSH", True):
+        services.view_counter.flush_if_due()
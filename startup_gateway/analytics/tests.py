@@ -0,0 +1,296 @@
+import tempfile
+import threading
+from datetime import timedelta
+from io import StringIO
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import override_settings
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APITestCase
+from rest_framework_simplejwt.tokens import AccessToken
+
+from dashboard.models import SavedStartup
+from investors.models import InvestorProfile
+from messages.models import Message
+from projects.models import Project, ProjectAudit
+from startups.models import StartupProfile
+
+from .funding import get_platform_funding, get_startup_funding
+from .models import ExchangeRate, ProjectDailyViews, StartupDailyStats, StartupDailyViews, StartupTrendingScore
+from .rollups import build_daily_rollups
+from .services import ViewCounter, flush_view_counts
+
+
+User = get_user_model()
+
+
+class ViewCounterTests(APITestCase):
+    def setUp(self):
+        flush_view_counts()
+        owner = User.objects.create_user(username="owner", email="owner@example.com")
+        self.startup = StartupProfile.objects.create(user=owner, company_name="Handmade Co")
+        self.project = Project.objects.create(
+            startup_profile=self.startup,
+            title="Chairs",
+            slug="chairs",
+            short_description="Short",
+            description="Long",
+            target_amount=1000,
+        )
+
+    @override_settings(VIEW_COUNTER_FLUSH_SECONDS=3600)
+    @patch("analytics.services.view_counter", ViewCounter())
+    def test_detail_views_buffered_until_flush(self):
+        for _ in range(3):
+            self.client.get(reverse("startup-detail", args=[self.startup.slug]))
+        self.client.get(reverse("projects:project-rud", args=[self.project.pk]))
+        self.assertFalse(StartupDailyViews.objects.exists())
+
+        self.assertEqual(flush_view_counts(), 4)
+
+        today = timezone.localdate()
+        self.assertEqual(StartupDailyViews.objects.get(startup_profile=self.startup, day=today).views, 3)
+        self.assertEqual(ProjectDailyViews.objects.get(project=self.project, day=today).views, 1)
+
+    @override_settings(VIEW_COUNTER_FLUSH_SECONDS=3600)
+    def test_flushes_are_added_to_the_daily_row(self):
+        counter = ViewCounter()
+        counter.record("project", self.project.pk)
+        counter.record("project", self.project.pk)
+        counter.flush()
+
+        counter.record("project", self.project.pk)
+        counter.flush()
+
+        self.assertEqual(ProjectDailyViews.objects.get().views, 3)
+
+    def assert_flushed_in_background(self, counter, write):
+        flushed = threading.Event()
+        threads = []
+
+        def record_write(counts):
+            threads.append(threading.current_thread().name)
+            flushed.set()
+
+        write.side_effect = record_write
+        counter.record("startup", self.startup.pk)
+        counter.record("project", self.project.pk)
+
+        self.assertTrue(flushed.wait(5))
+        self.assertEqual(threads, ["view-counter-flush"])
+        write.assert_called_once()
+        self.assertEqual(sum(write.call_args.args[0].values()), 2)
+
+    @override_settings(VIEW_COUNTER_BACKGROUND_FLUSH=True, VIEW_COUNTER_FLUSH_SECONDS=0.05)
+    @patch("analytics.services.write_view_counts")
+    def test_idle_counters_flushed_on_a_timer(self, write):
+        self.assert_flushed_in_background(ViewCounter(), write)
+
+    @override_settings(VIEW_COUNTER_BACKGROUND_FLUSH=True, VIEW_COUNTER_FLUSH_SECONDS=3600, VIEW_COUNTER_MAX_PENDING=2)
+    @patch("analytics.services.write_view_counts")
+    def test_flush_when_too_many_counters_pending(self, write):
+        self.assert_flushed_in_background(ViewCounter(), write)
+
+    @override_settings(VIEW_COUNTER_BACKGROUND_FLUSH=False, VIEW_COUNTER_FLUSH_SECONDS=0)
+    @patch("analytics.services.view_counter", ViewCounter())
+    def test_due_counters_flushed_when_request_finishes(self):
+        self.client.get(reverse("startup-detail", args=[self.startup.slug]))
+
+        self.assertEqual(StartupDailyViews.objects.get(startup_profile=self.startup).views, 1)
+
+    def test_views_of_deleted_objects_are_dropped(self):
+        counter = ViewCounter()
+        with override_settings(VIEW_COUNTER_FLUSH_SECONDS=3600):
+            counter.record("startup", 999999)
+            self.assertEqual(counter.flush(), 1)
+        self.assertFalse(StartupDailyViews.objects.exists())
+
+
+class TrendingScoreTests(APITestCase):
+    def setUp(self):
+        self.startups = []
+        for i in range(3):
+            owner = User.objects.create_user(username=f"owner{i}", email=f"owner{i}@example.com")
+            self.startups.append(StartupProfile.objects.create(user=owner, company_name=f"Startup {i}"))
+
+    def test_recent_signals_outrank_old_ones(self):
+        today = timezone.localdate()
+        StartupDailyViews.objects.create(startup_profile=self.startups[0], day=today, views=10)
+        StartupDailyViews.objects.create(startup_profile=self.startups[1], day=today - timedelta(days=9), views=10)
+        investor = InvestorProfile.objects.create(
+            user=User.objects.create_user(username="investor", email="investor@example.com"),
+            company_name="Fund",
+        )
+        SavedStartup.objects.create(investor_profile=investor, startup_profile=self.startups[0])
+
+        call_command("compute_trending_scores", stdout=StringIO())
+
+        scores = dict(StartupTrendingScore.objects.values_list("startup_profile_id", "score"))
+        self.assertGreater(scores[self.startups[0].pk], scores[self.startups[1].pk])
+        self.assertNotIn(self.startups[2].pk, scores)
+
+    def test_startups_without_recent_signals_lose_their_score(self):
+        StartupTrendingScore.objects.create(
+            startup_profile=self.startups[2], score=50, computed_at=timezone.now() - timedelta(days=1)
+        )
+
+        call_command("compute_trending_scores", stdout=StringIO())
+
+        self.assertFalse(StartupTrendingScore.objects.exists())
+
+
+class DailyRollupTests(APITestCase):
+    def setUp(self):
+        self.owner = User.objects.create_user(username="owner", email="owner@example.com")
+        self.startup = StartupProfile.objects.create(user=self.owner, company_name="Handmade Co")
+        self.project = Project.objects.create(
+            startup_profile=self.startup,
+            title="Chairs",
+            slug="chairs",
+            short_description="Short",
+            description="Long",
+            target_amount=1000,
+        )
+        self.investor_user = User.objects.create_user(username="investor", email="investor@example.com")
+        self.investor = InvestorProfile.objects.create(user=self.investor_user, company_name="Fund")
+
+    def roll_up(self):
+        return build_daily_rollups(now=timezone.now() + timedelta(minutes=20))
+
+    def test_sources_rolled_up_once(self):
+        today = timezone.localdate()
+        SavedStartup.objects.create(investor_profile=self.investor, startup_profile=self.startup)
+        Message.objects.create(sender=self.investor_user, receiver=self.owner, project=self.project, body="Hi")
+        Message.objects.create(sender=self.owner, receiver=self.investor_user, project=self.project, body="Hello")
+        self.project.raised_amount = 250
+        self.project.save()
+        StartupDailyViews.objects.create(startup_profile=self.startup, day=today, views=4)
+        ProjectDailyViews.objects.create(project=self.project, day=today, views=3)
+
+        self.roll_up()
+        self.roll_up()
+
+        stats = StartupDailyStats.objects.get(startup_profile=self.startup, day=today)
+        self.assertEqual(stats.saves, 1)
+        self.assertEqual(stats.messages_received, 1)
+        self.assertEqual(stats.raised_amount_change, 250)
+        self.assertEqual(stats.views, 7)
+
+        ProjectDailyViews.objects.filter(project=self.project).update(views=5)
+        self.roll_up()
+        stats.refresh_from_db()
+        self.assertEqual(stats.views, 9)
+        self.assertEqual(stats.saves, 1)
+
+    def test_recent_rows_wait_for_the_lag(self):
+        SavedStartup.objects.create(investor_profile=self.investor, startup_profile=self.startup)
+
+        build_daily_rollups(now=timezone.now() + timedelta(minutes=5))
+        self.assertFalse(StartupDailyStats.objects.filter(saves__gt=0).exists())
+
+        self.roll_up()
+        self.assertEqual(StartupDailyStats.objects.get(startup_profile=self.startup).saves, 1)
+
+    def test_raised_amount_changes_audited(self):
+        self.project.raised_amount = 300
+        self.project.save()
+        self.project.title = "Oak chairs"
+        self.project.save(update_fields=["title"])
+        self.project.raised_amount = 200
+        self.project.save(update_fields=["raised_amount"])
+
+        self.assertEqual(
+            list(ProjectAudit.objects.filter(project=self.project).order_by("pk").values_list("changes", flat=True)),
+            [{"raised_amount": ["0.00", "300.00"]}, {"raised_amount": ["300.00", "200.00"]}],
+        )
+
+    def test_owner_gets_dense_series(self):
+        StartupDailyStats.objects.create(startup_profile=self.startup, day=timezone.localdate(), views=10, saves=2)
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {AccessToken.for_user(self.owner)}")
+        url = reverse("analytics:startup-daily", args=[self.startup.pk])
+
+        resp = self.client.get(url, {"days": 90})
+
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(len(resp.data["series"]), 90)
+        self.assertEqual(resp.data["series"][-1]["views"], 10)
+        self.assertEqual(resp.data["totals"]["saves"], 2)
+        self.assertEqual(self.client.get(url, {"days": 7}).status_code, 400)
+
+    def test_non_owner_forbidden(self):
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {AccessToken.for_user(self.investor_user)}")
+        resp = self.client.get(reverse("analytics:startup-daily", args=[self.startup.pk]))
+        self.assertEqual(resp.status_code, 403)
+
+
+class FundingRollupTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        owner = User.objects.create_user(username="owner", email="owner@example.com")
+        self.startup = StartupProfile.objects.create(user=owner, company_name="Handmade Co")
+        ExchangeRate.objects.create(currency="USD", rate="40")
+
+    def make_project(self, slug, raised, target, currency):
+        with self.captureOnCommitCallbacks(execute=True):
+            return Project.objects.create(
+                startup_profile=self.startup,
+                title=slug,
+                slug=slug,
+                short_description="Short",
+                description="Long",
+                raised_amount=raised,
+                target_amount=target,
+                currency=currency,
+            )
+
+    def test_totals_converted_into_base_currency(self):
+        self.make_project("chairs", 1000, 4000, "UAH")
+        self.make_project("tables", 10, 100, "usd")
+        self.make_project("lamps", 5, 10, "EUR")
+
+        funding = get_startup_funding(self.startup.pk)
+
+        self.assertEqual(funding["currency"], "UAH")
+        self.assertEqual(funding["raised_amount"], "1400.00")
+        self.assertEqual(funding["target_amount"], "8000.00")
+        self.assertEqual(funding["progress"], 17.5)
+        self.assertEqual(funding["unconverted_currencies"], ["EUR"])
+        self.assertEqual(get_platform_funding()["raised_amount"], "1400.00")
+
+    def test_empty_totals_keep_two_decimals(self):
+        self.make_project("lamps", 5, 10, "EUR")
+
+        funding = get_startup_funding(self.startup.pk)
+
+        self.assertEqual(funding["raised_amount"], "0.00")
+        self.assertEqual(funding["target_amount"], "0.00")
+        self.assertEqual(funding["unconverted_currencies"], ["EUR"])
+
+    def test_cache_refreshed_when_raised_amount_changes(self):
+        project = self.make_project("chairs", 1000, 4000, "UAH")
+        self.assertEqual(get_startup_funding(self.startup.pk)["raised_amount"], "1000.00")
+
+        with self.assertNumQueries(0):
+            get_startup_funding(self.startup.pk)
+
+        project.raised_amount = 3000
+        with self.captureOnCommitCallbacks(execute=True):
+            project.save()
+
+        self.assertEqual(get_startup_funding(self.startup.pk)["raised_amount"], "3000.00")
+        resp = self.client.get(reverse("startup-detail", args=[self.startup.slug]))
+        self.assertEqual(resp.data["funding"]["raised_amount"], "3000.00")
+
+    def test_load_exchange_rates_from_csv(self):
+        self.make_project("tables", 10, 100, "EUR")
+        with tempfile.NamedTemporaryFile("w", suffix=".csv") as handle:
+            handle.write("currency,rate\nEUR,45.5\nusd,41\n")
+            handle.flush()
+            call_command("load_exchange_rates", handle.name, stdout=StringIO())
+
+        self.assertEqual(ExchangeRate.objects.get(currency="USD").rate, 41)
+        self.assertEqual(get_platform_funding()["raised_amount"], "455.00")
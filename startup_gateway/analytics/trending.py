@@ -0,0 +1,85 @@
+"""
+Trending score for startups.
+
+Every signal in the last TRENDING_WINDOW_DAYS (detail page views of the
+startup and its projects, saves by investors, project publishes and edits)
+is weighted and decayed exponentially with TRENDING_HALF_LIFE_DAYS, then
+summed per startup. The whole computation is one set-based statement.
+"""
+
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.utils import timezone
+
+
+VIEW_WEIGHT = 1.0
+SAVE_WEIGHT = 5.0
+ACTIVITY_WEIGHT = 3.0
+
+TRENDING_SQL = """
+WITH signals (startup_profile_id, weight, happened_at) AS (
+    SELECT startup_profile_id, %(view_weight)s * views, (day + interval '12 hours') AT TIME ZONE 'UTC'
+    FROM startup_daily_views
+    WHERE day >= %(since)s::date
+    UNION ALL
+    SELECT p.startup_profile_id, %(view_weight)s * v.views, (v.day + interval '12 hours') AT TIME ZONE 'UTC'
+    FROM project_daily_views AS v
+    JOIN projects AS p ON p.id = v.project_id
+    WHERE v.day >= %(since)s::date
+    UNION ALL
+    SELECT startup_profile_id, %(save_weight)s, created_at
+    FROM saved_startups
+    WHERE created_at >= %(since)s
+    UNION ALL
+    SELECT startup_profile_id, %(activity_weight)s, created_at
+    FROM projects
+    WHERE created_at >= %(since)s AND NOT is_deleted AND visibility = 'public'
+    UNION ALL
+    SELECT startup_profile_id, %(activity_weight)s, updated_at
+    FROM projects
+    WHERE updated_at >= %(since)s AND updated_at > created_at + interval '1 minute'
+      AND NOT is_deleted AND visibility = 'public'
+)
+INSERT INTO startup_trending_scores (startup_profile_id, score, computed_at)
+SELECT
+    startup_profile_id,
+    SUM(weight * exp(
+        -ln(2) * GREATEST(extract(epoch FROM %(now)s - happened_at), 0) / 86400.0 / %(half_life)s
+    )),
+    %(now)s
+FROM signals
+GROUP BY startup_profile_id
+ON CONFLICT (startup_profile_id) DO UPDATE
+SET score = EXCLUDED.score,
+    computed_at = EXCLUDED.computed_at
+"""
+
+
+@transaction.atomic
+def compute_trending_scores(now=None):
+    """
+    Recompute every startup's trending score. Startups with no signal in
+    the window lose their row. Returns the number of scored startups.
+    """
+    now = now or timezone.now()
+    window = int(getattr(settings, "TRENDING_WINDOW_DAYS", 14))
+    half_life = float(getattr(settings, "TRENDING_HALF_LIFE_DAYS", 3))
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            TRENDING_SQL,
+            {
+                "now": now,
+                "since": now - timedelta(days=window),
+                "half_life": half_life,
+                "view_weight": VIEW_WEIGHT,
+                "save_weight": SAVE_WEIGHT,
+                "activity_weight": ACTIVITY_WEIGHT,
+            },
+        )
+        scored = cursor.rowcount
+        cursor.execute("DELETE FROM startup_trending_scores WHERE computed_at < %s", [now])
+
+    return scored
@@ -0,0 +1,9 @@
+from django.urls import path
+
+from .views import StartupDailyStatsAPIView
+
+app_name = "analytics"
+
+urlpatterns = [
+    path("analytics/startups/<int:startup_id>/daily/", StartupDailyStatsAPIView.as_view(), name="startup-daily"),
+]
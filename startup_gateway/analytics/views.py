@@ -0,0 +1,56 @@
+from datetime import timedelta
+
+from django.utils import timezone
+from rest_framework.exceptions import PermissionDenied, ValidationError
+from rest_framework.generics import GenericAPIView
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+
+from projects.permissions import is_startup_owner
+from .models import StartupDailyStats
+
+
+SERIES_DAYS = (30, 90, 365)
+SERIES_FIELDS = ("views", "saves", "messages_received", "raised_amount_change")
+
+
+class StartupDailyStatsAPIView(GenericAPIView):
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request, startup_id):
+        if not is_startup_owner(request.user, startup_id):
+            raise PermissionDenied("Only the owner can view startup analytics.")
+
+        try:
+            days = int(request.query_params.get("days", SERIES_DAYS[0]))
+        except ValueError:
+            days = None
+        if days not in SERIES_DAYS:
+            raise ValidationError({"days": f"Must be one of {', '.join(map(str, SERIES_DAYS))}."})
+
+        today = timezone.localdate()
+        start = today - timedelta(days=days - 1)
+        rows = {
+            row["day"]: row
+            for row in StartupDailyStats.objects
+            .filter(startup_profile_id=startup_id, day__gte=start)
+            .values("day", *SERIES_FIELDS)
+        }
+
+        series = []
+        totals = dict.fromkeys(SERIES_FIELDS, 0)
+        for offset in range(days):
+            day = start + timedelta(days=offset)
+            row = rows.get(day, {})
+            point = {"day": day}
+            for field in SERIES_FIELDS:
+                value = row.get(field, 0)
+                point[field] = value
+                totals[field] += value
+            series.append(point)
+
+        totals["raised_amount_change"] = str(totals["raised_amount_change"])
+        for point in series:
+            point["raised_amount_change"] = str(point["raised_amount_change"])
+
+        return Response({"days": days, "totals": totals, "series": series})
@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+
+from dashboard.matching import refresh_investor_matches
+
+
+class Command(BaseCommand):
+    help = "Rescore startups for investors whose preferences or candidate startups changed."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=500)
+
+    def handle(self, *args, **options):
+        updated = refresh_investor_matches(batch_size=options["batch_size"])
+        self.stdout.write(self.style.SUCCESS(f"Updated matches for {updated} investors."))
@@ -0,0 +1,343 @@
+"""
+Investor -> startup matching.
+
+Each startup is reduced to features: the tags and statuses of its public
+projects, its regions and its projects' target amounts. Tags, regions and
+statuses are packed into integer bitsets. Startups with the same three
+bitsets form a group, and a full rescore computes the tag, region and status
+part once per group rather than once per startup. The ticket dimension is
+one bisected slice of all project targets, sorted. Only startups with a
+public project are matched.
+
+A startup's score is the weighted share of the investor's preference
+dimensions it satisfies:
+
+- tags: fraction of the preferred tags the startup has,
+- regions: 1 if it operates in any preferred region,
+- statuses: 1 if any public project has a preferred status,
+- ticket: 1 if any project's target fits the investor's ticket range.
+
+Dimensions the investor left empty are ignored. The top
+INVESTOR_MATCHES_TOP_N startups are stored per investor.
+"""
+
+import heapq
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass
+
+from django.conf import settings
+from django.contrib.postgres.expressions import ArraySubquery
+from django.db import transaction
+from django.db.models import Exists, OuterRef
+from django.utils import timezone
+
+from investors.models import InvestorProfile
+from projects.models import Project, ProjectVisibility, Tag
+from startups.models import Region, StartupProfile
+from .models import InvestorMatch, StartupMatchFeatures
+
+
+WEIGHTS = {"tags": 0.4, "regions": 0.2, "statuses": 0.2, "ticket": 0.2}
+
+
+@dataclass(frozen=True)
+class Features:
+    tag_ids: tuple
+    region_ids: tuple
+    statuses: tuple
+    targets: tuple
+
+    def as_row(self, startup_profile_id):
+        return StartupMatchFeatures(
+            startup_profile_id=startup_profile_id,
+            tag_ids=list(self.tag_ids),
+            region_ids=list(self.region_ids),
+            statuses=list(self.statuses),
+            targets=list(self.targets),
+        )
+
+
+def load_startup_features():
+    """
+    Return ``{startup_profile_id: Features}`` for every startup with a
+    public project, in one query.
+    """
+    public_projects = Project.objects.filter(
+        startup_profile_id=OuterRef("pk"),
+        visibility=ProjectVisibility.PUBLIC,
+        is_deleted=False,
+    )
+    tags = (
+        Tag.objects
+        .filter(
+            projects__startup_profile_id=OuterRef("pk"),
+            projects__visibility=ProjectVisibility.PUBLIC,
+            projects__is_deleted=False,
+        )
+        .order_by("pk")
+        .values("pk")
+        .distinct()
+    )
+    regions = Region.objects.filter(startups=OuterRef("pk")).order_by("pk").values("pk")
+
+    rows = StartupProfile.objects.filter(Exists(public_projects)).annotate(
+        feature_tags=ArraySubquery(tags),
+        feature_regions=ArraySubquery(regions),
+        feature_statuses=ArraySubquery(public_projects.order_by("status").values("status").distinct()),
+        feature_targets=ArraySubquery(public_projects.order_by("target_amount").values("target_amount")),
+    ).values_list("pk", "feature_tags", "feature_regions", "feature_statuses", "feature_targets")
+
+    return {
+        pk: Features(tuple(tags), tuple(regions), tuple(statuses), tuple(float(t) for t in targets))
+        for pk, tags, regions, statuses, targets in rows
+    }
+
+
+class BitIndex:
+    """Assigns each distinct key a bit position."""
+
+    def __init__(self):
+        self.bits = {}
+
+    def mask(self, keys):
+        mask = 0
+        for key in keys:
+            mask |= 1 << self.bits.setdefault(key, len(self.bits))
+        return mask
+
+
+class Matcher:
+    def __init__(self, features):
+        self.tags = BitIndex()
+        self.regions = BitIndex()
+        self.statuses = BitIndex()
+        self.vectors = {
+            startup_id: (
+                self.tags.mask(f.tag_ids),
+                self.regions.mask(f.region_ids),
+                self.statuses.mask(f.statuses),
+                f.targets,
+            )
+            for startup_id, f in features.items()
+        }
+
+        # Startups sharing tag, region and status masks share that part of
+        # the score, so top() scores each distinct mask once per investor.
+        self.group_of = {startup_id: vector[:3] for startup_id, vector in self.vectors.items()}
+        self.groups = {}
+        for startup_id, masks in self.group_of.items():
+            self.groups.setdefault(masks, []).append(startup_id)
+        for members in self.groups.values():
+            members.sort(reverse=True)
+
+        # Every (target, startup_id), sorted, so a ticket range is one slice.
+        self.targets = sorted(
+            (target, startup_id) for startup_id, vector in self.vectors.items() for target in vector[3]
+        )
+
+    def preferences(self, investor):
+        """Pack an investor's preferences into the same bit positions."""
+        tag_mask = self.tags.mask(investor["tag_ids"])
+        has_ticket = investor["min_ticket"] is not None or investor["max_ticket"] is not None
+        return {
+            "tags": tag_mask,
+            "tag_count": tag_mask.bit_count(),
+            "regions": self.regions.mask(investor["region_ids"]),
+            "statuses": self.statuses.mask(investor["preferred_statuses"]),
+            "ticket": (
+                (
+                    float(investor["min_ticket"] or 0),
+                    float(investor["max_ticket"]) if investor["max_ticket"] is not None else float("inf"),
+                )
+                if has_ticket
+                else None
+            ),
+        }
+
+    def total_weight(self, prefs):
+        total = 0.0
+        if prefs["tag_count"]:
+            total += WEIGHTS["tags"]
+        if prefs["regions"]:
+            total += WEIGHTS["regions"]
+        if prefs["statuses"]:
+            total += WEIGHTS["statuses"]
+        if prefs["ticket"] is not None:
+            total += WEIGHTS["ticket"]
+        return total
+
+    def mask_score(self, prefs, masks):
+        """The weighted tag, region and status part of a score."""
+        tag_mask, region_mask, status_mask = masks
+        score = 0.0
+        if prefs["tag_count"]:
+            score += WEIGHTS["tags"] * (tag_mask & prefs["tags"]).bit_count() / prefs["tag_count"]
+        if prefs["regions"]:
+            score += WEIGHTS["regions"] * bool(region_mask & prefs["regions"])
+        if prefs["statuses"]:
+            score += WEIGHTS["statuses"] * bool(status_mask & prefs["statuses"])
+        return score
+
+    def score(self, prefs, startup_id):
+        total = self.total_weight(prefs)
+        if not total:
+            return 0.0
+
+        score = self.mask_score(prefs, self.group_of[startup_id])
+        if prefs["ticket"] is not None:
+            low, high = prefs["ticket"]
+            targets = self.vectors[startup_id][3]
+            i = bisect_left(targets, low)
+            score += WEIGHTS["ticket"] * (i < len(targets) and targets[i] <= high)
+        return score / total
+
+    def top(self, prefs, top_n):
+        """
+        The ``top_n`` best ``(score, startup_id)`` pairs. Each distinct mask
+        is scored once; startups in the ticket range come from one slice of
+        the sorted targets, the rest from the best groups down until the
+        top N can no longer change.
+        """
+        total = self.total_weight(prefs)
+        if not total:
+            return []
+
+        group_scores = {masks: self.mask_score(prefs, masks) for masks in self.groups}
+
+        in_range = set()
+        if prefs["ticket"] is not None:
+            low, high = prefs["ticket"]
+            start = bisect_left(self.targets, (low,))
+            end = bisect_right(self.targets, (high, float("inf")))
+            in_range = {startup_id for _, startup_id in self.targets[start:end]}
+
+        candidates = [
+            ((group_scores[self.group_of[startup_id]] + WEIGHTS["ticket"]) / total, startup_id)
+            for startup_id in in_range
+        ]
+        taken, last = 0, None
+        for masks, mask_score in sorted(group_scores.items(), key=lambda item: item[1], reverse=True):
+            if mask_score <= 0 or (taken >= top_n and mask_score < last):
+                break
+            for startup_id in self.groups[masks]:
+                if startup_id not in in_range:
+                    candidates.append((mask_score / total, startup_id))
+                    taken += 1
+            last = mask_score
+
+        return heapq.nlargest(top_n, (pair for pair in candidates if pair[0] > 0))
+
+
+def _load_investors(investor_ids=None):
+    investors = InvestorProfile.objects.annotate(
+        tag_ids=ArraySubquery(
+            InvestorProfile.preferred_tags.through.objects
+            .filter(investorprofile_id=OuterRef("pk"))
+            .values("tag_id")
+        ),
+        region_ids=ArraySubquery(
+            InvestorProfile.preferred_regions.through.objects
+            .filter(investorprofile_id=OuterRef("pk"))
+            .values("region_id")
+        ),
+    )
+    if investor_ids is not None:
+        investors = investors.filter(pk__in=investor_ids)
+    return investors.values(
+        "pk",
+        "tag_ids",
+        "region_ids",
+        "preferred_statuses",
+        "min_ticket",
+        "max_ticket",
+        "preferences_updated_at",
+        "matches_computed_at",
+    )
+
+
+def refresh_investor_matches(investor_ids=None, batch_size=500):
+    """
+    Bring stored matches up to date.
+
+    With ``investor_ids`` those investors are rescored against every
+    startup. Otherwise startup features are diffed against the last run;
+    investors whose preferences changed are rescored in full, the rest
+    only rescore the changed startups and merge them into their stored
+    top N. If a stored match got worse or disappeared, that investor is
+    rescored in full. Returns the number of investors updated.
+    """
+    top_n = int(getattr(settings, "INVESTOR_MATCHES_TOP_N", 20))
+    now = timezone.now()
+    features = load_startup_features()
+    matcher = Matcher(features)
+
+    if investor_ids is None:
+        stored = {
+            row.startup_profile_id: Features(
+                tuple(row.tag_ids), tuple(row.region_ids), tuple(row.statuses), tuple(row.targets)
+            )
+            for row in StartupMatchFeatures.objects.all()
+        }
+        changed = {pk for pk, f in features.items() if stored.get(pk) != f}
+        removed = set(stored) - set(features)
+    else:
+        changed, removed = set(), set()
+
+    investors = list(_load_investors(investor_ids))
+    existing = {}
+    for match in InvestorMatch.objects.filter(
+        investor_profile_id__in=[investor["pk"] for investor in investors]
+    ).values("investor_profile_id", "startup_profile_id", "score"):
+        existing.setdefault(match["investor_profile_id"], {})[match["startup_profile_id"]] = match["score"]
+
+    results = {}
+    for investor in investors:
+        prefs = matcher.preferences(investor)
+        full = (
+            investor_ids is not None
+            or investor["matches_computed_at"] is None
+            or (
+                investor["preferences_updated_at"] is not None
+                and investor["preferences_updated_at"] > investor["matches_computed_at"]
+            )
+        )
+        current = existing.get(investor["pk"], {})
+
+        if not full:
+            if not (changed or removed):
+                continue
+            rescored = {pk: matcher.score(prefs, pk) for pk in changed}
+            if any(pk in removed or rescored.get(pk, score) < score for pk, score in current.items()):
+                full = True
+            else:
+                merged = {**current, **rescored}
+                results[investor["pk"]] = heapq.nlargest(
+                    top_n, ((score, pk) for pk, score in merged.items() if score > 0)
+                )
+
+        if full:
+            results[investor["pk"]] = matcher.top(prefs, top_n)
+
+    investor_pks = list(results)
+    for start in range(0, len(investor_pks), batch_size):
+        batch = investor_pks[start:start + batch_size]
+        with transaction.atomic():
+            InvestorMatch.objects.filter(investor_profile_id__in=batch).delete()
+            InvestorMatch.objects.bulk_create([
+                InvestorMatch(investor_profile_id=pk, startup_profile_id=startup_id, score=score, rank=rank)
+                for pk in batch
+                for rank, (score, startup_id) in enumerate(results[pk], start=1)
+            ])
+            InvestorProfile.objects.filter(pk__in=batch).update(matches_computed_at=now)
+
+    if investor_ids is None:
+        with transaction.atomic():
+            StartupMatchFeatures.objects.filter(startup_profile_id__in=removed).delete()
+            StartupMatchFeatures.objects.bulk_create(
+                [features[pk].as_row(pk) for pk in changed],
+                update_conflicts=True,
+                unique_fields=["startup_profile"],
+                update_fields=["tag_ids", "region_ids", "statuses", "targets", "updated_at"],
+            )
+
+    return len(results)
@@ -0,0 +1,45 @@
+# Generated by Django 5.2.10 on 2026-10-19 11:19
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dashboard', '0001_initial'),
+        ('investors', '0002_investor_preferences'),
+        ('startups', '0003_region_startupprofile_region'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='StartupMatchFeatures',
+            fields=[
+                ('startup_profile', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='match_features', serialize=False, to='startups.startupprofile')),
+                ('tag_ids', models.JSONField(default=list)),
+                ('region_ids', models.JSONField(default=list)),
+                ('statuses', models.JSONField(default=list)),
+                ('targets', models.JSONField(default=list)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'db_table': 'startup_match_features',
+            },
+        ),
+        migrations.CreateModel(
+            name='InvestorMatch',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('score', models.FloatField()),
+                ('rank', models.PositiveSmallIntegerField()),
+                ('investor_profile', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='matches', to='investors.investorprofile')),
+                ('startup_profile', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='investor_matches', to='startups.startupprofile')),
+            ],
+            options={
+                'db_table': 'investor_matches',
+                'indexes': [models.Index(fields=['investor_profile', 'rank'], name='investor_ma_investo_db13b2_idx')],
+                'constraints': [models.UniqueConstraint(fields=('investor_profile', 'startup_profile'), name='unique_investor_match')],
+            },
+        ),
+    ]
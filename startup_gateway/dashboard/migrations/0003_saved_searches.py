@@ -0,0 +1,66 @@
+# Generated by Django 5.2.10 on 2026-10-19 11:22
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dashboard', '0002_investor_matches'),
+        ('investors', '0002_investor_preferences'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SavedSearch',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=100)),
+                ('search', models.CharField(blank=True, max_length=255)),
+                ('tag_ids', models.JSONField(blank=True, default=list)),
+                ('region_ids', models.JSONField(blank=True, default=list)),
+                ('statuses', models.JSONField(blank=True, default=list)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('investor_profile', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='saved_searches', to='investors.investorprofile')),
+            ],
+            options={
+                'db_table': 'saved_searches',
+            },
+        ),
+        migrations.CreateModel(
+            name='SavedSearchHit',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('subject_key', models.CharField(max_length=100)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('saved_search', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='hits', to='dashboard.savedsearch')),
+            ],
+            options={
+                'db_table': 'saved_search_hits',
+            },
+        ),
+        migrations.CreateModel(
+            name='SavedSearchKey',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('key', models.CharField(max_length=50)),
+                ('saved_search', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='keys', to='dashboard.savedsearch')),
+            ],
+            options={
+                'db_table': 'saved_search_keys',
+            },
+        ),
+        migrations.AddIndex(
+            model_name='savedsearch',
+            index=models.Index(fields=['investor_profile', '-created_at'], name='saved_searc_investo_a7cabd_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='savedsearchhit',
+            constraint=models.UniqueConstraint(fields=('saved_search', 'subject_key'), name='unique_saved_search_hit'),
+        ),
+        migrations.AddConstraint(
+            model_name='savedsearchkey',
+            constraint=models.UniqueConstraint(fields=('key', 'saved_search'), name='unique_saved_search_key'),
+        ),
+    ]
@@ -19,4 +19,129 @@ class SavedStartup(models.Model):
         unique_together = ('investor_profile', 'startup_profile')
 
     def __str__(self):
-        return f'{self.investor_profile} saved {self.startup_profile}'
\ No newline at end of file
+        return f'{self.investor_profile} saved {self.startup_profile}'
+
+class StartupMatchFeatures(models.Model):
+    """
+    The features of a startup the matching engine last scored, kept so a
+    refresh only rescores startups whose features changed.
+    """
+
+    startup_profile = models.OneToOneField(
+        'startups.StartupProfile',
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='match_features'
+    )
+    tag_ids = models.JSONField(default=list)
+    region_ids = models.JSONField(default=list)
+    statuses = models.JSONField(default=list)
+    targets = models.JSONField(default=list)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = 'startup_match_features'
+
+
+class InvestorMatch(models.Model):
+    investor_profile = models.ForeignKey(
+        'investors.InvestorProfile',
+        on_delete=models.CASCADE,
+        related_name='matches'
+    )
+    startup_profile = models.ForeignKey(
+        'startups.StartupProfile',
+        on_delete=models.CASCADE,
+        related_name='investor_matches'
+    )
+    score = models.FloatField()
+    rank = models.PositiveSmallIntegerField()
+
+    class Meta:
+        db_table = 'investor_matches'
+        constraints = [
+            models.UniqueConstraint(
+                fields=['investor_profile', 'startup_profile'],
+                name='unique_investor_match'
+            ),
+        ]
+        indexes = [
+            models.Index(fields=['investor_profile', 'rank']),
+        ]
+
+    def __str__(self):
+        return f'{self.startup_profile} for {self.investor_profile}: {self.score:.2f}'
+
+
+class SavedSearch(models.Model):
+    """
+    A directory query an investor wants alerts for. Empty criteria match
+    anything; a startup or project matches when every non-empty criterion
+    does (any of the tags, any of the regions, any of the statuses, and
+    the search text).
+    """
+
+    investor_profile = models.ForeignKey(
+        'investors.InvestorProfile',
+        on_delete=models.CASCADE,
+        related_name='saved_searches'
+    )
+    name = models.CharField(max_length=100)
+    search = models.CharField(max_length=255, blank=True)
+    tag_ids = models.JSONField(default=list, blank=True)
+    region_ids = models.JSONField(default=list, blank=True)
+    statuses = models.JSONField(default=list, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        db_table = 'saved_searches'
+        indexes = [
+            models.Index(fields=['investor_profile', '-created_at']),
+        ]
+
+    def __str__(self):
+        return f'{self.name} ({self.investor_profile})'
+
+
+class SavedSearchKey(models.Model):
+    """
+    Reverse index for percolation: the keys under which a saved search is
+    a candidate ("tag:<id>", "region:<id>" or "any").
+    """
+
+    saved_search = models.ForeignKey(
+        SavedSearch,
+        on_delete=models.CASCADE,
+        related_name='keys'
+    )
+    key = models.CharField(max_length=50)
+
+    class Meta:
+        db_table = 'saved_search_keys'
+        constraints = [
+            models.UniqueConstraint(
+                fields=['key', 'saved_search'],
+                name='unique_saved_search_key'
+            ),
+        ]
+
+
+class SavedSearchHit(models.Model):
+    """A subject a saved search already alerted on, so it alerts only once."""
+
+    saved_search = models.ForeignKey(
+        SavedSearch,
+        on_delete=models.CASCADE,
+        related_name='hits'
+    )
+    subject_key = models.CharField(max_length=100)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        db_table = 'saved_search_hits'
+        constraints = [
+            models.UniqueConstraint(
+                fields=['saved_search', 'subject_key'],
+                name='unique_saved_search_hit'
+            ),
+        ]
@@ -0,0 +1,8 @@
+from rest_framework.pagination import CursorPagination
+
+
+class SavedStartupPagination(CursorPagination):
+    page_size = 20
+    page_size_query_param = "page_size"
+    max_page_size = 50
+    ordering = "-created_at"
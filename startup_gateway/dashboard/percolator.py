@@ -0,0 +1,249 @@
+"""
+Saved-search alerts by percolation.
+
+Instead of re-running every saved search after each write, each search is
+indexed under the keys it can possibly match: its tags if it has any,
+else its regions, else "any". A new or changed startup or project looks up
+only the searches indexed under its own tag and region keys (plus "any"),
+evaluates those candidates in batches and notifies the owners of searches
+it matches for the first time.
+
+Writes only queue the changed subjects; each transaction's queue is
+deduplicated and percolated after commit on a small background pool (or
+inline when SAVED_SEARCH_PERCOLATION_WORKERS is 0).
+"""
+
+import logging
+import threading
+from dataclasses import dataclass
+
+from django.conf import settings
+from django.db import connection, connections, transaction
+
+from notifications.models import Notification
+from notifications.services import create_notifications
+from projects.models import Project, ProjectVisibility
+from startup_gateway.executors import executor_workers, get_executor
+from startups.models import StartupProfile
+from .models import SavedSearch, SavedSearchKey
+
+
+logger = logging.getLogger(__name__)
+
+SEARCH_MATCH_TYPE = "saved_search_match"
+
+_pending = threading.local()
+
+HITS_SQL = """
+INSERT INTO saved_search_hits (saved_search_id, subject_key, created_at)
+SELECT saved_search_id, %s, NOW()
+FROM unnest(%s::bigint[]) AS saved_search_id
+ON CONFLICT (saved_search_id, subject_key) DO NOTHING
+RETURNING saved_search_id
+"""
+
+
+@dataclass(frozen=True)
+class Subject:
+    kind: str
+    id: str
+    title: str
+    tag_ids: frozenset
+    region_ids: frozenset
+    statuses: frozenset
+    text: str
+
+    @property
+    def key(self):
+        return f"{self.kind}:{self.id}"
+
+    def index_keys(self):
+        return (
+            ["any"]
+            + [f"tag:{tag_id}" for tag_id in self.tag_ids]
+            + [f"region:{region_id}" for region_id in self.region_ids]
+        )
+
+
+def search_keys(search):
+    if search.tag_ids:
+        return [f"tag:{tag_id}" for tag_id in search.tag_ids]
+    if search.region_ids:
+        return [f"region:{region_id}" for region_id in search.region_ids]
+    return ["any"]
+
+
+@transaction.atomic
+def save_search(search):
+    """Save a search and re-index it under its percolation keys."""
+    search.save()
+    SavedSearchKey.objects.filter(saved_search=search).delete()
+    SavedSearchKey.objects.bulk_create(
+        [SavedSearchKey(saved_search=search, key=key) for key in set(search_keys(search))]
+    )
+    return search
+
+
+def matches(search, subject):
+    return (
+        (not search["tag_ids"] or not subject.tag_ids.isdisjoint(search["tag_ids"]))
+        and (not search["region_ids"] or not subject.region_ids.isdisjoint(search["region_ids"]))
+        and (not search["statuses"] or not subject.statuses.isdisjoint(search["statuses"]))
+        and (not search["search"] or search["search"].lower() in subject.text)
+    )
+
+
+def project_subject(project_id):
+    project = (
+        Project.objects
+        .filter(pk=project_id, is_deleted=False, visibility=ProjectVisibility.PUBLIC)
+        .select_related("startup_profile")
+        .prefetch_related("tags", "startup_profile__region")
+        .first()
+    )
+    if project is None:
+        return None
+
+    return Subject(
+        kind="project",
+        id=str(project.pk),
+        title=project.title,
+        tag_ids=frozenset(tag.pk for tag in project.tags.all()),
+        region_ids=frozenset(region.pk for region in project.startup_profile.region.all()),
+        statuses=frozenset([project.status]),
+        text=f"{project.title} {project.startup_profile.company_name}".lower(),
+    )
+
+
+def startup_subject(startup_profile_id):
+    startup = StartupProfile.objects.filter(pk=startup_profile_id).prefetch_related("region").first()
+    if startup is None:
+        return None
+
+    projects = Project.objects.filter(
+        startup_profile_id=startup.pk,
+        is_deleted=False,
+        visibility=ProjectVisibility.PUBLIC,
+    )
+    return Subject(
+        kind="startup",
+        id=str(startup.pk),
+        title=startup.company_name,
+        tag_ids=frozenset(projects.filter(tags__isnull=False).values_list("tags", flat=True)),
+        region_ids=frozenset(region.pk for region in startup.region.all()),
+        statuses=frozenset(projects.values_list("status", flat=True)),
+        text=startup.company_name.lower(),
+    )
+
+
+def percolate(subject, batch_size=None):
+    """
+    Notify owners of saved searches that ``subject`` matches for the first
+    time. Returns the number of notifications created.
+    """
+    batch_size = batch_size or int(getattr(settings, "SAVED_SEARCH_BATCH_SIZE", 500))
+    candidate_ids = list(
+        SavedSearchKey.objects
+        .filter(key__in=subject.index_keys())
+        .order_by("saved_search_id")
+        .values_list("saved_search_id", flat=True)
+        .distinct()
+    )
+
+    notified = 0
+    for start in range(0, len(candidate_ids), batch_size):
+        searches = SavedSearch.objects.filter(pk__in=candidate_ids[start:start + batch_size]).values(
+            "pk", "name", "search", "tag_ids", "region_ids", "statuses", "investor_profile__user_id"
+        )
+        matched = {search["pk"]: search for search in searches if matches(search, subject)}
+        if matched:
+            notified += _notify_new_hits(subject, matched)
+    return notified
+
+
+@transaction.atomic
+def _notify_new_hits(subject, matched):
+    with connection.cursor() as cursor:
+        cursor.execute(HITS_SQL, [subject.key, list(matched)])
+        new_ids = [row[0] for row in cursor.fetchall()]
+
+    create_notifications(
+        [
+            Notification(
+                user_id=matched[search_id]["investor_profile__user_id"],
+                type=SEARCH_MATCH_TYPE,
+                subject_key=f"saved_search:{search_id}",
+                payload={
+                    "saved_search_id": search_id,
+                    "saved_search_name": matched[search_id]["name"],
+                    "subject": {"type": subject.kind, "id": subject.id, "title": subject.title},
+                },
+            )
+            for search_id in new_ids
+        ],
+        coalesce=True,
+    )
+    return len(new_ids)
+
+
+def percolate_project(project_id):
+    subject = project_subject(project_id)
+    return percolate(subject) if subject is not None else 0
+
+
+def percolate_startup(startup_profile_id):
+    subject = startup_subject(startup_profile_id)
+    return percolate(subject) if subject is not None else 0
+
+
+PERCOLATORS = {"project": percolate_project, "startup": percolate_startup}
+
+
+def schedule_percolation(kind, object_id):
+    """
+    Queue a subject for percolation once the current transaction commits.
+    A subject queued several times in one transaction is percolated once.
+    """
+    subjects = getattr(_pending, "subjects", None)
+    if subjects is None:
+        subjects = _pending.subjects = set()
+    subjects.add((kind, object_id))
+
+    # Every call registers a flush, since a rollback silently drops earlier
+    # ones. The first flush to run after commit drains the whole set and the
+    # rest find it empty. Subjects left over from a rolled-back transaction
+    # are harmlessly percolated with the next one.
+    transaction.on_commit(_flush_pending)
+
+
+def _flush_pending():
+    subjects = sorted(getattr(_pending, "subjects", None) or ())
+    _pending.subjects = set()
+    if subjects:
+        dispatch_percolation(subjects)
+
+
+def dispatch_percolation(subjects):
+    if executor_workers("SAVED_SEARCH_PERCOLATION_WORKERS", 0) <= 0:
+        return run_percolation(subjects)
+
+    executor = get_executor("saved-search-percolation", "SAVED_SEARCH_PERCOLATION_WORKERS", 0)
+    executor.submit(_run_percolation_in_thread, subjects)
+    return None
+
+
+def _run_percolation_in_thread(subjects):
+    try:
+        run_percolation(subjects)
+    finally:
+        connections.close_all()
+
+
+def run_percolation(subjects):
+    notified = 0
+    for kind, object_id in subjects:
+        try:
+            notified += PERCOLATORS[kind](object_id)
+        except Exception:
+            logger.exception("Saved-search percolation for %s:%s failed", kind, object_id)
+    return notified
@@ -0,0 +1,125 @@
+from rest_framework import serializers
+
+from investors.models import InvestorProfile
+from projects.models import ProjectStatus, Tag
+from startups.models import Region, StartupProfile
+from .models import InvestorMatch, SavedSearch, SavedStartup
+
+
+def startup_summary(startup):
+    return {
+        "id": startup.pk,
+        "company_name": startup.company_name,
+        "slug": startup.slug,
+        "short_pitch": startup.short_pitch,
+        "logo_url": startup.logo_url,
+    }
+
+
+class SavedStartupSerializer(serializers.ModelSerializer):
+    startup = serializers.SerializerMethodField()
+    tags = serializers.ListField(source="tag_names", child=serializers.CharField(), read_only=True)
+    regions = serializers.ListField(source="region_names", child=serializers.CharField(), read_only=True)
+    latest_project = serializers.SerializerMethodField()
+
+    class Meta:
+        model = SavedStartup
+        fields = ["id", "startup", "tags", "regions", "latest_project", "created_at"]
+        read_only_fields = fields
+
+    def get_startup(self, obj):
+        return startup_summary(obj.startup_profile)
+
+    def get_latest_project(self, obj):
+        if obj.latest_project_id is None:
+            return None
+
+        target = obj.latest_project_target
+        raised = obj.latest_project_raised
+        return {
+            "id": str(obj.latest_project_id),
+            "title": obj.latest_project_title,
+            "status": obj.latest_project_status,
+            "target_amount": str(target),
+            "raised_amount": str(raised),
+            "currency": obj.latest_project_currency,
+            "funding_progress": round(float(raised / target * 100), 1) if target else None,
+        }
+
+
+class SaveStartupSerializer(serializers.Serializer):
+    startup_profile_id = serializers.PrimaryKeyRelatedField(
+        queryset=StartupProfile.objects.all(),
+        source="startup_profile",
+    )
+
+
+class InvestorPreferencesSerializer(serializers.ModelSerializer):
+    preferred_tags = serializers.PrimaryKeyRelatedField(queryset=Tag.objects.all(), many=True, required=False)
+    preferred_regions = serializers.PrimaryKeyRelatedField(queryset=Region.objects.all(), many=True, required=False)
+    preferred_statuses = serializers.ListField(
+        child=serializers.ChoiceField(choices=ProjectStatus.choices),
+        required=False,
+    )
+
+    class Meta:
+        model = InvestorProfile
+        fields = [
+            "preferred_tags",
+            "preferred_regions",
+            "preferred_statuses",
+            "min_ticket",
+            "max_ticket",
+            "preferences_updated_at",
+        ]
+        read_only_fields = ["preferences_updated_at"]
+
+    def validate(self, attrs):
+        min_ticket = attrs.get("min_ticket", getattr(self.instance, "min_ticket", None))
+        max_ticket = attrs.get("max_ticket", getattr(self.instance, "max_ticket", None))
+        if min_ticket is not None and max_ticket is not None and min_ticket > max_ticket:
+            raise serializers.ValidationError({"max_ticket": "Must not be less than min_ticket."})
+        return attrs
+
+
+class InvestorMatchSerializer(serializers.ModelSerializer):
+    startup = serializers.SerializerMethodField()
+
+    class Meta:
+        model = InvestorMatch
+        fields = ["rank", "score", "startup"]
+        read_only_fields = fields
+
+    def get_startup(self, obj):
+        return startup_summary(obj.startup_profile)
+
+
+class SavedSearchSerializer(serializers.ModelSerializer):
+    tag_ids = serializers.ListField(child=serializers.IntegerField(), required=False)
+    region_ids = serializers.ListField(child=serializers.IntegerField(), required=False)
+    statuses = serializers.ListField(
+        child=serializers.ChoiceField(choices=ProjectStatus.choices),
+        required=False,
+    )
+
+    class Meta:
+        model = SavedSearch
+        fields = ["id", "name", "search", "tag_ids", "region_ids", "statuses", "created_at"]
+        read_only_fields = ["id", "created_at"]
+
+    def validate_tag_ids(self, value):
+        value = sorted(set(value))
+        if Tag.objects.filter(pk__in=value).count() != len(value):
+            raise serializers.ValidationError("Unknown tag.")
+        return value
+
+    def validate_region_ids(self, value):
+        value = sorted(set(value))
+        if Region.objects.filter(pk__in=value).count() != len(value):
+            raise serializers.ValidationError("Unknown region.")
+        return value
+
+    def validate(self, attrs):
+        if "search" in attrs:
+            attrs["search"] = attrs["search"].strip()
+        return attrs
@@ -0,0 +1,83 @@
+from django.contrib.postgres.expressions import ArraySubquery
+from django.db import connection
+from django.db.models import OuterRef, Subquery
+
+from projects.models import Project, ProjectVisibility, Tag
+from startups.models import Region
+from users.utils import cached_profile_id
+from .models import SavedStartup
+
+
+SAVE_STARTUP_SQL = """
+INSERT INTO saved_startups (investor_profile_id, startup_profile_id, created_at)
+VALUES (%s, %s, NOW())
+ON CONFLICT (investor_profile_id, startup_profile_id) DO NOTHING
+RETURNING id
+"""
+
+
+def get_investor_profile_id(user):
+    return cached_profile_id(user, "investor")
+
+
+def save_startup(investor_profile_id, startup_profile_id):
+    """Save a startup for an investor. Returns False if it was already saved."""
+    with connection.cursor() as cursor:
+        cursor.execute(SAVE_STARTUP_SQL, [investor_profile_id, startup_profile_id])
+        return cursor.fetchone() is not None
+
+
+def unsave_startup(investor_profile_id, startup_profile_id):
+    """Remove a saved startup. Returns False if it was not saved."""
+    deleted, _ = SavedStartup.objects.filter(
+        investor_profile_id=investor_profile_id,
+        startup_profile_id=startup_profile_id,
+    ).delete()
+    return deleted > 0
+
+
+def saved_startups_overview(investor_profile_id):
+    """
+    The investor's saved startups with tags, regions and the latest public
+    project annotated onto each row, so a page is fetched in one query.
+    """
+    public_projects = Project.objects.filter(
+        startup_profile_id=OuterRef("startup_profile_id"),
+        visibility=ProjectVisibility.PUBLIC,
+        is_deleted=False,
+    )
+    latest_project = public_projects.order_by("-created_at")
+
+    tags = (
+        Tag.objects
+        .filter(
+            projects__startup_profile_id=OuterRef("startup_profile_id"),
+            projects__visibility=ProjectVisibility.PUBLIC,
+            projects__is_deleted=False,
+        )
+        .order_by("name")
+        .values("name")
+        .distinct()
+    )
+    regions = (
+        Region.objects
+        .filter(startups=OuterRef("startup_profile_id"))
+        .order_by("name")
+        .values("name")
+    )
+
+    return (
+        SavedStartup.objects
+        .filter(investor_profile_id=investor_profile_id)
+        .select_related("startup_profile")
+        .annotate(
+            tag_names=ArraySubquery(tags),
+            region_names=ArraySubquery(regions),
+            latest_project_id=Subquery(latest_project.values("pk")[:1]),
+            latest_project_title=Subquery(latest_project.values("title")[:1]),
+            latest_project_status=Subquery(latest_project.values("status")[:1]),
+            latest_project_target=Subquery(latest_project.values("target_amount")[:1]),
+            latest_project_raised=Subquery(latest_project.values("raised_amount")[:1]),
+            latest_project_currency=Subquery(latest_project.values("currency")[:1]),
+        )
+    )
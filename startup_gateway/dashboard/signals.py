@@ -0,0 +1,67 @@
+from django.db.models.signals import m2m_changed, post_init, post_save
+from django.dispatch import receiver
+
+from projects.models import Project
+from startup_gateway.model_state import loaded_values
+from startups.models import StartupProfile
+from .percolator import schedule_percolation
+
+
+# Fields a saved search can match on; saves touching nothing else are not
+# percolated. Tags and regions are many-to-many and handled separately.
+PROJECT_PERCOLATION_FIELDS = ("title", "status", "visibility", "is_deleted", "startup_profile_id")
+STARTUP_PERCOLATION_FIELDS = ("company_name",)
+
+
+def _percolation_fields_changed(instance, fields, created, update_fields):
+    state = loaded_values(instance, fields)
+    previous = getattr(instance, "_percolation_state", None)
+    instance._percolation_state = state
+    if created:
+        return True
+    if update_fields is not None:
+        # update_fields may name a foreign key by field name or attname.
+        names = set(fields) | {field.removesuffix("_id") for field in fields}
+        if names.isdisjoint(update_fields):
+            return False
+    return state != previous
+
+
+@receiver(post_init, sender=Project)
+def remember_project_state(sender, instance, **kwargs):
+    instance._percolation_state = loaded_values(instance, PROJECT_PERCOLATION_FIELDS)
+
+
+@receiver(post_init, sender=StartupProfile)
+def remember_startup_state(sender, instance, **kwargs):
+    instance._percolation_state = loaded_values(instance, STARTUP_PERCOLATION_FIELDS)
+
+
+def _schedule_project(project):
+    # A project's tags and statuses also feed its startup's subject.
+    schedule_percolation("project", project.pk)
+    schedule_percolation("startup", project.startup_profile_id)
+
+
+@receiver(post_save, sender=Project)
+def percolate_saved_project(sender, instance, created, raw=False, update_fields=None, **kwargs):
+    if not raw and _percolation_fields_changed(instance, PROJECT_PERCOLATION_FIELDS, created, update_fields):
+        _schedule_project(instance)
+
+
+@receiver(m2m_changed, sender=Project.tags.through)
+def percolate_project_tags(sender, instance, action, reverse, pk_set, **kwargs):
+    if action == "post_add" and not reverse and pk_set:
+        _schedule_project(instance)
+
+
+@receiver(post_save, sender=StartupProfile)
+def percolate_saved_startup(sender, instance, created, raw=False, update_fields=None, **kwargs):
+    if not raw and _percolation_fields_changed(instance, STARTUP_PERCOLATION_FIELDS, created, update_fields):
+        schedule_percolation("startup", instance.pk)
+
+
+@receiver(m2m_changed, sender=StartupProfile.region.through)
+def percolate_startup_regions(sender, instance, action, reverse, pk_set, **kwargs):
+    if action == "post_add" and not reverse and pk_set:
+        schedule_percolation("startup", instance.pk)
@@ -1,3 +1,368 @@
-from django.test import TestCase
+import heapq
+from unittest.mock import patch
 
-# Create your tests here.
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import transaction
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+from rest_framework_simplejwt.tokens import AccessToken
+
+from investors.models import InvestorProfile
+from projects.models import Project, ProjectStatus, ProjectVisibility, Tag
+from startups.models import Region, StartupProfile
+from users.models import Role
+from notifications.models import Notification
+from .matching import Features, Matcher, refresh_investor_matches
+from .models import InvestorMatch, SavedSearch, SavedSearchHit, SavedSearchKey, SavedStartup
+from .percolator import SEARCH_MATCH_TYPE
+
+
+User = get_user_model()
+
+
+class SavedStartupsAPITests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(username="investor", email="investor@example.com")
+        self.user.roles.add(Role.objects.get(name="investor"))
+        self.investor = InvestorProfile.objects.create(user=self.user, company_name="Fund")
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {AccessToken.for_user(self.user)}")
+        self.url = reverse("dashboard:saved-list")
+        self.region = Region.objects.create(name="Lviv")
+        self.tag = Tag.objects.create(name="wood")
+
+    def make_startup(self, index):
+        owner = User.objects.create_user(username=f"owner{index}", email=f"owner{index}@example.com")
+        startup = StartupProfile.objects.create(user=owner, company_name=f"Startup {index}")
+        startup.region.add(self.region)
+        project = Project.objects.create(
+            startup_profile=startup,
+            title=f"Project {index}",
+            slug=f"project-{index}",
+            short_description="Short",
+            description="Long",
+            status=ProjectStatus.ACTIVE,
+            target_amount=1000,
+            raised_amount=250,
+        )
+        project.tags.add(self.tag)
+        return startup
+
+    def test_list_includes_tags_regions_and_latest_project(self):
+        SavedStartup.objects.create(investor_profile=self.investor, startup_profile=self.make_startup(1))
+
+        resp = self.client.get(self.url)
+
+        self.assertEqual(resp.status_code, status.HTTP_200_OK)
+        item = resp.data["results"][0]
+        self.assertEqual(item["tags"], ["wood"])
+        self.assertEqual(item["regions"], ["Lviv"])
+        self.assertEqual(item["latest_project"]["status"], ProjectStatus.ACTIVE)
+        self.assertEqual(item["latest_project"]["funding_progress"], 25.0)
+
+    def test_list_query_count_does_not_grow_with_page_size(self):
+        SavedStartup.objects.create(investor_profile=self.investor, startup_profile=self.make_startup(1))
+        self.client.get(self.url)
+        with self.assertNumQueries(1):
+            self.client.get(self.url)
+
+        for index in range(2, 6):
+            SavedStartup.objects.create(investor_profile=self.investor, startup_profile=self.make_startup(index))
+        with self.assertNumQueries(1):
+            resp = self.client.get(self.url)
+        self.assertEqual(len(resp.data["results"]), 5)
+
+    def test_save_and_unsave_are_idempotent(self):
+        startup = self.make_startup(1)
+
+        first = self.client.post(self.url, {"startup_profile_id": startup.pk}, format="json")
+        second = self.client.post(self.url, {"startup_profile_id": startup.pk}, format="json")
+        self.assertEqual(first.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(second.status_code, status.HTTP_200_OK)
+        self.assertEqual(SavedStartup.objects.count(), 1)
+
+        url = reverse("dashboard:saved-delete", args=[startup.pk])
+        self.assertEqual(self.client.delete(url).status_code, status.HTTP_204_NO_CONTENT)
+        self.assertEqual(self.client.delete(url).status_code, status.HTTP_204_NO_CONTENT)
+        self.assertFalse(SavedStartup.objects.exists())
+
+    def test_save_unknown_startup_rejected(self):
+        resp = self.client.post(self.url, {"startup_profile_id": 999999}, format="json")
+        self.assertEqual(resp.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_non_investor_forbidden(self):
+        founder = User.objects.create_user(username="founder", email="founder@example.com")
+        founder.roles.add(Role.objects.get(name="startup"))
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {AccessToken.for_user(founder)}")
+
+        self.assertEqual(self.client.get(self.url).status_code, status.HTTP_403_FORBIDDEN)
+
+
+class InvestorMatchingTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(username="investor", email="investor@example.com")
+        self.user.roles.add(Role.objects.get(name="investor"))
+        self.investor = InvestorProfile.objects.create(user=self.user, company_name="Fund")
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {AccessToken.for_user(self.user)}")
+        self.wood = Tag.objects.create(name="wood")
+        self.ai = Tag.objects.create(name="ai")
+        self.lviv = Region.objects.create(name="Lviv")
+
+    def make_startup(self, name, tag, target):
+        owner = User.objects.create_user(username=name, email=f"{name}@example.com")
+        startup = StartupProfile.objects.create(user=owner, company_name=name)
+        project = Project.objects.create(
+            startup_profile=startup,
+            title=name,
+            slug=name,
+            short_description="Short",
+            description="Long",
+            status=ProjectStatus.ACTIVE,
+            target_amount=target,
+        )
+        project.tags.add(tag)
+        return startup, project
+
+    def set_preferences(self, **data):
+        with self.captureOnCommitCallbacks(execute=True):
+            return self.client.put(reverse("dashboard:preferences"), data, format="json")
+
+    def test_preferences_update_scores_matches(self):
+        woodwork, _ = self.make_startup("woodwork", self.wood, 5000)
+        robots, _ = self.make_startup("robots", self.ai, 500000)
+        woodwork.region.add(self.lviv)
+
+        resp = self.set_preferences(
+            preferred_tags=[self.wood.pk],
+            preferred_regions=[self.lviv.pk],
+            min_ticket="1000",
+            max_ticket="10000",
+        )
+        self.assertEqual(resp.status_code, status.HTTP_200_OK)
+        self.assertFalse(InvestorMatch.objects.exists())
+
+        self.assertEqual(refresh_investor_matches(), 1)
+        self.client.get(reverse("dashboard:matches"))
+        with self.assertNumQueries(1):
+            resp = self.client.get(reverse("dashboard:matches"))
+        self.assertEqual([item["startup"]["id"] for item in resp.data], [woodwork.pk])
+        self.assertEqual(resp.data[0]["score"], 1.0)
+
+    def test_invalid_ticket_range_rejected(self):
+        resp = self.set_preferences(min_ticket="5000", max_ticket="1000")
+        self.assertEqual(resp.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_incremental_refresh_picks_up_changed_startups(self):
+        woodwork, _ = self.make_startup("woodwork", self.wood, 5000)
+        self.set_preferences(preferred_tags=[self.wood.pk, self.ai.pk])
+        refresh_investor_matches()
+        self.assertEqual(refresh_investor_matches(), 0)
+
+        robots, project = self.make_startup("robots", self.ai, 500000)
+        project.tags.add(self.wood)
+
+        self.assertEqual(refresh_investor_matches(), 1)
+        self.assertEqual(
+            list(InvestorMatch.objects.order_by("rank").values_list("startup_profile_id", flat=True)),
+            [robots.pk, woodwork.pk],
+        )
+
+        project.is_deleted = True
+        project.save()
+        refresh_investor_matches()
+        self.assertEqual(
+            list(InvestorMatch.objects.values_list("startup_profile_id", flat=True)),
+            [woodwork.pk],
+        )
+
+
+    def test_startups_without_public_projects_not_matched(self):
+        hidden, project = self.make_startup("hidden", self.wood, 5000)
+        project.visibility = ProjectVisibility.PRIVATE
+        project.save()
+        hidden.region.add(self.lviv)
+        self.set_preferences(preferred_regions=[self.lviv.pk])
+
+        refresh_investor_matches()
+
+        self.assertFalse(InvestorMatch.objects.exists())
+
+    def test_grouped_top_matches_scoring_every_startup(self):
+        features = {
+            pk: Features(
+                tag_ids=tuple(sorted({pk % 3, pk % 5})),
+                region_ids=(pk % 2,),
+                statuses=("active",) if pk % 4 else ("idea",),
+                targets=tuple(sorted({float(pk % 7 * 1000), float(pk % 11 * 500)})),
+            )
+            for pk in range(1, 200)
+        }
+        matcher = Matcher(features)
+        for tag_ids, region_ids, statuses, min_ticket, max_ticket in [
+            ([0, 4], [1], ["active"], 1000, 3000),
+            ([2], [], [], None, None),
+            ([], [], [], None, 1500),
+            ([1, 2, 3], [0], ["idea"], 6000, None),
+        ]:
+            prefs = matcher.preferences({
+                "tag_ids": tag_ids,
+                "region_ids": region_ids,
+                "preferred_statuses": statuses,
+                "min_ticket": min_ticket,
+                "max_ticket": max_ticket,
+            })
+            expected = heapq.nlargest(
+                20, ((score, pk) for pk in features if (score := matcher.score(prefs, pk)) > 0)
+            )
+            self.assertEqual(matcher.top(prefs, 20), expected)
+
+
+@override_settings(SAVED_SEARCH_PERCOLATION_WORKERS=0)
+class SavedSearchPercolationTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(username="investor", email="investor@example.com")
+        self.user.roles.add(Role.objects.get(name="investor"))
+        self.investor = InvestorProfile.objects.create(user=self.user, company_name="Fund")
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {AccessToken.for_user(self.user)}")
+        self.wood = Tag.objects.create(name="wood")
+        self.ai = Tag.objects.create(name="ai")
+        self.lviv = Region.objects.create(name="Lviv")
+        owner = User.objects.create_user(username="owner", email="owner@example.com")
+        with self.captureOnCommitCallbacks(execute=True):
+            self.startup = StartupProfile.objects.create(user=owner, company_name="Handmade Co")
+
+    def create_project(self, slug, *tags, status_value=ProjectStatus.ACTIVE):
+        with self.captureOnCommitCallbacks(execute=True):
+            project = Project.objects.create(
+                startup_profile=self.startup,
+                title=slug.title(),
+                slug=slug,
+                short_description="Short",
+                description="Long",
+                status=status_value,
+                target_amount=1000,
+            )
+            project.tags.add(*tags)
+        return project
+
+    def test_search_indexed_under_most_selective_keys(self):
+        resp = self.client.post(
+            reverse("dashboard:search-list"),
+            {"name": "Wood", "tag_ids": [self.wood.pk], "region_ids": [self.lviv.pk]},
+            format="json",
+        )
+        self.assertEqual(resp.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(
+            list(SavedSearchKey.objects.values_list("key", flat=True)),
+            [f"tag:{self.wood.pk}"],
+        )
+
+    def test_matching_project_notifies_once(self):
+        self.client.post(
+            reverse("dashboard:search-list"),
+            {"name": "Wooden things", "tag_ids": [self.wood.pk], "statuses": ["active"]},
+            format="json",
+        )
+
+        self.create_project("robots", self.ai)
+        self.assertFalse(Notification.objects.filter(type=SEARCH_MATCH_TYPE).exists())
+
+        project = self.create_project("chairs", self.wood)
+        with self.captureOnCommitCallbacks(execute=True):
+            project.save()
+
+        # The project and its startup each match once and coalesce into one
+        # notification; the unchanged re-save is not percolated at all.
+        notification = Notification.objects.get(user=self.user, type=SEARCH_MATCH_TYPE)
+        self.assertEqual(notification.count, 2)
+        self.assertEqual(
+            sorted(SavedSearchHit.objects.values_list("subject_key", flat=True)),
+            [f"project:{project.pk}", f"startup:{self.startup.pk}"],
+        )
+
+    def test_only_searchable_changes_percolated(self):
+        project = self.create_project("chairs", self.wood)
+
+        with patch("dashboard.percolator.run_percolation") as run:
+            with self.captureOnCommitCallbacks(execute=True):
+                project.short_description = "Shorter"
+                project.save()
+                project.save(update_fields=["description"])
+            run.assert_not_called()
+
+            with self.captureOnCommitCallbacks(execute=True):
+                project.status = ProjectStatus.FUNDED
+                project.save()
+            run.assert_called_once_with([("project", project.pk), ("startup", self.startup.pk)])
+
+    def test_subjects_percolated_once_per_transaction(self):
+        with patch("dashboard.percolator.run_percolation") as run:
+            with self.captureOnCommitCallbacks(execute=True):
+                project = Project.objects.create(
+                    startup_profile=self.startup,
+                    title="Chairs",
+                    slug="chairs",
+                    short_description="Short",
+                    description="Long",
+                    status=ProjectStatus.ACTIVE,
+                    target_amount=1000,
+                )
+                project.tags.add(self.wood, self.ai)
+                project.tags.add(Tag.objects.create(name="oak"))
+                project.title = "Oak chairs"
+                project.save()
+                self.startup.region.add(self.lviv)
+
+        run.assert_called_once_with([("project", project.pk), ("startup", self.startup.pk)])
+
+    def test_rolled_back_savepoint_does_not_swallow_the_flush(self):
+        with patch("dashboard.percolator.run_percolation") as run:
+            with self.captureOnCommitCallbacks(execute=True):
+                try:
+                    with transaction.atomic():
+                        self.startup.company_name = "Renamed Co"
+                        self.startup.save()
+                        raise RuntimeError
+                except RuntimeError:
+                    pass
+                project = self.create_project("chairs", self.wood)
+
+        run.assert_called_once_with([("project", project.pk), ("startup", self.startup.pk)])
+
+    @override_settings(SAVED_SEARCH_PERCOLATION_WORKERS=2)
+    def test_percolation_runs_off_the_request_thread(self):
+        with patch("dashboard.percolator.get_executor") as executor:
+            with patch("dashboard.percolator.run_percolation") as run:
+                project = self.create_project("chairs", self.wood)
+
+        run.assert_not_called()
+        executor.return_value.submit.assert_called_once()
+        self.assertEqual(
+            executor.return_value.submit.call_args.args[1],
+            [("project", project.pk), ("startup", self.startup.pk)],
+        )
+
+    def test_text_only_search_matches_via_any_key(self):
+        search = SavedSearch.objects.create(investor_profile=self.investor, name="Chairs", search="chair")
+        SavedSearchKey.objects.create(saved_search=search, key="any")
+
+        self.create_project("lamps", self.wood)
+        self.create_project("chairs", self.wood)
+
+        notification = Notification.objects.get(user=self.user, type=SEARCH_MATCH_TYPE)
+        self.assertEqual(notification.payload["subject"]["title"], "Chairs")
+
+    def test_delete_only_own_search(self):
+        other = InvestorProfile.objects.create(
+            user=User.objects.create_user(username="other", email="other@example.com"),
+            company_name="Other Fund",
+        )
+        search = SavedSearch.objects.create(investor_profile=other, name="Theirs")
+
+        resp = self.client.delete(reverse("dashboard:search-delete", args=[search.pk]))
+        self.assertEqual(resp.status_code, status.HTTP_404_NOT_FOUND)
@@ -0,0 +1,21 @@
+from django.urls import path
+
+from .views import (
+    InvestorMatchListAPIView,
+    InvestorPreferencesAPIView,
+    SavedSearchDeleteAPIView,
+    SavedSearchListCreateAPIView,
+    SavedStartupDeleteAPIView,
+    SavedStartupListAPIView,
+)
+
+app_name = "dashboard"
+
+urlpatterns = [
+    path("dashboard/saved/", SavedStartupListAPIView.as_view(), name="saved-list"),
+    path("dashboard/saved/<int:startup_profile_id>/", SavedStartupDeleteAPIView.as_view(), name="saved-delete"),
+    path("dashboard/preferences/", InvestorPreferencesAPIView.as_view(), name="preferences"),
+    path("dashboard/matches/", InvestorMatchListAPIView.as_view(), name="matches"),
+    path("dashboard/searches/", SavedSearchListCreateAPIView.as_view(), name="search-list"),
+    path("dashboard/searches/<int:pk>/", SavedSearchDeleteAPIView.as_view(), name="search-delete"),
+]
@@ -1,3 +1,106 @@
-from django.shortcuts import render
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.exceptions import PermissionDenied
+from rest_framework.generics import (
+    DestroyAPIView,
+    GenericAPIView,
+    ListAPIView,
+    ListCreateAPIView,
+    RetrieveUpdateAPIView,
+)
+from rest_framework.response import Response
 
-# Create your views here.
+from investors.models import InvestorProfile
+from users.permissions import IsInvestorRole
+from .models import InvestorMatch, SavedSearch
+from .pagination import SavedStartupPagination
+from .serializers import (
+    InvestorMatchSerializer,
+    InvestorPreferencesSerializer,
+    SavedSearchSerializer,
+    SavedStartupSerializer,
+    SaveStartupSerializer,
+)
+from .percolator import save_search
+from .services import get_investor_profile_id, save_startup, saved_startups_overview, unsave_startup
+
+
+class InvestorProfileMixin:
+    permission_classes = [IsInvestorRole]
+
+    def get_investor_profile_id(self):
+        investor_profile_id = get_investor_profile_id(self.request.user)
+        if investor_profile_id is None:
+            raise PermissionDenied("An investor profile is required.")
+        return investor_profile_id
+
+
+class SavedStartupListAPIView(InvestorProfileMixin, ListAPIView):
+    serializer_class = SavedStartupSerializer
+    pagination_class = SavedStartupPagination
+
+    def get_queryset(self):
+        return saved_startups_overview(self.get_investor_profile_id())
+
+    def post(self, request):
+        serializer = SaveStartupSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        created = save_startup(
+            self.get_investor_profile_id(),
+            serializer.validated_data["startup_profile"].pk,
+        )
+        return Response(
+            {"saved": True},
+            status=status.HTTP_201_CREATED if created else status.HTTP_200_OK,
+        )
+
+
+class SavedStartupDeleteAPIView(InvestorProfileMixin, GenericAPIView):
+    def delete(self, request, startup_profile_id):
+        unsave_startup(self.get_investor_profile_id(), startup_profile_id)
+        return Response(status=status.HTTP_204_NO_CONTENT)
+
+
+class InvestorPreferencesAPIView(InvestorProfileMixin, RetrieveUpdateAPIView):
+    serializer_class = InvestorPreferencesSerializer
+
+    def get_object(self):
+        return InvestorProfile.objects.get(pk=self.get_investor_profile_id())
+
+    def perform_update(self, serializer):
+        # The next refresh_investor_matches run rescores this investor in full.
+        serializer.save(preferences_updated_at=timezone.now())
+
+
+class InvestorMatchListAPIView(InvestorProfileMixin, ListAPIView):
+    serializer_class = InvestorMatchSerializer
+    pagination_class = None
+
+    def get_queryset(self):
+        return (
+            InvestorMatch.objects
+            .filter(investor_profile_id=self.get_investor_profile_id())
+            .select_related("startup_profile")
+            .order_by("rank")
+        )
+
+
+class SavedSearchListCreateAPIView(InvestorProfileMixin, ListCreateAPIView):
+    serializer_class = SavedSearchSerializer
+    pagination_class = None
+
+    def get_queryset(self):
+        return SavedSearch.objects.filter(
+            investor_profile_id=self.get_investor_profile_id()
+        ).order_by("-created_at")
+
+    def perform_create(self, serializer):
+        serializer.instance = save_search(
+            SavedSearch(investor_profile_id=self.get_investor_profile_id(), **serializer.validated_data)
+        )
+
+
+class SavedSearchDeleteAPIView(InvestorProfileMixin, DestroyAPIView):
+    def get_queryset(self):
+        return SavedSearch.objects.filter(investor_profile_id=self.get_investor_profile_id())
@@ -0,0 +1,50 @@
+# Generated by Django 5.2.10 on 2026-10-19 11:19
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('investors', '0001_initial'),
+        ('projects', '0005_project_similarity'),
+        ('startups', '0003_region_startupprofile_region'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='investorprofile',
+            name='matches_computed_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='investorprofile',
+            name='max_ticket',
+            field=models.DecimalField(blank=True, decimal_places=2, max_digits=12, null=True),
+        ),
+        migrations.AddField(
+            model_name='investorprofile',
+            name='min_ticket',
+            field=models.DecimalField(blank=True, decimal_places=2, max_digits=12, null=True),
+        ),
+        migrations.AddField(
+            model_name='investorprofile',
+            name='preferences_updated_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='investorprofile',
+            name='preferred_regions',
+            field=models.ManyToManyField(blank=True, related_name='+', to='startups.region'),
+        ),
+        migrations.AddField(
+            model_name='investorprofile',
+            name='preferred_statuses',
+            field=models.JSONField(blank=True, default=list),
+        ),
+        migrations.AddField(
+            model_name='investorprofile',
+            name='preferred_tags',
+            field=models.ManyToManyField(blank=True, related_name='+', to='projects.tag'),
+        ),
+    ]
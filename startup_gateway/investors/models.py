@@ -12,7 +12,24 @@ class InvestorProfile(models.Model):
         related_name='investor_profile'
     )
     company_name = models.CharField(max_length=255)
-   
+
+    # Matching preferences; see dashboard.matching.
+    preferred_tags = models.ManyToManyField(
+        'projects.Tag',
+        related_name='+',
+        blank=True
+    )
+    preferred_regions = models.ManyToManyField(
+        'startups.Region',
+        related_name='+',
+        blank=True
+    )
+    preferred_statuses = models.JSONField(default=list, blank=True)
+    min_ticket = models.DecimalField(max_digits=12, decimal_places=2, null=True, blank=True)
+    max_ticket = models.DecimalField(max_digits=12, decimal_places=2, null=True, blank=True)
+    preferences_updated_at = models.DateTimeField(null=True, blank=True)
+    matches_computed_at = models.DateTimeField(null=True, blank=True)
+
     class Meta:
         db_table = 'investor_profiles'
         indexes = [
@@ -0,0 +1,136 @@
+import time
+import uuid
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.test import RequestFactory
+from rest_framework.test import force_authenticate
+
+from projects.models import Project
+from startups.models import StartupProfile
+from messages.views import InboxAPIView, ThreadAPIView
+
+
+User = get_user_model()
+
+SEED_MESSAGES = """
+WITH ids AS (
+    SELECT %(users)s::bigint[] AS users, %(projects)s::uuid[] AS projects
+)
+INSERT INTO messages (sender_id, receiver_id, project_id, body, is_read, created_at)
+SELECT
+    ids.users[1 + g %% cardinality(ids.users)],
+    ids.users[1 + (g * 7 + 1) %% cardinality(ids.users)],
+    ids.projects[1 + g %% cardinality(ids.projects)],
+    'benchmark message ' || g,
+    FALSE,
+    now() - make_interval(secs => g)
+FROM ids, generate_series(1, %(messages)s) AS g
+WHERE g %% cardinality(ids.users) <> (g * 7 + 1) %% cardinality(ids.users)
+"""
+
+SEED_CONVERSATIONS = """
+INSERT INTO conversations (owner_id, counterpart_id, project_id, last_message_id, last_message_at)
+SELECT DISTINCT ON (owner_id, counterpart_id, project_id)
+    owner_id, counterpart_id, project_id, id, created_at
+FROM (
+    SELECT sender_id AS owner_id, receiver_id AS counterpart_id, project_id, id, created_at FROM messages
+    UNION ALL
+    SELECT receiver_id, sender_id, project_id, id, created_at FROM messages
+) AS m
+ORDER BY owner_id, counterpart_id, project_id, created_at DESC, id DESC
+ON CONFLICT DO NOTHING
+"""
+
+
+class _Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = (
+        "Seed a large synthetic message table inside a transaction, time the "
+        "inbox and thread endpoints against it, then roll everything back."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--messages", type=int, default=10_000_000)
+        parser.add_argument("--users", type=int, default=1_000)
+        parser.add_argument("--projects", type=int, default=200)
+        parser.add_argument("--repeat", type=int, default=20)
+
+    def handle(self, *args, **options):
+        try:
+            with transaction.atomic():
+                self._run(options)
+                raise _Rollback
+        except _Rollback:
+            self.stdout.write("Benchmark data rolled back.")
+
+    def _run(self, options):
+        run_id = uuid.uuid4().hex[:8]
+
+        users = User.objects.bulk_create(
+            User(username=f"bench-{run_id}-{i}", email=f"bench-{run_id}-{i}@example.com")
+            for i in range(options["users"])
+        )
+        owners = users[: options["projects"]]
+        startups = StartupProfile.objects.bulk_create(
+            StartupProfile(user=user, company_name=user.username, slug=user.username)
+            for user in owners
+        )
+        projects = Project.objects.bulk_create(
+            Project(
+                startup_profile=startup,
+                title=startup.company_name,
+                slug=startup.slug,
+                short_description="benchmark",
+                description="benchmark",
+                target_amount=1000,
+            )
+            for startup in startups
+        )
+
+        started = time.perf_counter()
+        with connection.cursor() as cursor:
+            cursor.execute(
+                SEED_MESSAGES,
+                {
+                    "messages": options["messages"],
+                    "users": [user.pk for user in users],
+                    "projects": [str(project.pk) for project in projects],
+                },
+            )
+            cursor.execute(SEED_CONVERSATIONS)
+            cursor.execute("ANALYZE messages")
+            cursor.execute("ANALYZE conversations")
+        self.stdout.write(f"Seeded {options['messages']} messages in {time.perf_counter() - started:.1f}s")
+
+        user = users[0]
+        counterpart = users[1 % len(users)]
+        project = projects[0]
+        factory = RequestFactory(HTTP_HOST="localhost")
+
+        def inbox():
+            request = factory.get("/api/messages/inbox/")
+            force_authenticate(request, user=user)
+            return InboxAPIView.as_view()(request)
+
+        def thread():
+            request = factory.get("/api/messages/threads/")
+            force_authenticate(request, user=user)
+            return ThreadAPIView.as_view()(request, project_id=project.pk, user_id=counterpart.pk)
+
+        for name, view in (("inbox", inbox), ("thread", thread)):
+            timings = []
+            for _ in range(options["repeat"]):
+                started = time.perf_counter()
+                response = view()
+                response.render()
+                timings.append((time.perf_counter() - started) * 1000)
+            timings.sort()
+            self.stdout.write(
+                f"{name}: p50 {timings[len(timings) // 2]:.1f} ms, "
+                f"max {timings[-1]:.1f} ms over {len(timings)} requests"
+            )
@@ -0,0 +1,85 @@
+# Generated by Django 5.2.10 on 2026-10-19 10:52
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+BACKFILL_CONVERSATIONS = """
+INSERT INTO conversations (owner_id, counterpart_id, project_id, last_message_id, last_message_at)
+SELECT DISTINCT ON (owner_id, counterpart_id, project_id)
+    owner_id, counterpart_id, project_id, id, created_at
+FROM (
+    SELECT sender_id AS owner_id, receiver_id AS counterpart_id, project_id, id, created_at FROM messages
+    UNION ALL
+    SELECT receiver_id, sender_id, project_id, id, created_at FROM messages
+) AS m
+ORDER BY owner_id, counterpart_id, project_id, created_at DESC, id DESC;
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('custom_messages', '0001_initial'),
+        ('projects', '0003_project_is_deleted'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Conversation',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('last_message_at', models.DateTimeField()),
+            ],
+            options={
+                'db_table': 'conversations',
+            },
+        ),
+        migrations.RemoveIndex(
+            model_name='message',
+            name='messages_receive_432d39_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='message',
+            name='messages_project_9d1fd3_idx',
+        ),
+        migrations.AddIndex(
+            model_name='message',
+            index=models.Index(fields=['receiver', '-created_at'], name='messages_receive_c09c1d_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='message',
+            index=models.Index(fields=['project', 'created_at'], name='messages_project_932105_idx'),
+        ),
+        migrations.AddField(
+            model_name='conversation',
+            name='counterpart',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AddField(
+            model_name='conversation',
+            name='last_message',
+            field=models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='custom_messages.message'),
+        ),
+        migrations.AddField(
+            model_name='conversation',
+            name='owner',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='conversations', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AddField(
+            model_name='conversation',
+            name='project',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='conversations', to='projects.project'),
+        ),
+        migrations.AddIndex(
+            model_name='conversation',
+            index=models.Index(fields=['owner', '-last_message_at'], name='conversatio_owner_i_75f7a9_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='conversation',
+            constraint=models.UniqueConstraint(fields=('owner', 'counterpart', 'project'), name='unique_conversation_per_owner'),
+        ),
+        migrations.RunSQL(BACKFILL_CONVERSATIONS, migrations.RunSQL.noop),
+    ]
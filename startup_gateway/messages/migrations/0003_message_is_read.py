@@ -0,0 +1,18 @@
+# Generated by Django 5.2.10 on 2026-10-19 10:55
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('custom_messages', '0002_conversation_and_composite_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='message',
+            name='is_read',
+            field=models.BooleanField(default=False),
+        ),
+    ]
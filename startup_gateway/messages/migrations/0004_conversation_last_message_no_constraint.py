@@ -0,0 +1,19 @@
+# Generated by Django 5.2.10 on 2026-10-19 11:06
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('custom_messages', '0003_message_is_read'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='conversation',
+            name='last_message',
+            field=models.ForeignKey(db_constraint=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='custom_messages.message'),
+        ),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 5.2.10 on 2026-10-19 11:06
+
+from django.db import migrations
+
+from startup_gateway.partitioning import convert_to_partitioned
+
+
+def partition_messages(apps, schema_editor):
+    convert_to_partitioned(schema_editor, apps.get_model('custom_messages', 'Message'))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('custom_messages', '0004_conversation_last_message_no_constraint'),
+    ]
+
+    operations = [
+        migrations.RunPython(partition_messages),
+    ]
@@ -21,15 +21,64 @@ class Message(models.Model):
         related_name='messages'
     )
     body = models.TextField()
+    is_read = models.BooleanField(default=False)
     created_at = models.DateTimeField(auto_now_add=True)
 
     class Meta:
         db_table = 'messages'
         indexes = [
             models.Index(fields=['sender']),
-            models.Index(fields=['receiver']),
-            models.Index(fields=['project']),
+            models.Index(fields=['receiver', '-created_at']),
+            models.Index(fields=['project', 'created_at']),
         ]
 
     def __str__(self):
         return f'Message from {self.sender} to {self.receiver}'
+
+
+class Conversation(models.Model):
+    """
+    Materialized inbox row: one per (owner, counterpart, project), pointing
+    at the latest message between them. Upserted on every message insert.
+    """
+
+    owner = models.ForeignKey(
+        User,
+        on_delete=models.CASCADE,
+        related_name='conversations'
+    )
+    counterpart = models.ForeignKey(
+        User,
+        on_delete=models.CASCADE,
+        related_name='+'
+    )
+    project = models.ForeignKey(
+        'projects.Project',
+        on_delete=models.CASCADE,
+        related_name='conversations'
+    )
+    # No database constraint: messages is partitioned by month and Postgres
+    # cannot reference it by id alone.
+    last_message = models.ForeignKey(
+        Message,
+        on_delete=models.SET_NULL,
+        null=True,
+        db_constraint=False,
+        related_name='+'
+    )
+    last_message_at = models.DateTimeField()
+
+    class Meta:
+        db_table = 'conversations'
+        constraints = [
+            models.UniqueConstraint(
+                fields=['owner', 'counterpart', 'project'],
+                name='unique_conversation_per_owner'
+            ),
+        ]
+        indexes = [
+            models.Index(fields=['owner', '-last_message_at']),
+        ]
+
+    def __str__(self):
+        return f'Conversation of {self.owner} with {self.counterpart}'
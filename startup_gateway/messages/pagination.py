@@ -0,0 +1,15 @@
+from rest_framework.pagination import CursorPagination
+
+
+class InboxPagination(CursorPagination):
+    page_size = 20
+    page_size_query_param = "page_size"
+    max_page_size = 50
+    ordering = "-last_message_at"
+
+
+class ThreadPagination(CursorPagination):
+    page_size = 50
+    page_size_query_param = "page_size"
+    max_page_size = 100
+    ordering = "-created_at"
@@ -0,0 +1,69 @@
+from django.contrib.auth import get_user_model
+from rest_framework import serializers
+
+from projects.models import Project
+from .models import Conversation, Message
+
+
+User = get_user_model()
+
+
+class MessageSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = Message
+        fields = ["id", "sender_id", "receiver_id", "project_id", "body", "is_read", "created_at"]
+        read_only_fields = fields
+
+
+class MessageCreateSerializer(serializers.Serializer):
+    receiver_id = serializers.IntegerField()
+    project_id = serializers.UUIDField()
+    body = serializers.CharField()
+
+    def validate(self, attrs):
+        sender = self.context["request"].user
+
+        project = (
+            Project.objects
+            .filter(pk=attrs["project_id"], is_deleted=False)
+            .select_related("startup_profile")
+            .first()
+        )
+        if project is None:
+            raise serializers.ValidationError({"project_id": "Project not found."})
+
+        receiver = User.objects.filter(pk=attrs["receiver_id"], is_active=True).first()
+        if receiver is None or receiver.pk == sender.pk:
+            raise serializers.ValidationError({"receiver_id": "Invalid receiver."})
+
+        if project.startup_profile.user_id not in (sender.pk, receiver.pk):
+            raise serializers.ValidationError(
+                {"receiver_id": "Messages about a project must involve its owner."}
+            )
+
+        attrs["project"] = project
+        attrs["receiver"] = receiver
+        return attrs
+
+
+class ConversationSerializer(serializers.ModelSerializer):
+    counterpart = serializers.SerializerMethodField()
+    project = serializers.SerializerMethodField()
+    last_message = MessageSerializer(read_only=True)
+
+    class Meta:
+        model = Conversation
+        fields = ["id", "counterpart", "project", "last_message", "last_message_at"]
+        read_only_fields = fields
+
+    def get_counterpart(self, obj):
+        return {
+            "id": obj.counterpart_id,
+            "username": obj.counterpart.username,
+        }
+
+    def get_project(self, obj):
+        return {
+            "id": obj.project_id,
+            "title": obj.project.title,
+        }
@@ -0,0 +1,72 @@
+from django.db import connection, transaction
+
+from notifications.realtime import publish_events
+from notifications.services import bump_unread_counts
+from .models import Message
+
+
+# Concurrent sends can commit out of order, so an upsert only ever moves a
+# conversation forward to a later (last_message_at, last_message_id).
+UPSERT_CONVERSATIONS_SQL = """
+INSERT INTO conversations (owner_id, counterpart_id, project_id, last_message_id, last_message_at)
+VALUES (%s, %s, %s, %s, %s), (%s, %s, %s, %s, %s)
+ON CONFLICT (owner_id, counterpart_id, project_id) DO UPDATE
+SET last_message_id = EXCLUDED.last_message_id,
+    last_message_at = EXCLUDED.last_message_at
+WHERE (conversations.last_message_at, COALESCE(conversations.last_message_id, 0))
+    <= (EXCLUDED.last_message_at, EXCLUDED.last_message_id)
+"""
+
+
+def upsert_conversations(message):
+    """Point both participants' inbox rows at ``message`` unless they already show a later one."""
+    sender_id, receiver_id = message.sender_id, message.receiver_id
+    with connection.cursor() as cursor:
+        cursor.execute(
+            UPSERT_CONVERSATIONS_SQL,
+            [
+                sender_id, receiver_id, message.project_id, message.pk, message.created_at,
+                receiver_id, sender_id, message.project_id, message.pk, message.created_at,
+            ],
+        )
+
+
+@transaction.atomic
+def send_message(sender, receiver, project, body):
+    message = Message.objects.create(
+        sender=sender,
+        receiver=receiver,
+        project=project,
+        body=body,
+    )
+
+    upsert_conversations(message)
+    bump_unread_counts("messages", {receiver.pk: 1})
+
+    publish_events([
+        (
+            receiver.pk,
+            {
+                "type": "message",
+                "id": message.pk,
+                "sender_id": sender.pk,
+                "project_id": project.pk,
+                "created_at": message.created_at,
+            },
+        ),
+    ])
+
+    return message
+
+
+@transaction.atomic
+def mark_thread_read(user_id, project_id, counterpart_id):
+    updated = Message.objects.filter(
+        project_id=project_id,
+        sender_id=counterpart_id,
+        receiver_id=user_id,
+        is_read=False,
+    ).update(is_read=True)
+
+    bump_unread_counts("messages", {user_id: -updated})
+    return updated
@@ -1,3 +1,138 @@
-from django.test import TestCase
+from io import StringIO
 
-# Create your tests here.
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+from rest_framework_simplejwt.tokens import AccessToken
+
+from notifications.models import UnreadCounter
+from projects.models import Project
+from startups.models import StartupProfile
+from .models import Conversation, Message
+from .services import send_message, upsert_conversations
+
+
+User = get_user_model()
+
+
+class MessagesAPITests(APITestCase):
+    def setUp(self):
+        self.owner = User.objects.create_user(username="owner", email="owner@example.com", password="pass12345")
+        self.investor = User.objects.create_user(username="investor", email="investor@example.com", password="pass12345")
+        self.other = User.objects.create_user(username="other", email="other@example.com", password="pass12345")
+
+        self.startup = StartupProfile.objects.create(user=self.owner, company_name="Handmade Co")
+        self.project = Project.objects.create(
+            startup_profile=self.startup,
+            title="Chairs",
+            slug="chairs",
+            short_description="short",
+            description="long",
+            target_amount=1000,
+        )
+
+    def auth_as(self, user):
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {AccessToken.for_user(user)}")
+
+    def test_send_message_updates_both_inboxes(self):
+        self.auth_as(self.investor)
+
+        resp = self.client.post(
+            reverse("messages:message-create"),
+            {"receiver_id": self.owner.pk, "project_id": str(self.project.pk), "body": "Hello"},
+            format="json",
+        )
+
+        self.assertEqual(resp.status_code, status.HTTP_201_CREATED)
+        message = Message.objects.get()
+        self.assertEqual(
+            Conversation.objects.filter(last_message=message).count(),
+            2,
+        )
+
+    def test_message_must_involve_project_owner(self):
+        self.auth_as(self.investor)
+
+        resp = self.client.post(
+            reverse("messages:message-create"),
+            {"receiver_id": self.other.pk, "project_id": str(self.project.pk), "body": "Hello"},
+            format="json",
+        )
+
+        self.assertEqual(resp.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(Message.objects.exists())
+
+    def test_inbox_has_one_row_per_counterpart_with_latest_message(self):
+        send_message(self.investor, self.owner, self.project, "first")
+        latest = send_message(self.owner, self.investor, self.project, "second")
+        send_message(self.other, self.owner, self.project, "from other")
+
+        self.auth_as(self.investor)
+        resp = self.client.get(reverse("messages:inbox"))
+
+        self.assertEqual(resp.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(resp.data["results"]), 1)
+        self.assertEqual(resp.data["results"][0]["counterpart"]["id"], self.owner.pk)
+        self.assertEqual(resp.data["results"][0]["last_message"]["id"], latest.pk)
+
+    def test_late_upsert_of_older_message_keeps_latest(self):
+        older = send_message(self.investor, self.owner, self.project, "first")
+        newer = send_message(self.owner, self.investor, self.project, "second")
+
+        # An older send whose transaction commits last.
+        upsert_conversations(older)
+
+        for conversation in Conversation.objects.filter(project=self.project):
+            self.assertEqual(conversation.last_message_id, newer.pk)
+            self.assertEqual(conversation.last_message_at, newer.created_at)
+
+    def test_thread_is_cursor_paginated(self):
+        for i in range(3):
+            send_message(self.investor, self.owner, self.project, f"message {i}")
+        send_message(self.other, self.owner, self.project, "not in thread")
+
+        self.auth_as(self.investor)
+        url = reverse("messages:thread", kwargs={"project_id": self.project.pk, "user_id": self.owner.pk})
+        resp = self.client.get(url, {"page_size": 2})
+
+        self.assertEqual(resp.status_code, status.HTTP_200_OK)
+        self.assertEqual([m["body"] for m in resp.data["results"]], ["message 2", "message 1"])
+
+        resp = self.client.get(resp.data["next"])
+        self.assertEqual([m["body"] for m in resp.data["results"]], ["message 0"])
+        self.assertIsNone(resp.data["next"])
+
+    def test_unread_messages_counted_and_cleared_on_thread_read(self):
+        send_message(self.investor, self.owner, self.project, "first")
+        send_message(self.investor, self.owner, self.project, "second")
+        self.assertEqual(UnreadCounter.objects.get(user=self.owner).messages, 2)
+
+        self.auth_as(self.owner)
+        url = reverse("messages:thread-read", kwargs={"project_id": self.project.pk, "user_id": self.investor.pk})
+        resp = self.client.post(url)
+
+        self.assertEqual(resp.status_code, status.HTTP_200_OK)
+        self.assertEqual(resp.data["updated"], 2)
+        self.assertEqual(UnreadCounter.objects.get(user=self.owner).messages, 0)
+        self.assertFalse(Message.objects.filter(is_read=False).exists())
+
+    def test_inbox_requires_authentication(self):
+        resp = self.client.get(reverse("messages:inbox"))
+        self.assertEqual(resp.status_code, status.HTTP_401_UNAUTHORIZED)
+
+
+# The command builds its requests for localhost, which DEBUG allows.
+@override_settings(ALLOWED_HOSTS=["localhost"])
+class BenchmarkInboxCommandTests(APITestCase):
+    def test_runs_on_a_tiny_dataset_and_rolls_back(self):
+        out = StringIO()
+
+        call_command("benchmark_inbox", messages=50, users=5, projects=2, repeat=1, stdout=out)
+
+        self.assertIn("Seeded 50 messages", out.getvalue())
+        self.assertIn("inbox: p50", out.getvalue())
+        self.assertIn("thread: p50", out.getvalue())
+        self.assertFalse(Message.objects.exists())
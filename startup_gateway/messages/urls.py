@@ -0,0 +1,12 @@
+from django.urls import path
+
+from .views import InboxAPIView, MessageCreateAPIView, ThreadAPIView, ThreadMarkReadAPIView
+
+app_name = "messages"
+
+urlpatterns = [
+    path("messages/", MessageCreateAPIView.as_view(), name="message-create"),
+    path("messages/inbox/", InboxAPIView.as_view(), name="inbox"),
+    path("messages/threads/<uuid:project_id>/<int:user_id>/", ThreadAPIView.as_view(), name="thread"),
+    path("messages/threads/<uuid:project_id>/<int:user_id>/read/", ThreadMarkReadAPIView.as_view(), name="thread-read"),
+]
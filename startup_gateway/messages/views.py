@@ -1,3 +1,64 @@
-from django.shortcuts import render
+from django.db.models import Q
+from rest_framework import status
+from rest_framework.generics import ListAPIView, GenericAPIView
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
 
-# Create your views here.
+from .models import Conversation, Message
+from .pagination import InboxPagination, ThreadPagination
+from .serializers import ConversationSerializer, MessageCreateSerializer, MessageSerializer
+from .services import mark_thread_read, send_message
+
+
+class MessageCreateAPIView(GenericAPIView):
+    serializer_class = MessageCreateSerializer
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request):
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        message = send_message(
+            sender=request.user,
+            receiver=serializer.validated_data["receiver"],
+            project=serializer.validated_data["project"],
+            body=serializer.validated_data["body"],
+        )
+
+        return Response(MessageSerializer(message).data, status=status.HTTP_201_CREATED)
+
+
+class InboxAPIView(ListAPIView):
+    serializer_class = ConversationSerializer
+    pagination_class = InboxPagination
+    permission_classes = [IsAuthenticated]
+
+    def get_queryset(self):
+        return (
+            Conversation.objects
+            .filter(owner_id=self.request.user.pk)
+            .select_related("counterpart", "project", "last_message")
+        )
+
+
+class ThreadAPIView(ListAPIView):
+    serializer_class = MessageSerializer
+    pagination_class = ThreadPagination
+    permission_classes = [IsAuthenticated]
+
+    def get_queryset(self):
+        user_id = self.request.user.pk
+        counterpart_id = self.kwargs["user_id"]
+
+        return Message.objects.filter(project_id=self.kwargs["project_id"]).filter(
+            Q(sender_id=user_id, receiver_id=counterpart_id)
+            | Q(sender_id=counterpart_id, receiver_id=user_id)
+        )
+
+
+class ThreadMarkReadAPIView(GenericAPIView):
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request, project_id, user_id):
+        updated = mark_thread_read(request.user.pk, project_id, user_id)
+        return Response({"updated": updated}, status=status.HTTP_200_OK)
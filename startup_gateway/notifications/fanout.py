@@ -0,0 +1,110 @@
+"""
+Fan-out of startup events to the investors who saved the startup.
+
+Requests only record a FanoutEvent; delivery runs after commit on a small
+background pool (or inline when NOTIFICATION_FANOUT_WORKERS is 0). Follower
+ids are streamed with a server-side cursor and notifications are inserted
+in fixed-size batches, each batch committed together with the event's
+progress marker.
+"""
+import logging
+
+from django.conf import settings
+from django.db import connections, transaction
+from django.utils import timezone
+
+from dashboard.models import SavedStartup
+from startup_gateway.executors import executor_workers, get_executor
+from .models import FanoutEvent, Notification
+from .services import create_notifications
+
+
+logger = logging.getLogger(__name__)
+
+def notify_startup_followers(startup_profile_id, key, notification_type, payload, subject_key=""):
+    """
+    Record an event for the startup's followers and deliver it after commit.
+    Calling again with the same key is a no-op.
+    """
+    event, created = FanoutEvent.objects.get_or_create(
+        key=key,
+        defaults={
+            "startup_profile_id": startup_profile_id,
+            "type": notification_type,
+            "subject_key": subject_key,
+            "payload": payload,
+        },
+    )
+    if created:
+        transaction.on_commit(lambda: dispatch_fanout(event.pk))
+    return event
+
+
+def dispatch_fanout(event_id):
+    if executor_workers("NOTIFICATION_FANOUT_WORKERS", 0) <= 0:
+        return run_fanout(event_id)
+
+    get_executor("notification-fanout", "NOTIFICATION_FANOUT_WORKERS", 0).submit(_run_fanout_in_thread, event_id)
+    return None
+
+
+def _run_fanout_in_thread(event_id):
+    try:
+        run_fanout(event_id)
+    except Exception:
+        logger.exception("Notification fan-out %s failed", event_id)
+    finally:
+        connections.close_all()
+
+
+def run_fanout(event_id, batch_size=None):
+    batch_size = batch_size or int(getattr(settings, "NOTIFICATION_FANOUT_BATCH_SIZE", 1000))
+
+    event = FanoutEvent.objects.filter(pk=event_id, completed_at__isnull=True).first()
+    if event is None:
+        return 0
+
+    followers = (
+        SavedStartup.objects
+        .filter(startup_profile_id=event.startup_profile_id, id__gt=event.last_follower_id)
+        .order_by("id")
+        .values_list("id", "investor_profile__user_id")
+    )
+
+    delivered = 0
+    batch = []
+    for row in followers.iterator(chunk_size=batch_size):
+        batch.append(row)
+        if len(batch) >= batch_size:
+            delivered += _deliver_batch(event, batch)
+            batch = []
+    if batch:
+        delivered += _deliver_batch(event, batch)
+
+    FanoutEvent.objects.filter(pk=event.pk, completed_at__isnull=True).update(completed_at=timezone.now())
+    return delivered
+
+
+@transaction.atomic
+def _deliver_batch(event, batch):
+    locked = FanoutEvent.objects.select_for_update().get(pk=event.pk)
+    rows = [row for row in batch if row[0] > locked.last_follower_id]
+    if not rows:
+        return 0
+
+    create_notifications(
+        [
+            Notification(
+                user_id=user_id,
+                type=locked.type,
+                subject_key=locked.subject_key,
+                payload=locked.payload,
+            )
+            for _, user_id in rows
+        ],
+        coalesce=True,
+    )
+
+    locked.last_follower_id = rows[-1][0]
+    locked.save(update_fields=["last_follower_id"])
+    return len(rows)
@@ -0,0 +1,52 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db.models import Count
+from django.utils import timezone
+
+from notifications.models import Notification
+from notifications.services import DIGEST_TYPE, roll_up_into_digests
+
+
+class Command(BaseCommand):
+    help = "Roll older unread notifications into one digest notification per user."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--older-than-hours",
+            type=int,
+            default=getattr(settings, "NOTIFICATION_DIGEST_AFTER_HOURS", 24),
+        )
+        parser.add_argument("--min-items", type=int, default=2)
+        parser.add_argument("--batch-size", type=int, default=500)
+
+    def handle(self, *args, **options):
+        cutoff = timezone.now() - timedelta(hours=options["older_than_hours"])
+
+        candidates = (
+            Notification.objects
+            .filter(is_read=False, created_at__lt=cutoff)
+            .exclude(type=DIGEST_TYPE)
+            .values("user_id")
+            .annotate(items=Count("id"))
+            .filter(items__gte=options["min_items"])
+            .order_by("user_id")
+            .values_list("user_id", flat=True)
+        )
+
+        users = 0
+        rolled = 0
+        last_user_id = 0
+        while True:
+            user_ids = list(candidates.filter(user_id__gt=last_user_id)[: options["batch_size"]])
+            if not user_ids:
+                break
+
+            rolled += roll_up_into_digests(user_ids, cutoff)
+            users += len(user_ids)
+            last_user_id = user_ids[-1]
+
+        self.stdout.write(
+            self.style.SUCCESS(f"Rolled {rolled} notifications into digests for {users} users.")
+        )
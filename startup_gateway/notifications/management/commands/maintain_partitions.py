@@ -0,0 +1,93 @@
+from datetime import datetime, timezone
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+
+from messages.models import Conversation
+from notifications.services import bump_unread_counts
+from startup_gateway.partitioning import (
+    PARTITIONED_TABLES,
+    add_months,
+    drop_partition,
+    ensure_partitions,
+    list_partitions,
+    month_start,
+)
+
+
+RETENTION_SETTINGS = {
+    "notifications": "NOTIFICATION_RETENTION_MONTHS",
+    "messages": "MESSAGE_RETENTION_MONTHS",
+    "project_audit": "PROJECT_AUDIT_RETENTION_MONTHS",
+}
+
+
+def _unread_in_partition(partition, user_column):
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"SELECT {user_column}, COUNT(*) FROM {connection.ops.quote_name(partition)} "
+            f"WHERE NOT is_read GROUP BY {user_column}"
+        )
+        return {user_id: -count for user_id, count in cursor.fetchall()}
+
+
+def _before_drop_notifications(partition, month):
+    bump_unread_counts("notifications", _unread_in_partition(partition, "user_id"))
+
+
+def _before_drop_messages(partition, month):
+    bump_unread_counts("messages", _unread_in_partition(partition, "receiver_id"))
+    # A conversation whose latest message is being dropped has no messages
+    # left, since every older partition is dropped first.
+    Conversation.objects.filter(last_message_at__lt=add_months(month, 1)).delete()
+
+
+BEFORE_DROP = {
+    "notifications": _before_drop_notifications,
+    "messages": _before_drop_messages,
+}
+
+
+class Command(BaseCommand):
+    help = (
+        "Create monthly partitions ahead of time and drop partitions older "
+        "than each table's retention period."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--months-ahead",
+            type=int,
+            default=getattr(settings, "PARTITION_MONTHS_AHEAD", 3),
+        )
+        parser.add_argument("--dry-run", action="store_true")
+
+    def handle(self, *args, **options):
+        dry_run = options["dry_run"]
+        current = month_start(datetime.now(timezone.utc))
+
+        for table in PARTITIONED_TABLES:
+            if not dry_run:
+                for name in ensure_partitions(table, options["months_ahead"]):
+                    self.stdout.write(f"Created {name}")
+
+            retention = getattr(settings, RETENTION_SETTINGS[table], 0)
+            if retention <= 0:
+                continue
+
+            keep_from = add_months(current, -retention)
+            for month, name in sorted(list_partitions(table).items()):
+                if month >= keep_from:
+                    continue
+                if dry_run:
+                    self.stdout.write(f"Would drop {name}")
+                    continue
+
+                with transaction.atomic():
+                    if table in BEFORE_DROP:
+                        BEFORE_DROP[table](name, month)
+                    drop_partition(table, month)
+                self.stdout.write(f"Dropped {name}")
+
+        self.stdout.write(self.style.SUCCESS("Partitions are up to date."))
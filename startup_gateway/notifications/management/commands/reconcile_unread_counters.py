@@ -0,0 +1,42 @@
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+
+from notifications.services import invalidate_unread_counts
+
+
+RECONCILE_SQL = """
+WITH actual AS (
+    SELECT user_id, SUM(messages) AS messages, SUM(notifications) AS notifications
+    FROM (
+        SELECT receiver_id AS user_id, COUNT(*) AS messages, 0 AS notifications
+        FROM messages WHERE NOT is_read GROUP BY receiver_id
+        UNION ALL
+        SELECT user_id, 0, COUNT(*) FROM notifications WHERE NOT is_read GROUP BY user_id
+        UNION ALL
+        SELECT user_id, 0, 0 FROM unread_counters
+    ) AS counts
+    GROUP BY user_id
+)
+INSERT INTO unread_counters (user_id, messages, notifications, updated_at)
+SELECT user_id, messages, notifications, NOW() FROM actual
+ON CONFLICT (user_id) DO UPDATE
+SET messages = EXCLUDED.messages,
+    notifications = EXCLUDED.notifications,
+    updated_at = EXCLUDED.updated_at
+WHERE unread_counters.messages <> EXCLUDED.messages
+   OR unread_counters.notifications <> EXCLUDED.notifications
+RETURNING user_id
+"""
+
+
+class Command(BaseCommand):
+    help = "Recompute unread message and notification counters and fix any drift."
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            with connection.cursor() as cursor:
+                cursor.execute(RECONCILE_SQL)
+                user_ids = [row[0] for row in cursor.fetchall()]
+
+        invalidate_unread_counts(user_ids)
+        self.stdout.write(self.style.SUCCESS(f"Reconciled unread counters for {len(user_ids)} users."))
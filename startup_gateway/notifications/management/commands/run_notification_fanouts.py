@@ -0,0 +1,27 @@
+from django.core.management.base import BaseCommand
+
+from notifications.fanout import run_fanout
+from notifications.models import FanoutEvent
+
+
+class Command(BaseCommand):
+    help = "Deliver pending or interrupted follower notification fan-outs."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=None)
+
+    def handle(self, *args, **options):
+        pending = (
+            FanoutEvent.objects
+            .filter(completed_at__isnull=True)
+            .order_by("created_at")
+            .values_list("id", flat=True)
+        )
+
+        events = 0
+        delivered = 0
+        for event_id in list(pending):
+            delivered += run_fanout(event_id, batch_size=options["batch_size"])
+            events += 1
+
+        self.stdout.write(self.style.SUCCESS(f"Processed {events} fan-outs, {delivered} notifications created."))
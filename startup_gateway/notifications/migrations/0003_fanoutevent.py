@@ -0,0 +1,32 @@
+# Generated by Django 5.2.10 on 2026-10-19 10:59
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('notifications', '0002_unreadcounter'),
+        ('startups', '0003_region_startupprofile_region'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='FanoutEvent',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('key', models.CharField(max_length=255, unique=True)),
+                ('type', models.CharField(max_length=50)),
+                ('payload', models.JSONField()),
+                ('last_follower_id', models.BigIntegerField(default=0)),
+                ('completed_at', models.DateTimeField(blank=True, null=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('startup_profile', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='fanout_events', to='startups.startupprofile')),
+            ],
+            options={
+                'db_table': 'notification_fanouts',
+                'indexes': [models.Index(condition=models.Q(('completed_at__isnull', True)), fields=['created_at'], name='notif_fanout_pending_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 5.2.10 on 2026-10-19 11:01
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('notifications', '0004_unread_partial_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='fanoutevent',
+            name='subject_key',
+            field=models.CharField(blank=True, default='', max_length=100),
+        ),
+        migrations.AddField(
+            model_name='notification',
+            name='count',
+            field=models.PositiveIntegerField(default=1),
+        ),
+        migrations.AddField(
+            model_name='notification',
+            name='subject_key',
+            field=models.CharField(blank=True, default='', max_length=100),
+        ),
+    ]
@@ -0,0 +1,18 @@
+from django.db import migrations
+
+from startup_gateway.partitioning import ensure_check_constraints
+
+
+def restore_check_constraints(apps, schema_editor):
+    ensure_check_constraints(schema_editor, apps.get_model('notifications', 'Notification'))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('notifications', '0006_partition_notifications'),
+    ]
+
+    operations = [
+        migrations.RunPython(restore_check_constraints, migrations.RunPython.noop),
+    ]
@@ -11,16 +11,82 @@ class Notification(models.Model):
         related_name='notifications'
     )
     type = models.CharField(max_length=50)
+    # What the notification is about, e.g. "project:<uuid>"; rows sharing
+    # type and subject inside the coalescing window are merged.
+    subject_key = models.CharField(max_length=100, blank=True, default='')
     payload = models.JSONField()
+    count = models.PositiveIntegerField(default=1)
     is_read = models.BooleanField(default=False)
     created_at = models.DateTimeField(auto_now_add=True)
 
     class Meta:
         db_table = 'notifications'
         indexes = [
-            models.Index(fields=['user']),
-            models.Index(fields=['is_read']),
+            models.Index(fields=['user', '-created_at']),
+            models.Index(
+                fields=['user', '-created_at'],
+                condition=models.Q(is_read=False),
+                name='notif_unread_user_created_idx',
+            ),
         ]
 
     def __str__(self):
         return f'{self.type} for {self.user}'
+
+
+class UnreadCounter(models.Model):
+    """
+    Per-user unread totals, kept in step with messages and notifications
+    by notifications.services instead of being counted per request.
+    """
+
+    user = models.OneToOneField(
+        User,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='unread_counter'
+    )
+    messages = models.PositiveIntegerField(default=0)
+    notifications = models.PositiveIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = 'unread_counters'
+
+    def __str__(self):
+        return f'Unread counters for {self.user}'
+
+
+class FanoutEvent(models.Model):
+    """
+    One startup event to deliver to every investor following the startup.
+
+    ``key`` makes the event idempotent; ``last_follower_id`` records how far
+    delivery got, so an interrupted fan-out resumes without duplicates.
+    """
+
+    key = models.CharField(max_length=255, unique=True)
+    startup_profile = models.ForeignKey(
+        'startups.StartupProfile',
+        on_delete=models.CASCADE,
+        related_name='fanout_events'
+    )
+    type = models.CharField(max_length=50)
+    subject_key = models.CharField(max_length=100, blank=True, default='')
+    payload = models.JSONField()
+    last_follower_id = models.BigIntegerField(default=0)
+    completed_at = models.DateTimeField(null=True, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        db_table = 'notification_fanouts'
+        indexes = [
+            models.Index(
+                fields=['created_at'],
+                condition=models.Q(completed_at__isnull=True),
+                name='notif_fanout_pending_idx',
+            ),
+        ]
+
+    def __str__(self):
+        return self.key
@@ -0,0 +1,159 @@
+"""
+Push of new messages and notifications to connected clients.
+
+Events are published after commit and fanned out across processes through
+Postgres LISTEN/NOTIFY; each process keeps one listener thread and hands
+events to asyncio queues owned by its open event streams. The in-memory
+broker skips Postgres and is meant for tests and single-process setups.
+"""
+import asyncio
+import json
+import logging
+import select
+import threading
+
+from django.conf import settings
+from django.db import connection, connections, transaction
+
+
+logger = logging.getLogger(__name__)
+
+CHANNEL = "realtime_events"
+
+
+class RealtimeHub:
+    """Per-process registry of subscriber queues keyed by user id."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._subscribers = {}
+
+    def subscribe(self, user_id, maxsize=100):
+        queue = asyncio.Queue(maxsize=maxsize)
+        entry = (asyncio.get_running_loop(), queue)
+        with self._lock:
+            self._subscribers.setdefault(user_id, set()).add(entry)
+        return entry
+
+    def unsubscribe(self, user_id, entry):
+        with self._lock:
+            entries = self._subscribers.get(user_id)
+            if entries is not None:
+                entries.discard(entry)
+                if not entries:
+                    del self._subscribers[user_id]
+
+    def dispatch(self, user_id, event):
+        with self._lock:
+            entries = list(self._subscribers.get(user_id, ()))
+        for loop, queue in entries:
+            loop.call_soon_threadsafe(_put_nowait, queue, event)
+
+
+def _put_nowait(queue, event):
+    try:
+        queue.put_nowait(event)
+    except asyncio.QueueFull:
+        logger.warning("Dropping realtime event for a slow client")
+
+
+class InMemoryBroker:
+    def __init__(self):
+        self.hub = RealtimeHub()
+
+    def start(self):
+        pass
+
+    def publish(self, events):
+        for user_id, event in events:
+            self.hub.dispatch(user_id, event)
+
+
+class PostgresBroker:
+    def __init__(self):
+        self.hub = RealtimeHub()
+        self._started = False
+        self._start_lock = threading.Lock()
+
+    def start(self):
+        with self._start_lock:
+            if self._started:
+                return
+            thread = threading.Thread(target=self._listen, name="realtime-listener", daemon=True)
+            thread.start()
+            self._started = True
+
+    def publish(self, events):
+        payloads = [json.dumps({"user_id": user_id, "event": event}, default=str) for user_id, event in events]
+        if not payloads:
+            return
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT pg_notify(%s, payload) FROM unnest(%s::text[]) AS payload",
+                [CHANNEL, payloads],
+            )
+
+    def _listen(self):
+        while True:
+            db = connections.create_connection("default")
+            try:
+                db.ensure_connection()
+                raw = db.connection
+                raw.autocommit = True
+                with raw.cursor() as cursor:
+                    cursor.execute(f"LISTEN {CHANNEL}")
+                while True:
+                    for payload in _wait_for_notifies(raw, timeout=30):
+                        message = json.loads(payload)
+                        self.hub.dispatch(message["user_id"], message["event"])
+            except Exception:
+                logger.exception("Realtime listener failed, reconnecting")
+                threading.Event().wait(1)
+            finally:
+                db.close()
+
+
+def _wait_for_notifies(raw, timeout):
+    if hasattr(raw, "poll"):
+        # psycopg2
+        if select.select([raw], [], [], timeout) == ([], [], []):
+            return
+        raw.poll()
+        while raw.notifies:
+            yield raw.notifies.pop(0).payload
+    else:
+        # psycopg 3
+        for notify in raw.notifies(timeout=timeout):
+            yield notify.payload
+
+
+_brokers = {}
+_brokers_lock = threading.Lock()
+
+
+def get_broker():
+    name = getattr(settings, "REALTIME_BROKER", "postgres")
+    with _brokers_lock:
+        broker = _brokers.get(name)
+        if broker is None:
+            broker = InMemoryBroker() if name == "memory" else PostgresBroker()
+            _brokers[name] = broker
+    return broker
+
+
+def publish_events(events):
+    """
+    Queue (user_id, event) pairs for delivery once the current transaction
+    commits, so clients never hear about rows they cannot read yet.
+    """
+    events = list(events)
+    if not events:
+        return
+
+    def _publish():
+        try:
+            get_broker().publish(events)
+        except Exception:
+            logger.exception("Failed to publish realtime events")
+
+    transaction.on_commit(_publish)
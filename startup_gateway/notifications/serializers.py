@@ -0,0 +1,36 @@
+from django.utils.dateparse import parse_datetime
+from rest_framework import serializers
+
+from .models import Notification
+
+
+class NotificationSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = Notification
+        fields = ["id", "type", "payload", "count", "is_read", "created_at"]
+        read_only_fields = fields
+
+
+class NotificationMarkReadSerializer(serializers.Serializer):
+    ids = serializers.ListField(
+        child=serializers.IntegerField(),
+        required=False,
+        allow_empty=False,
+    )
+    up_to = serializers.CharField(required=False)
+
+    def validate_up_to(self, value):
+        """Accept either a notification id or an ISO 8601 timestamp."""
+        value = value.strip()
+        if value.isdigit():
+            return {"up_to_id": int(value)}
+
+        timestamp = parse_datetime(value)
+        if timestamp is None:
+            raise serializers.ValidationError("Expected a notification id or an ISO 8601 timestamp.")
+        return {"up_to_time": timestamp}
+
+    def validate(self, attrs):
+        if "ids" in attrs and "up_to" in attrs:
+            raise serializers.ValidationError("Pass either ids or up_to, not both.")
+        return attrs
@@ -0,0 +1,253 @@
+import json
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connection, transaction
+from django.db.models import Count, Max, Min, Sum
+from django.utils import timezone
+
+from .models import Notification, UnreadCounter
+from .realtime import publish_events
+
+
+UNREAD_KINDS = ("messages", "notifications")
+DIGEST_TYPE = "digest"
+
+
+def _unread_counts_key(user_id):
+    return f"unread:counts:{user_id}"
+
+
+def invalidate_unread_counts(user_ids):
+    keys = [_unread_counts_key(user_id) for user_id in user_ids]
+    transaction.on_commit(lambda: cache.delete_many(keys))
+
+
+def bump_unread_counts(kind, deltas):
+    """
+    Atomically apply {user_id: delta} to one unread counter column.
+
+    Increments are a single INSERT ... ON CONFLICT DO UPDATE; decrements a
+    single UPDATE ... FROM (VALUES ...) clamped at zero.
+    """
+    if kind not in UNREAD_KINDS:
+        raise ValueError(f"Unknown unread counter: {kind}")
+
+    increments = [(user_id, delta) for user_id, delta in deltas.items() if delta > 0]
+    decrements = [(user_id, -delta) for user_id, delta in deltas.items() if delta < 0]
+    table = UnreadCounter._meta.db_table
+
+    with connection.cursor() as cursor:
+        if increments:
+            other = "notifications" if kind == "messages" else "messages"
+            values = ", ".join(["(%s, %s)"] * len(increments))
+            cursor.execute(
+                f"""
+                INSERT INTO {table} (user_id, {kind}, {other}, updated_at)
+                SELECT v.user_id, v.delta, 0, NOW()
+                FROM (VALUES {values}) AS v(user_id, delta)
+                ON CONFLICT (user_id) DO UPDATE
+                SET {kind} = {table}.{kind} + EXCLUDED.{kind},
+                    updated_at = EXCLUDED.updated_at
+                """,
+                [param for row in increments for param in row],
+            )
+
+        if decrements:
+            values = ", ".join(["(%s, %s)"] * len(decrements))
+            cursor.execute(
+                f"""
+                UPDATE {table}
+                SET {kind} = GREATEST({table}.{kind} - v.delta, 0),
+                    updated_at = NOW()
+                FROM (VALUES {values}) AS v(user_id, delta)
+                WHERE {table}.user_id = v.user_id
+                """,
+                [param for row in decrements for param in row],
+            )
+
+    invalidate_unread_counts([user_id for user_id, _ in increments + decrements])
+
+
+def get_unread_counts(user_id):
+    key = _unread_counts_key(user_id)
+    counts = cache.get(key)
+    if counts is None:
+        counter = UnreadCounter.objects.filter(user_id=user_id).values("messages", "notifications").first()
+        counts = counter or {"messages": 0, "notifications": 0}
+        cache.set(key, counts, timeout=int(getattr(settings, "UNREAD_COUNTS_CACHE_TTL", 30)))
+    return counts
+
+
+COALESCE_SQL = """
+WITH incoming(user_id, payload) AS (VALUES {values}),
+latest AS (
+    SELECT DISTINCT ON (n.user_id) n.id, n.user_id
+    FROM notifications AS n
+    JOIN incoming AS i ON i.user_id = n.user_id
+    WHERE n.type = %s
+      AND n.subject_key = %s
+      AND NOT n.is_read
+      AND n.created_at >= %s
+    ORDER BY n.user_id, n.created_at DESC
+)
+UPDATE notifications AS n
+SET count = n.count + 1,
+    payload = i.payload::jsonb
+FROM latest
+JOIN incoming AS i ON i.user_id = latest.user_id
+WHERE n.id = latest.id
+RETURNING n.user_id
+"""
+
+
+def _coalesce_notifications(notifications):
+    """
+    Fold notifications into the recipient's unread row with the same type
+    and subject created inside NOTIFICATION_COALESCE_WINDOW_SECONDS. That
+    row gets count + 1 and the newest payload. Returns the notifications
+    that still need a row of their own.
+    """
+    window = int(getattr(settings, "NOTIFICATION_COALESCE_WINDOW_SECONDS", 3600))
+    since = timezone.now() - timedelta(seconds=window)
+
+    groups = {}
+    remaining = []
+    for notification in notifications:
+        if notification.subject_key:
+            group = groups.setdefault((notification.type, notification.subject_key), {})
+            if notification.user_id in group:
+                remaining.append(notification)
+            else:
+                group[notification.user_id] = notification
+        else:
+            remaining.append(notification)
+
+    for (notification_type, subject_key), by_user in groups.items():
+        values = ", ".join(["(%s::bigint, %s)"] * len(by_user))
+        params = [
+            param
+            for user_id, notification in by_user.items()
+            for param in (user_id, json.dumps(notification.payload))
+        ]
+        with connection.cursor() as cursor:
+            cursor.execute(
+                COALESCE_SQL.format(values=values),
+                params + [notification_type, subject_key, since],
+            )
+            merged = {row[0] for row in cursor.fetchall()}
+
+        remaining.extend(
+            notification for user_id, notification in by_user.items() if user_id not in merged
+        )
+
+    return remaining
+
+
+@transaction.atomic
+def create_notifications(notifications, coalesce=False):
+    """
+    Insert notifications, bump unread counters and push them to clients.
+    With coalesce=True, notifications with a subject merge into a recent
+    unread row instead; only the newly inserted rows are returned.
+    """
+    if coalesce:
+        notifications = _coalesce_notifications(notifications)
+
+    created = Notification.objects.bulk_create(notifications)
+
+    deltas = {}
+    for notification in created:
+        deltas[notification.user_id] = deltas.get(notification.user_id, 0) + 1
+    bump_unread_counts("notifications", deltas)
+
+    publish_events(
+        (
+            notification.user_id,
+            {
+                "type": "notification",
+                "id": notification.pk,
+                "notification_type": notification.type,
+                "created_at": notification.created_at,
+            },
+        )
+        for notification in created
+    )
+
+    return created
+
+
+@transaction.atomic
+def mark_notifications_read(user_id, ids=None, up_to_id=None, up_to_time=None):
+    """
+    Mark the user's unread notifications read in one UPDATE: the given ids,
+    everything up to a notification id or timestamp, or everything.
+    """
+    queryset = Notification.objects.filter(user_id=user_id, is_read=False)
+    if ids is not None:
+        queryset = queryset.filter(pk__in=ids)
+    if up_to_id is not None:
+        queryset = queryset.filter(pk__lte=up_to_id)
+    if up_to_time is not None:
+        queryset = queryset.filter(created_at__lte=up_to_time)
+
+    updated = queryset.update(is_read=True)
+    bump_unread_counts("notifications", {user_id: -updated})
+    return updated
+
+
+@transaction.atomic
+def roll_up_into_digests(user_ids, cutoff):
+    """
+    Replace each user's unread notifications older than ``cutoff`` with one
+    digest notification summarising them by type.
+    """
+    stale = (
+        Notification.objects
+        .filter(user_id__in=user_ids, is_read=False, created_at__lt=cutoff)
+        .exclude(type=DIGEST_TYPE)
+    )
+    rows = (
+        stale
+        .values("user_id", "type")
+        .annotate(rows=Count("id"), total=Sum("count"), first=Min("created_at"), last=Max("created_at"))
+        .order_by("user_id", "type")
+    )
+
+    summaries = {}
+    for row in rows:
+        summary = summaries.setdefault(
+            row["user_id"],
+            {"rows": 0, "total": 0, "items": [], "first": row["first"], "last": row["last"]},
+        )
+        summary["rows"] += row["rows"]
+        summary["total"] += row["total"]
+        summary["items"].append({"type": row["type"], "count": row["total"]})
+        summary["first"] = min(summary["first"], row["first"])
+        summary["last"] = max(summary["last"], row["last"])
+
+    if not summaries:
+        return 0
+
+    stale.delete()
+
+    Notification.objects.bulk_create([
+        Notification(
+            user_id=user_id,
+            type=DIGEST_TYPE,
+            count=summary["total"],
+            payload={
+                "items": summary["items"],
+                "from": summary["first"].isoformat(),
+                "to": summary["last"].isoformat(),
+            },
+        )
+        for user_id, summary in summaries.items()
+    ])
+
+    bump_unread_counts(
+        "notifications",
+        {user_id: 1 - summary["rows"] for user_id, summary in summaries.items()},
+    )
+    return sum(summary["rows"] for summary in summaries.values())
@@ -1,3 +1,334 @@
-from django.test import TestCase
+import asyncio
+import json
+from datetime import timedelta
+from io import StringIO
+from unittest.mock import patch
 
-# Create your tests here.
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import IntegrityError, connection, transaction
+from django.test import AsyncRequestFactory, RequestFactory, override_settings
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APITestCase
+from rest_framework_simplejwt.tokens import AccessToken
+
+from dashboard.models import SavedStartup
+from investors.models import InvestorProfile
+from startup_gateway.partitioning import add_months, create_partition, list_partitions, month_start
+from startups.models import StartupProfile
+from .fanout import notify_startup_followers
+from .models import FanoutEvent, Notification, UnreadCounter
+from .realtime import get_broker
+from .services import create_notifications, get_unread_counts, mark_notifications_read
+from .views import event_stream
+
+
+User = get_user_model()
+
+
+class UnreadCountersTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(username="investor", email="investor@example.com", password="pass12345")
+
+    def notify(self, count=1):
+        with self.captureOnCommitCallbacks(execute=True):
+            return create_notifications(
+                [Notification(user=self.user, type="project_updated", payload={}) for _ in range(count)]
+            )
+
+    def test_counter_incremented_on_insert_and_decremented_on_read(self):
+        created = self.notify(3)
+        self.assertEqual(UnreadCounter.objects.get(user=self.user).notifications, 3)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            mark_notifications_read(self.user.pk, ids=[created[0].pk])
+        self.assertEqual(get_unread_counts(self.user.pk), {"messages": 0, "notifications": 2})
+
+        with self.captureOnCommitCallbacks(execute=True):
+            mark_notifications_read(self.user.pk)
+        self.assertEqual(UnreadCounter.objects.get(user=self.user).notifications, 0)
+
+    def test_unread_counts_endpoint_served_from_cache(self):
+        self.notify(2)
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {AccessToken.for_user(self.user)}")
+        url = reverse("notifications:unread-counts")
+
+        resp = self.client.get(url)
+        self.assertEqual(resp.status_code, status.HTTP_200_OK)
+        self.assertEqual(resp.data, {"messages": 0, "notifications": 2})
+
+        with self.assertNumQueries(0):
+            self.client.get(url)
+
+    def test_mark_read_endpoint(self):
+        created = self.notify(2)
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {AccessToken.for_user(self.user)}")
+
+        resp = self.client.post(reverse("notifications:mark-read"), {"ids": [created[1].pk]}, format="json")
+
+        self.assertEqual(resp.status_code, status.HTTP_200_OK)
+        self.assertEqual(resp.data["updated"], 1)
+        self.assertEqual(Notification.objects.filter(user=self.user, is_read=False).count(), 1)
+
+    def test_mark_read_up_to_id_runs_single_update(self):
+        created = self.notify(3)
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {AccessToken.for_user(self.user)}")
+        self.client.get(reverse("notifications:unread-counts"))
+
+        with self.assertNumQueries(4):
+            # savepoint, UPDATE notifications, UPDATE unread_counters, release
+            resp = self.client.post(
+                reverse("notifications:mark-read"),
+                {"up_to": str(created[1].pk)},
+                format="json",
+            )
+
+        self.assertEqual(resp.data["updated"], 2)
+        self.assertEqual(
+            list(Notification.objects.filter(is_read=False).values_list("pk", flat=True)),
+            [created[2].pk],
+        )
+
+    def test_mark_read_up_to_timestamp(self):
+        created = self.notify(2)
+        Notification.objects.filter(pk=created[0].pk).update(created_at=timezone.now() - timedelta(hours=1))
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {AccessToken.for_user(self.user)}")
+
+        resp = self.client.post(
+            reverse("notifications:mark-read"),
+            {"up_to": (timezone.now() - timedelta(minutes=30)).isoformat()},
+            format="json",
+        )
+
+        self.assertEqual(resp.data["updated"], 1)
+        self.assertTrue(Notification.objects.get(pk=created[0].pk).is_read)
+
+    def test_mark_read_rejects_invalid_up_to(self):
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {AccessToken.for_user(self.user)}")
+        resp = self.client.post(reverse("notifications:mark-read"), {"up_to": "yesterday"}, format="json")
+        self.assertEqual(resp.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_list_is_keyset_paginated_newest_first(self):
+        created = self.notify(3)
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {AccessToken.for_user(self.user)}")
+
+        resp = self.client.get(reverse("notifications:notification-list"), {"page_size": 2, "unread": "true"})
+        self.assertEqual([n["id"] for n in resp.data["results"]], [created[2].pk, created[1].pk])
+
+        resp = self.client.get(resp.data["next"])
+        self.assertEqual([n["id"] for n in resp.data["results"]], [created[0].pk])
+
+    def test_reconcile_fixes_drift(self):
+        self.notify(2)
+        UnreadCounter.objects.filter(user=self.user).update(notifications=7)
+
+        out = StringIO()
+        call_command("reconcile_unread_counters", stdout=out)
+
+        self.assertEqual(UnreadCounter.objects.get(user=self.user).notifications, 2)
+        self.assertIn("1 users", out.getvalue())
+
+
+@override_settings(REALTIME_BROKER="memory")
+class EventStreamTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(username="investor", email="investor@example.com", password="pass12345")
+        self.token = str(AccessToken.for_user(self.user))
+
+    def test_new_notification_published_after_commit(self):
+        broker = get_broker()
+        with patch.object(broker, "publish") as publish:
+            with self.captureOnCommitCallbacks(execute=False) as callbacks:
+                create_notifications([Notification(user=self.user, type="project_updated", payload={})])
+            publish.assert_not_called()
+
+            for callback in callbacks:
+                callback()
+
+        (events,), _ = publish.call_args
+        self.assertEqual(events[0][0], self.user.pk)
+        self.assertEqual(events[0][1]["type"], "notification")
+
+    async def test_stream_delivers_published_events(self):
+        request = AsyncRequestFactory().get("/api/events/", {"token": self.token})
+        response = await event_stream(request)
+        self.assertEqual(response["Content-Type"], "text/event-stream")
+
+        stream = response.streaming_content
+        self.assertEqual(await anext(stream), b"retry: 5000\n\n")
+
+        get_broker().publish([(self.user.pk, {"type": "message", "id": 1})])
+        chunk = await asyncio.wait_for(anext(stream), timeout=1)
+        await stream.aclose()
+
+        self.assertIn(b"event: message", chunk)
+        self.assertIn(b'"id": 1', chunk)
+
+    async def test_stream_refused_outside_asgi(self):
+        request = RequestFactory().get("/api/events/", {"token": self.token})
+        response = await event_stream(request)
+
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(json.loads(response.content)["poll_url"], reverse("notifications:unread-counts"))
+
+    async def test_stream_requires_valid_token(self):
+        request = AsyncRequestFactory().get("/api/events/", {"token": "bad"})
+        response = await event_stream(request)
+        self.assertEqual(response.status_code, 401)
+
+
+@override_settings(NOTIFICATION_FANOUT_WORKERS=0, REALTIME_BROKER="memory")
+class FollowerFanoutTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        owner = User.objects.create_user(username="owner", email="owner@example.com")
+        self.startup = StartupProfile.objects.create(user=owner, company_name="Handmade Co")
+        self.investors = []
+        for i in range(5):
+            user = User.objects.create_user(username=f"investor{i}", email=f"investor{i}@example.com")
+            investor = InvestorProfile.objects.create(user=user, company_name=f"Fund {i}")
+            SavedStartup.objects.create(investor_profile=investor, startup_profile=self.startup)
+            self.investors.append(user)
+
+    def notify(self, key="project:1:updated"):
+        with self.captureOnCommitCallbacks(execute=True):
+            return notify_startup_followers(self.startup.pk, key, "project_updated", {"title": "Chairs"})
+
+    @override_settings(NOTIFICATION_FANOUT_BATCH_SIZE=2)
+    def test_every_follower_notified_once_in_batches(self):
+        event = self.notify()
+
+        self.assertEqual(Notification.objects.filter(type="project_updated").count(), 5)
+        self.assertEqual(
+            set(Notification.objects.values_list("user_id", flat=True)),
+            {user.pk for user in self.investors},
+        )
+        event.refresh_from_db()
+        self.assertIsNotNone(event.completed_at)
+        self.assertEqual(UnreadCounter.objects.get(user=self.investors[0]).notifications, 1)
+
+    def test_same_event_key_is_idempotent(self):
+        self.notify()
+        self.notify()
+        self.assertEqual(Notification.objects.count(), 5)
+
+    def test_interrupted_fanout_resumes_without_duplicates(self):
+        first_follower = SavedStartup.objects.order_by("id").first()
+        event = FanoutEvent.objects.create(
+            key="project:1:published",
+            startup_profile=self.startup,
+            type="project_published",
+            payload={},
+            last_follower_id=first_follower.pk,
+        )
+
+        with self.captureOnCommitCallbacks(execute=True):
+            call_command("run_notification_fanouts", stdout=StringIO())
+
+        self.assertEqual(Notification.objects.count(), 4)
+        self.assertFalse(Notification.objects.filter(user=first_follower.investor_profile.user).exists())
+        event.refresh_from_db()
+        self.assertIsNotNone(event.completed_at)
+
+
+class CoalescingAndDigestTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(username="investor", email="investor@example.com")
+
+    def notify(self, payload, subject_key="project:1"):
+        with self.captureOnCommitCallbacks(execute=True):
+            return create_notifications(
+                [Notification(user=self.user, type="project_updated", subject_key=subject_key, payload=payload)],
+                coalesce=True,
+            )
+
+    def test_repeated_subject_merges_into_unread_row(self):
+        self.notify({"title": "Chairs"})
+        created = self.notify({"title": "Oak chairs"})
+
+        self.assertEqual(created, [])
+        notification = Notification.objects.get()
+        self.assertEqual(notification.count, 2)
+        self.assertEqual(notification.payload, {"title": "Oak chairs"})
+        self.assertEqual(UnreadCounter.objects.get(user=self.user).notifications, 1)
+
+    def test_notification_outside_window_is_not_merged(self):
+        self.notify({"title": "Chairs"})
+        Notification.objects.update(created_at=timezone.now() - timedelta(hours=2))
+
+        with override_settings(NOTIFICATION_COALESCE_WINDOW_SECONDS=3600):
+            self.notify({"title": "Oak chairs"})
+
+        self.assertEqual(Notification.objects.count(), 2)
+
+    def test_digest_rolls_old_unread_notifications_into_one(self):
+        self.notify({"title": "Chairs"}, subject_key="project:1")
+        self.notify({"title": "Chairs"}, subject_key="project:1")
+        self.notify({"title": "Tables"}, subject_key="project:2")
+        Notification.objects.update(created_at=timezone.now() - timedelta(days=2))
+        self.notify({"title": "Lamps"}, subject_key="project:3")
+
+        call_command("build_notification_digests", stdout=StringIO())
+
+        digest = Notification.objects.get(type="digest")
+        self.assertEqual(digest.count, 3)
+        self.assertEqual(digest.payload["items"], [{"type": "project_updated", "count": 3}])
+        self.assertEqual(Notification.objects.filter(type="project_updated").count(), 1)
+        self.assertEqual(UnreadCounter.objects.get(user=self.user).notifications, 2)
+
+
+class PartitionMaintenanceTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(username="investor", email="investor@example.com")
+        self.current = month_start(timezone.now())
+
+    def test_future_partitions_created(self):
+        call_command("maintain_partitions", months_ahead=6, stdout=StringIO())
+
+        months = list_partitions("notifications")
+        self.assertIn(self.current, months)
+        self.assertIn(add_months(self.current, 6), months)
+
+    def test_rows_outside_partitions_move_when_partition_created(self):
+        old_month = add_months(self.current, -30)
+        with self.captureOnCommitCallbacks(execute=True):
+            create_notifications([Notification(user=self.user, type="project_updated", payload={})])
+        Notification.objects.update(created_at=old_month)
+
+        self.assertTrue(create_partition("notifications", old_month))
+        self.assertEqual(Notification.objects.filter(created_at=old_month).count(), 1)
+
+    def test_partitioned_table_keeps_check_constraints(self):
+        create_partition("notifications", add_months(self.current, -40))
+        notification = Notification.objects.create(user=self.user, type="project_updated", payload={})
+
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            Notification.objects.filter(pk=notification.pk).update(count=-1)
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            Notification.objects.filter(pk=notification.pk).update(count=-1, created_at=add_months(self.current, -40))
+
+    @override_settings(NOTIFICATION_RETENTION_MONTHS=12)
+    def test_expired_partition_dropped_and_counters_adjusted(self):
+        old_month = add_months(self.current, -13)
+        create_partition("notifications", old_month)
+        with self.captureOnCommitCallbacks(execute=True):
+            create_notifications(
+                [Notification(user=self.user, type="project_updated", payload={}) for _ in range(2)]
+            )
+        Notification.objects.filter(pk=Notification.objects.first().pk).update(created_at=old_month)
+        # Fire the deferred FK checks queued by the row move, as a commit would.
+        connection.check_constraints()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            call_command("maintain_partitions", stdout=StringIO())
+
+        self.assertNotIn(old_month, list_partitions("notifications"))
+        self.assertEqual(Notification.objects.count(), 1)
+        self.assertEqual(get_unread_counts(self.user.pk)["notifications"], 1)
@@ -0,0 +1,17 @@
+from django.urls import path
+
+from .views import (
+    NotificationListAPIView,
+    NotificationMarkReadAPIView,
+    UnreadCountsAPIView,
+    event_stream,
+)
+
+app_name = "notifications"
+
+urlpatterns = [
+    path("notifications/", NotificationListAPIView.as_view(), name="notification-list"),
+    path("notifications/unread-counts/", UnreadCountsAPIView.as_view(), name="unread-counts"),
+    path("notifications/mark-read/", NotificationMarkReadAPIView.as_view(), name="mark-read"),
+    path("events/", event_stream, name="event-stream"),
+]
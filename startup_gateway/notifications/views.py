@@ -1,3 +1,131 @@
-from django.shortcuts import render
+import asyncio
+import json
 
-# Create your views here.
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.handlers.asgi import ASGIRequest
+from django.http import JsonResponse, StreamingHttpResponse
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework.generics import ListAPIView
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from rest_framework_simplejwt.exceptions import InvalidToken
+
+from users.authentication import CachedJWTAuthentication
+from .models import Notification
+from .pagination import NotificationPagination
+from .realtime import get_broker
+from .serializers import NotificationMarkReadSerializer, NotificationSerializer
+from .services import get_unread_counts, mark_notifications_read
+
+
+class NotificationListAPIView(ListAPIView):
+    serializer_class = NotificationSerializer
+    pagination_class = NotificationPagination
+    permission_classes = [IsAuthenticated]
+
+    def get_queryset(self):
+        queryset = Notification.objects.filter(user_id=self.request.user.pk)
+
+        if self.request.query_params.get("unread") in ("1", "true"):
+            queryset = queryset.filter(is_read=False)
+
+        return queryset
+
+
+class UnreadCountsAPIView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request):
+        return Response(get_unread_counts(request.user.pk), status=status.HTTP_200_OK)
+
+
+class NotificationMarkReadAPIView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request):
+        serializer = NotificationMarkReadSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        updated = mark_notifications_read(
+            request.user.pk,
+            ids=serializer.validated_data.get("ids"),
+            **serializer.validated_data.get("up_to", {}),
+        )
+        return Response({"updated": updated}, status=status.HTTP_200_OK)
+
+
+def _authenticate_stream(request):
+    """
+    EventSource cannot send headers, so the access token may also come in
+    the ``token`` query parameter.
+    """
+    authentication = CachedJWTAuthentication()
+    try:
+        raw_token = request.GET.get("token")
+        if raw_token:
+            return authentication.get_user(authentication.get_validated_token(raw_token))
+
+        result = authentication.authenticate(request)
+    except (AuthenticationFailed, InvalidToken):
+        return None
+    return result[0] if result else None
+
+
+async def _event_stream(user_id):
+    broker = get_broker()
+    await sync_to_async(broker.start)()
+    entry = broker.hub.subscribe(user_id)
+    _, queue = entry
+    heartbeat = int(getattr(settings, "REALTIME_HEARTBEAT_SECONDS", 25))
+
+    try:
+        yield "retry: 5000\n\n"
+        while True:
+            try:
+                event = await asyncio.wait_for(queue.get(), timeout=heartbeat)
+            except asyncio.TimeoutError:
+                yield ": keep-alive\n\n"
+                continue
+            yield f"event: {event['type']}\ndata: {json.dumps(event, default=str)}\n\n"
+    finally:
+        broker.hub.unsubscribe(user_id, entry)
+
+
+async def event_stream(request):
+    """
+    Server-Sent Events stream of the caller's new messages and
+    notifications. Served as an async generator, so under an ASGI server an
+    idle client costs a coroutine rather than a thread.
+    """
+    if request.method != "GET":
+        return JsonResponse({"detail": "Method not allowed."}, status=status.HTTP_405_METHOD_NOT_ALLOWED)
+
+    # WSGI drains an async iterator before sending anything, so an endless
+    # stream would hang and pin a worker; point the client at polling.
+    if not isinstance(request, ASGIRequest):
+        response = JsonResponse(
+            {
+                "detail": "Event stream requires an ASGI server; poll unread counts instead.",
+                "poll_url": reverse("notifications:unread-counts"),
+            },
+            status=status.HTTP_503_SERVICE_UNAVAILABLE,
+        )
+        response["Retry-After"] = str(int(getattr(settings, "REALTIME_HEARTBEAT_SECONDS", 25)))
+        return response
+
+    user = await sync_to_async(_authenticate_stream)(request)
+    if user is None:
+        return JsonResponse(
+            {"detail": "Authentication credentials were not provided."},
+            status=status.HTTP_401_UNAUTHORIZED,
+        )
+
+    response = StreamingHttpResponse(_event_stream(user.pk), content_type="text/event-stream")
+    response["Cache-Control"] = "no-cache"
+    response["X-Accel-Buffering"] = "no"
+    return response
@@ -0,0 +1,25 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from projects.similarity import build_similar_projects
+
+
+class Command(BaseCommand):
+    help = "Refresh the similar-projects lookup table for projects whose tags changed."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--full", action="store_true", help="Recompute every project.")
+        parser.add_argument(
+            "--top-k",
+            type=int,
+            default=getattr(settings, "SIMILAR_PROJECTS_TOP_K", 5),
+        )
+        parser.add_argument("--batch-size", type=int, default=500)
+
+    def handle(self, *args, **options):
+        refreshed = build_similar_projects(
+            full=options["full"],
+            top_k=options["top_k"],
+            batch_size=options["batch_size"],
+        )
+        self.stdout.write(self.style.SUCCESS(f"Refreshed similar projects for {refreshed} projects."))
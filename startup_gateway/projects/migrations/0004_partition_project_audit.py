@@ -0,0 +1,20 @@
+# Generated by Django 5.2.10 on 2026-10-19 11:06
+
+from django.db import migrations
+
+from startup_gateway.partitioning import convert_to_partitioned
+
+
+def partition_project_audit(apps, schema_editor):
+    convert_to_partitioned(schema_editor, apps.get_model('projects', 'ProjectAudit'))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0003_project_is_deleted'),
+    ]
+
+    operations = [
+        migrations.RunPython(partition_project_audit),
+    ]
@@ -0,0 +1,40 @@
+# Generated by Django 5.2.10 on 2026-10-19 11:17
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0004_partition_project_audit'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ProjectSimilarityState',
+            fields=[
+                ('project', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='similarity_state', serialize=False, to='projects.project')),
+                ('tag_ids', models.JSONField(default=list)),
+                ('refreshed_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'db_table': 'project_similarity_states',
+            },
+        ),
+        migrations.CreateModel(
+            name='ProjectSimilarity',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('score', models.FloatField()),
+                ('rank', models.PositiveSmallIntegerField()),
+                ('project', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='similar_projects', to='projects.project')),
+                ('similar_project', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='projects.project')),
+            ],
+            options={
+                'db_table': 'project_similarities',
+                'indexes': [models.Index(fields=['project', 'rank'], name='project_sim_project_13ce3c_idx')],
+                'constraints': [models.UniqueConstraint(fields=('project', 'similar_project'), name='unique_project_similarity')],
+            },
+        ),
+    ]
@@ -114,4 +114,54 @@ class ProjectAudit(models.Model):
     changes = models.JSONField()
 
     class Meta:
-        db_table = 'project_audit'
\ No newline at end of file
+        db_table = 'project_audit'
+
+class ProjectSimilarity(models.Model):
+    """
+    Precomputed nearest neighbours of a project by shared tags, built by
+    the build_similar_projects command.
+    """
+
+    project = models.ForeignKey(
+        Project,
+        on_delete=models.CASCADE,
+        related_name="similar_projects"
+    )
+    similar_project = models.ForeignKey(
+        Project,
+        on_delete=models.CASCADE,
+        related_name="+"
+    )
+    score = models.FloatField()
+    rank = models.PositiveSmallIntegerField()
+
+    class Meta:
+        db_table = 'project_similarities'
+        constraints = [
+            models.UniqueConstraint(
+                fields=["project", "similar_project"],
+                name="unique_project_similarity"
+            )
+        ]
+        indexes = [
+            models.Index(fields=["project", "rank"]),
+        ]
+
+
+class ProjectSimilarityState(models.Model):
+    """
+    The tag ids a project's neighbours were last computed from; lets the
+    builder refresh only projects whose tags changed.
+    """
+
+    project = models.OneToOneField(
+        Project,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="similarity_state"
+    )
+    tag_ids = models.JSONField(default=list)
+    refreshed_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = 'project_similarity_states'
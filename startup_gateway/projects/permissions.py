@@ -1,18 +1,28 @@
 from rest_framework.permissions import BasePermission, SAFE_METHODS
 
+from users.utils import cached_profile_id
+
+
+def is_startup_owner(user, startup_profile_id):
+    if not (user and user.is_authenticated):
+        return False
+
+    profile_id = cached_profile_id(user, "startup")
+    return profile_id is not None and profile_id == startup_profile_id
+
+
 class IsOwnerOrReadOnly(BasePermission):
     message = "Access denied."
 
     def has_object_permission(self, request, view, obj):
         user = getattr(request, "user", None)
-        is_owner = bool(user and user.is_authenticated and getattr(obj.startup_profile, "user", None) == user)
 
         if request.method in SAFE_METHODS:
             if getattr(obj, "visibility", "public") == "public":
                 return True
 
             self.message = "Only owner can view private/unlisted project."
-            return is_owner
+            return is_startup_owner(user, obj.startup_profile_id)
 
         if request.method == "DELETE":
             self.message = "Only owner can delete project."
@@ -21,5 +31,5 @@ class IsOwnerOrReadOnly(BasePermission):
         else:
             self.message = "Only owner can modify project."
 
-        return is_owner
+        return is_startup_owner(user, obj.startup_profile_id)
 
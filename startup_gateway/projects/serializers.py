@@ -1,6 +1,6 @@
 from rest_framework import serializers
 
-from .models import Project
+from .models import Project, ProjectSimilarity, ProjectVisibility
 
 class ProjectSerializer(serializers.ModelSerializer):
     class Meta:
@@ -12,10 +12,42 @@ class ProjectSerializer(serializers.ModelSerializer):
         }
 
 class ProjectDetailsSerializer(serializers.ModelSerializer):
+    similar = serializers.SerializerMethodField()
+
     class Meta:
         model = Project
-        fields = ["id", "slug", "title", "short_description", "description", "thumbnail_url", "status", "raised_amount", "target_amount", "currency", "visibility", "created_at", "updated_at", "startup_profile_id"]
-        read_only_fields = ["id", "created_at", "updated_at", "startup_profile_id", "raised_amount"]
+        fields = ["id", "slug", "title", "short_description", "description", "thumbnail_url", "status", "raised_amount", "target_amount", "currency", "visibility", "created_at", "updated_at", "startup_profile_id", "similar"]
+        read_only_fields = ["id", "created_at", "updated_at", "startup_profile_id", "raised_amount", "similar"]
         extra_kwargs = {
             "status": {"required": False},
-        }
\ No newline at end of file
+        }
+
+    def get_similar(self, obj):
+        rows = (
+            ProjectSimilarity.objects
+            .filter(
+                project_id=obj.pk,
+                similar_project__is_deleted=False,
+                similar_project__visibility=ProjectVisibility.PUBLIC,
+            )
+            .order_by("rank")
+            .values(
+                "score",
+                "similar_project_id",
+                "similar_project__title",
+                "similar_project__slug",
+                "similar_project__thumbnail_url",
+                "similar_project__startup_profile_id",
+            )
+        )
+        return [
+            {
+                "id": str(row["similar_project_id"]),
+                "title": row["similar_project__title"],
+                "slug": row["similar_project__slug"],
+                "thumbnail_url": row["similar_project__thumbnail_url"],
+                "startup_profile_id": row["similar_project__startup_profile_id"],
+                "score": round(row["score"], 4),
+            }
+            for row in rows
+        ]
@@ -0,0 +1,31 @@
+from decimal import Decimal
+
+from django.db.models.signals import post_init, post_save
+from django.dispatch import receiver
+
+from startup_gateway.model_state import loaded_value
+from .models import Project, ProjectAudit
+
+
+# raised_amount is read-only in the API, so funding changes are audited
+# wherever the model is saved; the daily rollups read them from here.
+@receiver(post_init, sender=Project)
+def remember_raised_amount(sender, instance, **kwargs):
+    instance._saved_raised_amount = loaded_value(instance, "raised_amount")
+
+
+@receiver(post_save, sender=Project)
+def audit_raised_amount(sender, instance, created, raw=False, update_fields=None, **kwargs):
+    if raw or (update_fields is not None and "raised_amount" not in update_fields):
+        return
+
+    old = 0 if created else instance._saved_raised_amount
+    new = loaded_value(instance, "raised_amount")
+    instance._saved_raised_amount = new
+    if new is None or old is None or Decimal(new) == Decimal(old):
+        return
+
+    ProjectAudit.objects.create(
+        project=instance,
+        changes={"raised_amount": [f"{Decimal(old):.2f}", f"{Decimal(new):.2f}"]},
+    )
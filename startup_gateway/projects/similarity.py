@@ -0,0 +1,151 @@
+"""
+Similar projects by shared tags.
+
+Projects are compared by cosine similarity over their tag sets, with each
+tag weighted by its inverse document frequency so rare tags count for more
+than ubiquitous ones. Candidates come from a tag -> projects inverted
+index, so only pairs sharing at least one tag are ever scored.
+"""
+
+import heapq
+import math
+from collections import defaultdict
+
+from django.conf import settings
+from django.db import connection, transaction
+
+from .models import ProjectSimilarity, ProjectSimilarityState
+
+
+TAG_SETS_SQL = """
+SELECT p.id, pt.tag_id
+FROM projects AS p
+LEFT JOIN projects_tags AS pt ON pt.project_id = p.id
+WHERE NOT p.is_deleted AND p.visibility = 'public'
+"""
+
+
+def load_tag_sets():
+    """Return ``{project_id: frozenset(tag_ids)}`` for public projects."""
+    tag_sets = defaultdict(set)
+    with connection.cursor() as cursor:
+        cursor.execute(TAG_SETS_SQL)
+        for project_id, tag_id in cursor.fetchall():
+            tags = tag_sets[project_id]
+            if tag_id is not None:
+                tags.add(tag_id)
+    return {project_id: frozenset(tags) for project_id, tags in tag_sets.items()}
+
+
+class TagIndex:
+    def __init__(self, tag_sets):
+        self.tag_sets = tag_sets
+        self.projects_by_tag = defaultdict(list)
+        for project_id, tags in tag_sets.items():
+            for tag_id in tags:
+                self.projects_by_tag[tag_id].append(project_id)
+
+        total = len(tag_sets)
+        self.weights = {
+            tag_id: math.log(1 + total / len(projects))
+            for tag_id, projects in self.projects_by_tag.items()
+        }
+        self.norms = {
+            project_id: math.sqrt(sum(self.weights[tag_id] ** 2 for tag_id in tags))
+            for project_id, tags in tag_sets.items()
+        }
+
+    def neighbours(self, project_id, top_k):
+        """Top ``top_k`` ``(score, project_id)`` pairs for a project."""
+        tags = self.tag_sets.get(project_id)
+        if not tags:
+            return []
+
+        overlap = defaultdict(float)
+        for tag_id in tags:
+            weight = self.weights[tag_id] ** 2
+            for other_id in self.projects_by_tag[tag_id]:
+                if other_id != project_id:
+                    overlap[other_id] += weight
+
+        norm = self.norms[project_id]
+        return heapq.nlargest(
+            top_k,
+            ((dot / (norm * self.norms[other_id]), other_id) for other_id, dot in overlap.items()),
+            key=lambda pair: (pair[0], str(pair[1])),
+        )
+
+
+def _affected_projects(tag_sets, previous):
+    """
+    Projects whose neighbour lists may have changed since the last build:
+    those whose tags changed, plus any project sharing a tag with them
+    before or after the change.
+    """
+    changed = {
+        project_id
+        for project_id in set(tag_sets) | set(previous)
+        if tag_sets.get(project_id) != previous.get(project_id)
+    }
+    touched_tags = set()
+    for project_id in changed:
+        touched_tags |= tag_sets.get(project_id, frozenset())
+        touched_tags |= previous.get(project_id, frozenset())
+
+    affected = {project_id for project_id in changed if project_id in tag_sets}
+    affected |= {project_id for project_id, tags in tag_sets.items() if tags & touched_tags}
+    return changed, affected
+
+
+def build_similar_projects(full=False, top_k=None, batch_size=500):
+    """
+    Refresh the similar-projects lookup table. Only projects affected by
+    tag changes since the last run are recomputed unless ``full`` is set;
+    tag weights of untouched projects may then lag until the next full
+    build. Returns the number of projects recomputed.
+    """
+    top_k = top_k or int(getattr(settings, "SIMILAR_PROJECTS_TOP_K", 5))
+    tag_sets = load_tag_sets()
+    previous = {
+        project_id: frozenset(tag_ids)
+        for project_id, tag_ids in ProjectSimilarityState.objects.values_list("project_id", "tag_ids")
+    }
+
+    if full:
+        changed = set(tag_sets) | set(previous)
+        affected = set(tag_sets)
+    else:
+        changed, affected = _affected_projects(tag_sets, previous)
+
+    index = TagIndex(tag_sets)
+    removed = [project_id for project_id in changed if project_id not in tag_sets]
+
+    with transaction.atomic():
+        ProjectSimilarity.objects.filter(project_id__in=removed).delete()
+        ProjectSimilarityState.objects.filter(project_id__in=removed).delete()
+
+    affected = sorted(affected, key=str)
+    for start in range(0, len(affected), batch_size):
+        batch = affected[start:start + batch_size]
+        rows = [
+            ProjectSimilarity(project_id=project_id, similar_project_id=other_id, score=score, rank=rank)
+            for project_id in batch
+            for rank, (score, other_id) in enumerate(index.neighbours(project_id, top_k), start=1)
+        ]
+        states = [
+            ProjectSimilarityState(project_id=project_id, tag_ids=sorted(tag_sets[project_id]))
+            for project_id in batch
+            if project_id in changed
+        ]
+
+        with transaction.atomic():
+            ProjectSimilarity.objects.filter(project_id__in=batch).delete()
+            ProjectSimilarity.objects.bulk_create(rows)
+            ProjectSimilarityState.objects.bulk_create(
+                states,
+                update_conflicts=True,
+                unique_fields=["project"],
+                update_fields=["tag_ids", "refreshed_at"],
+            )
+
+    return len(affected)
@@ -6,8 +6,10 @@ from rest_framework_simplejwt.tokens import AccessToken
 
 from django.contrib.auth import get_user_model
 
+from notifications.models import FanoutEvent
 from startups.models import StartupProfile
-from projects.models import Project
+from projects.models import Project, ProjectAudit, ProjectSimilarity, ProjectSimilarityState, Tag
+from projects.similarity import build_similar_projects
 
 
 class ProjectsAPITests(TestCase):
@@ -94,6 +96,31 @@ class ProjectsAPITests(TestCase):
         project.refresh_from_db()
         self.assertEqual(project.short_description, "updated")
 
+        audit = ProjectAudit.objects.get(project=project)
+        self.assertEqual(audit.user, self.owner_user)
+        self.assertEqual(audit.changes, {"short_description": ["old", "updated"]})
+
+    def test_noop_update_notifies_nobody(self):
+        project = Project.objects.create(
+            startup_profile=self.startup,
+            title="Chairs",
+            slug="chairs",
+            short_description="old",
+            description="old desc",
+            target_amount="100.00",
+        )
+        self.auth_as(self.owner_user)
+        url = reverse("projects:project-rud", kwargs={"pk": project.pk})
+
+        self.client.patch(url, data={"short_description": "old"}, format="json")
+        self.assertFalse(FanoutEvent.objects.exists())
+
+        self.client.patch(url, data={"short_description": "new"}, format="json")
+        self.client.patch(url, data={"short_description": "new"}, format="json")
+        event = FanoutEvent.objects.get()
+        self.assertEqual(event.key, f"project:{project.pk}:updated:{ProjectAudit.objects.get().pk}")
+        self.assertEqual(event.payload["changed_fields"], ["short_description"])
+
     def test_non_owner_update_forbidden(self):
         project = Project.objects.create(
             startup_profile=self.startup,
@@ -115,4 +142,62 @@ class ProjectsAPITests(TestCase):
 
         self.assertEqual(resp.status_code, status.HTTP_403_FORBIDDEN)
         project.refresh_from_db()
-        self.assertEqual(project.short_description, "orig")
\ No newline at end of file
+        self.assertEqual(project.short_description, "orig")
+
+
+class SimilarProjectsTests(TestCase):
+    def setUp(self):
+        User = get_user_model()
+        self.startup = StartupProfile.objects.create(user=User.objects.create_user(username="owner"))
+        self.wood, self.chairs, self.lamps, self.common = (
+            Tag.objects.create(name=name) for name in ("wood", "chairs", "lamps", "handmade")
+        )
+
+    def make_project(self, slug, *tags):
+        project = Project.objects.create(
+            startup_profile=self.startup,
+            title=slug.title(),
+            slug=slug,
+            short_description="short",
+            description="long",
+            target_amount="100.00",
+        )
+        project.tags.add(*tags)
+        return project
+
+    def neighbours(self, project):
+        return list(
+            ProjectSimilarity.objects.filter(project=project).order_by("rank").values_list("similar_project_id", flat=True)
+        )
+
+    def test_projects_ranked_by_shared_rare_tags(self):
+        chairs = self.make_project("chairs", self.wood, self.chairs, self.common)
+        stools = self.make_project("stools", self.wood, self.chairs, self.common)
+        lamps = self.make_project("lamps", self.lamps, self.common)
+        self.make_project("untagged")
+
+        build_similar_projects()
+
+        self.assertEqual(self.neighbours(chairs), [stools.pk, lamps.pk])
+
+        resp = self.client.get(reverse("projects:project-rud", kwargs={"pk": chairs.pk}))
+        self.assertEqual([item["id"] for item in resp.data["similar"]], [str(stools.pk), str(lamps.pk)])
+
+    def test_incremental_refresh_only_touches_affected_projects(self):
+        chairs = self.make_project("chairs", self.wood)
+        stools = self.make_project("stools", self.wood)
+        lamps = self.make_project("lamps", self.lamps)
+        self.assertEqual(build_similar_projects(), 3)
+        self.assertEqual(build_similar_projects(), 0)
+
+        lamps.tags.add(self.wood)
+
+        self.assertEqual(build_similar_projects(), 3)
+        self.assertIn(lamps.pk, self.neighbours(chairs))
+        self.assertEqual(ProjectSimilarityState.objects.get(project=lamps).tag_ids, sorted([self.wood.pk, self.lamps.pk]))
+
+        stools.is_deleted = True
+        stools.save()
+        build_similar_projects()
+        self.assertNotIn(stools.pk, self.neighbours(chairs))
+        self.assertFalse(ProjectSimilarityState.objects.filter(project=stools).exists())
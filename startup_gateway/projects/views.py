@@ -9,10 +9,38 @@ from rest_framework.response import Response
 from rest_framework import status
 
 
+from analytics.services import record_view
+from notifications.fanout import notify_startup_followers
 from startups.models import StartupProfile
-from .models import Project
+from .models import Project, ProjectAudit, ProjectVisibility
 from .serializers import ProjectSerializer, ProjectDetailsSerializer
-from .permissions import IsOwnerOrReadOnly
+from .permissions import IsOwnerOrReadOnly, is_startup_owner
+
+
+def notify_project_followers(project, event, occurrence=None, **payload):
+    """
+    ``occurrence`` tells repeated events of one kind apart; sending the
+    same event and occurrence again is a no-op.
+    """
+    if project.visibility != ProjectVisibility.PUBLIC:
+        return
+
+    key = f"project:{project.pk}:{event}"
+    if occurrence is not None:
+        key = f"{key}:{occurrence}"
+
+    notify_startup_followers(
+        project.startup_profile_id,
+        key=key,
+        notification_type=f"project_{event}",
+        subject_key=f"project:{project.pk}",
+        payload={
+            "project_id": str(project.pk),
+            "startup_profile_id": project.startup_profile_id,
+            "title": project.title,
+            **payload,
+        },
+    )
 
 
 class StartUpProjectsListCreateAPIView(ListCreateAPIView):
@@ -32,10 +60,11 @@ class StartUpProjectsListCreateAPIView(ListCreateAPIView):
     def perform_create(self, serializer):
         startup = get_object_or_404(StartupProfile, id=self.kwargs["startup_id"])
 
-        if startup.user != self.request.user:
+        if not is_startup_owner(self.request.user, startup.pk):
             raise PermissionDenied("Only owner can create projects for this startup.")
 
-        serializer.save(startup_profile=startup)
+        project = serializer.save(startup_profile=startup)
+        notify_project_followers(project, "published")
 
     @transaction.atomic
     def create(self, request, *args, **kwargs):
@@ -67,6 +96,33 @@ class ProjectRUDAPIView(RetrieveUpdateDestroyAPIView):
 
         return qs.filter(visibility="public")
 
+    def retrieve(self, request, *args, **kwargs):
+        instance = self.get_object()
+        record_view("project", instance.pk)
+        return Response(self.get_serializer(instance).data)
+
+    @transaction.atomic
+    def perform_update(self, serializer):
+        before = {field: getattr(serializer.instance, field) for field in serializer.validated_data}
+        project = serializer.save()
+
+        changes = {
+            field: [str(old), str(getattr(project, field))]
+            for field, old in before.items()
+            if getattr(project, field) != old
+        }
+        if not changes:
+            return
+
+        audit = ProjectAudit.objects.create(
+            project=project,
+            user=self.request.user if self.request.user.is_authenticated else None,
+            changes=changes,
+        )
+        # One notification per recorded change, not per save: a no-op update
+        # returned above and notifies nobody.
+        notify_project_followers(project, "updated", audit.pk, changed_fields=sorted(changes))
+
     def perform_destroy(self, instance):
         instance.is_deleted = True
         instance.save(update_fields=["is_deleted"])
\ No newline at end of file
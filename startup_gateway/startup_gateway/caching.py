@@ -0,0 +1,98 @@
+"""
+Single-flight cache reads for hot keys.
+
+When a popular entry expires, every worker that misses would recompute it
+at once. ``single_flight`` lets exactly one of them recompute: the worker
+that wins ``cache.add`` on a short lease key rebuilds the value while the
+rest wait for it (on a hard miss) or keep serving the stale copy (stale-
+while-revalidate). Entries are stored with their soft expiry and the time
+they took to compute, and each read may refresh early with a probability
+that grows as expiry nears (probabilistic early expiration), so hot keys
+are usually rebuilt before they ever go stale.
+
+Leases and entries live in the default cache, so coalescing spans the
+fleet only when that cache is shared (REDIS_URL); with the per-process
+LocMemCache fallback every process rebuilds on its own.
+"""
+
+import math
+import random
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+
+
+def _setting(name, default):
+    return getattr(settings, name, default)
+
+
+def _lease_key(key):
+    return f"{key}:lease"
+
+
+def _compute_and_store(key, compute, ttl, stale_ttl):
+    started = time.monotonic()
+    value = compute()
+    delta = time.monotonic() - started
+    cache.set(key, (value, time.time() + ttl, delta), ttl + stale_ttl)
+    return value
+
+
+def _should_refresh(expires_at, delta, beta):
+    # XFetch: refresh early once now - delta * beta * ln(U) passes expiry.
+    return time.time() - delta * beta * math.log(1 - random.random()) >= expires_at
+
+
+def single_flight(key, compute, ttl, stale_ttl=None, beta=1.0):
+    """
+    Return the cached value of ``key``, calling ``compute`` on a miss in at
+    most one worker at a time. Values stay fresh for ``ttl`` seconds and
+    may be served stale for ``stale_ttl`` more while one worker refreshes.
+    """
+    stale_ttl = _setting("SINGLE_FLIGHT_STALE_SECONDS", 60) if stale_ttl is None else stale_ttl
+    lease_seconds = _setting("SINGLE_FLIGHT_LEASE_SECONDS", 10)
+
+    entry = cache.get(key)
+    if entry is not None:
+        value, expires_at, delta = entry
+        if not _should_refresh(expires_at, delta, beta):
+            return value
+        if not cache.add(_lease_key(key), 1, lease_seconds):
+            return value
+        try:
+            return _compute_and_store(key, compute, ttl, stale_ttl)
+        finally:
+            cache.delete(_lease_key(key))
+
+    deadline = time.monotonic() + lease_seconds
+    while not cache.add(_lease_key(key), 1, lease_seconds):
+        # Another worker is computing; use its result once it lands.
+        time.sleep(_setting("SINGLE_FLIGHT_POLL_SECONDS", 0.05))
+        entry = cache.get(key)
+        if entry is not None:
+            return entry[0]
+        if time.monotonic() >= deadline:
+            # The lease holder is stuck or gone; compute without it.
+            return _compute_and_store(key, compute, ttl, stale_ttl)
+
+    try:
+        # The previous lease holder may have stored it just before releasing.
+        entry = cache.get(key)
+        if entry is not None:
+            return entry[0]
+        return _compute_and_store(key, compute, ttl, stale_ttl)
+    finally:
+        cache.delete(_lease_key(key))
+
+
+def get_fresh_many(keys, beta=1.0):
+    """
+    ``{key: value}`` for the entries of ``keys`` that need no refresh, in
+    one round trip. Pass the others to ``single_flight``.
+    """
+    return {
+        key: value
+        for key, (value, expires_at, delta) in cache.get_many(list(keys)).items()
+        if not _should_refresh(expires_at, delta, beta)
+    }
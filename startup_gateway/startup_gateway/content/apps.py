@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class ContentConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'startup_gateway.content'
+
+    def ready(self):
+        from . import signals  # noqa: F401
@@ -0,0 +1,98 @@
+"""
+Backend-for-frontend payload of the home page.
+
+GET /api/home/ bundles what the home page used to fetch in separate
+requests: the landing content, a page of featured (trending) startup
+cards and the most used tags. Each part is an independently cached fragment of
+rendered JSON, so the response is stitched together from bytes. Fragments
+missing from the cache (or due for refresh) are built concurrently on a
+small pool (or inline when HOME_FRAGMENT_WORKERS is 0), each by a single
+worker across processes.
+"""
+
+from django.conf import settings
+from django.db import connections
+from django.db.models import Count, F, Q
+from rest_framework.renderers import JSONRenderer
+
+from projects.models import ProjectVisibility, Tag
+from startup_gateway.caching import get_fresh_many, single_flight
+from startup_gateway.executors import executor_workers, get_executor
+from startups.cards import get_startup_cards
+from startups.models import StartupProfile
+from startups.pagination import StartupListPagination
+from .landing_cache import get_landing_payload
+
+
+def build_featured_startups():
+    ids = (
+        StartupProfile.objects
+        .order_by(F("trending_score__score").desc(nulls_last=True), "-id")
+        .values_list("id", flat=True)
+        [:StartupListPagination.page_size]
+    )
+    return JSONRenderer().render(get_startup_cards(list(ids)))
+
+
+def build_top_tags():
+    tags = (
+        Tag.objects
+        .annotate(projects_count=Count(
+            "projects",
+            filter=Q(projects__is_deleted=False, projects__visibility=ProjectVisibility.PUBLIC),
+        ))
+        .filter(projects_count__gt=0)
+        .order_by("-projects_count", "name")
+        .values("id", "name", "projects_count")
+        [:int(getattr(settings, "HOME_TOP_TAGS", 12))]
+    )
+    return JSONRenderer().render(list(tags))
+
+
+# Response key -> builder of its rendered JSON, cached under home:<key>.
+FRAGMENTS = {
+    "featured_startups": build_featured_startups,
+    "top_tags": build_top_tags,
+}
+
+
+def _fragment_key(name):
+    return f"home:{name}"
+
+
+def _build(name):
+    return single_flight(_fragment_key(name), FRAGMENTS[name], int(getattr(settings, "HOME_FRAGMENT_TTL", 60)))
+
+
+def _build_in_thread(name):
+    try:
+        return _build(name)
+    finally:
+        connections.close_all()
+
+
+def get_home_fragments():
+    """Return ``{name: rendered JSON}`` for every part of the home payload."""
+    keys = {_fragment_key(name): name for name in FRAGMENTS}
+    fragments = {keys[key]: body for key, body in get_fresh_many(keys).items()}
+    missing = [name for name in FRAGMENTS if name not in fragments]
+
+    futures = {}
+    if missing and executor_workers("HOME_FRAGMENT_WORKERS", 2) > 0:
+        executor = get_executor("home-fragment", "HOME_FRAGMENT_WORKERS", 2)
+        futures = {name: executor.submit(_build_in_thread, name) for name in missing}
+
+    # The landing payload has its own cache; read it while the pool works.
+    fragments["landing_content"] = get_landing_payload()[0]
+
+    fragments.update({name: futures[name].result() if futures else _build(name) for name in missing})
+    return fragments
+
+
+def render_home():
+    """The home payload as JSON bytes, without re-rendering any fragment."""
+    fragments = get_home_fragments()
+    return b"{" + b",".join(
+        b'"' + name.encode() + b'":' + fragments[name]
+        for name in ("landing_content", "featured_startups", "top_tags")
+    ) + b"}"
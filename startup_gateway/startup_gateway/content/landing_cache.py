@@ -0,0 +1,92 @@
+"""
+Pre-rendered landing page payload.
+
+The landing endpoint is the busiest anonymous route, so its JSON is
+rendered once and the bytes are kept both in process memory and in the
+shared cache, under a key that embeds the current landing version. Saving
+LandingContent or refreshing the platform stats replaces the version,
+which orphans every cached copy at once. A hit costs one cache read for
+the version and no ORM or renderer work; a miss is rebuilt by a single
+worker (``single_flight``).
+
+The version and payload must live in the shared cache (REDIS_URL) so that
+every process behind the load balancer serves the same bytes and ETag and
+If-None-Match revalidation holds across them; a process only keeps its
+own copy while the shared version is unchanged.
+"""
+
+import hashlib
+import threading
+import time
+import uuid
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.utils import OperationalError, ProgrammingError
+from rest_framework.renderers import JSONRenderer
+
+from analytics.platform_stats import get_platform_stats
+from startup_gateway.caching import single_flight
+from .landing_content import LANDING_CONTENT
+from .models import LandingContent
+
+
+VERSION_KEY = "landing:version"
+
+_local_lock = threading.Lock()
+_local = {}
+
+
+def _cache_ttl():
+    return int(getattr(settings, "LANDING_CACHE_TTL", 60))
+
+
+def _payload_key(version):
+    return f"landing:payload:{version}"
+
+
+def current_version():
+    version = cache.get(VERSION_KEY)
+    if version is None:
+        cache.add(VERSION_KEY, uuid.uuid4().hex, None)
+        version = cache.get(VERSION_KEY)
+    return version
+
+
+def invalidate_landing():
+    cache.set(VERSION_KEY, uuid.uuid4().hex, None)
+
+
+def build_payload():
+    """Render the landing payload. Returns ``(body, etag)``."""
+    try:
+        obj = LandingContent.objects.order_by("-updated_at").first()
+    except (OperationalError, ProgrammingError):
+        obj = None
+
+    try:
+        stats = get_platform_stats()
+    except (OperationalError, ProgrammingError):
+        stats = None
+
+    data = obj.as_dict() if obj else LANDING_CONTENT
+    body = JSONRenderer().render({**data, "stats": stats})
+    return body, f'"{hashlib.sha1(body).hexdigest()}"'
+
+
+def get_landing_payload():
+    """Return ``(body, etag)``, from process memory when possible."""
+    version = current_version()
+    now = time.monotonic()
+
+    with _local_lock:
+        entry = _local.get(version)
+    if entry is not None and entry[0] > now:
+        return entry[1], entry[2]
+
+    payload = single_flight(_payload_key(version), build_payload, _cache_ttl())
+
+    with _local_lock:
+        _local.clear()
+        _local[version] = (now + _cache_ttl(), *payload)
+    return payload
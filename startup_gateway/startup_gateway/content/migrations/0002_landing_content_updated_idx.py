@@ -0,0 +1,17 @@
+# Generated by Django 5.2.10 on 2026-10-19 11:33
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('content', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='landingcontent',
+            index=models.Index(fields=['-updated_at'], name='landing_content_updated_idx'),
+        ),
+    ]
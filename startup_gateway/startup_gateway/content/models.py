@@ -27,6 +27,11 @@ class LandingContent(models.Model):
     footer_links = models.JSONField(default=default_footer_links)
     updated_at = models.DateTimeField(auto_now=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=["-updated_at"], name="landing_content_updated_idx"),
+        ]
+
     def as_dict(self):
         return {
             "hero": self.hero,
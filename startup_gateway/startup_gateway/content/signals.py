@@ -0,0 +1,18 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from analytics.signals import platform_stats_refreshed
+from .landing_cache import invalidate_landing
+from .models import LandingContent
+
+
+@receiver(post_save, sender=LandingContent)
+@receiver(post_delete, sender=LandingContent)
+def invalidate_landing_on_content_change(sender, **kwargs):
+    transaction.on_commit(invalidate_landing)
+
+
+@receiver(platform_stats_refreshed)
+def invalidate_landing_on_stats_refresh(sender, **kwargs):
+    invalidate_landing()
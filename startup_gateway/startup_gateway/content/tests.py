@@ -1,14 +1,37 @@
+import threading
+import time
+from io import StringIO
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connections
+from django.test import override_settings
+from django.utils import timezone
 from rest_framework.test import APITestCase
 
+from analytics.models import StartupTrendingScore
+from projects.models import Project, ProjectStatus, Tag
+from startup_gateway.caching import single_flight
+from startups.models import StartupProfile
+
+from . import home, landing_cache
 from .landing_content import LANDING_CONTENT
 from .models import LandingContent
 
 
+User = get_user_model()
+
+
 class TestLandingContentApi(APITestCase):
+    def setUp(self):
+        cache.clear()
+
     def test_fallback_when_no_db_record(self):
         resp = self.client.get("/api/content/landing/")
         self.assertEqual(resp.status_code, 200)
-        self.assertEqual(resp.data, LANDING_CONTENT)
+        self.assertEqual({k: v for k, v in resp.json().items() if k != "stats"}, LANDING_CONTENT)
 
     def test_returns_db_content_when_exists(self):
         LandingContent.objects.create(
@@ -20,5 +43,235 @@ class TestLandingContentApi(APITestCase):
 
         resp = self.client.get("/api/content/landing/")
         self.assertEqual(resp.status_code, 200)
-        self.assertEqual(resp.data["hero"]["title"], "DB title")
-        self.assertIn("footer_links", resp.data)
+        self.assertEqual(resp.json()["hero"]["title"], "DB title")
+        self.assertIn("footer_links", resp.json())
+
+    def test_landing_stats_expose_one_refreshed_snapshot(self):
+        call_command("refresh_platform_stats", stdout=StringIO())
+
+        resp = self.client.get("/api/content/landing/stats/")
+
+        self.assertEqual(resp.status_code, 200)
+        self.assertNotIn("funding", resp.data)
+        self.assertEqual(resp.data["total_raised"], {"amount": "0.00", "currency": "UAH"})
+        self.assertIn("refreshed_at", resp.data)
+
+    def test_landing_payload_includes_refreshed_platform_stats(self):
+        owner = User.objects.create_user(username="owner", email="owner@example.com")
+        startup = StartupProfile.objects.create(user=owner, company_name="Handmade Co")
+        for slug, status in [("chairs", ProjectStatus.FUNDED), ("tables", ProjectStatus.ACTIVE)]:
+            Project.objects.create(
+                startup_profile=startup,
+                title=slug,
+                slug=slug,
+                short_description="Short",
+                description="Long",
+                raised_amount=100,
+                target_amount=100,
+                status=status,
+            )
+
+        # Stale until the view is refreshed.
+        self.assertEqual(self.client.get("/api/content/landing/").json()["stats"]["startups"], 0)
+
+        call_command("refresh_platform_stats", stdout=StringIO())
+        resp = self.client.get("/api/content/landing/")
+
+        stats = resp.json()["stats"]
+        self.assertEqual(stats["startups"], 1)
+        self.assertEqual(stats["projects"], 2)
+        self.assertEqual(stats["funded_projects"], 1)
+        self.assertEqual(stats["total_raised"], {"amount": "200.00", "currency": "UAH"})
+
+    def test_project_save_does_not_recompute_landing_total(self):
+        call_command("refresh_platform_stats", stdout=StringIO())
+        owner = User.objects.create_user(username="owner", email="owner@example.com")
+        startup = StartupProfile.objects.create(user=owner, company_name="Handmade Co")
+        Project.objects.create(
+            startup_profile=startup,
+            title="Chairs",
+            slug="chairs",
+            short_description="Short",
+            description="Long",
+            raised_amount=100,
+            target_amount=100,
+        )
+        cache.clear()
+
+        with patch("analytics.funding.compute_funding") as compute:
+            stats = self.client.get("/api/content/landing/").json()["stats"]
+
+        compute.assert_not_called()
+        self.assertEqual(stats["total_raised"], {"amount": "0.00", "currency": "UAH"})
+
+    def test_cache_hit_skips_orm_and_renderer(self):
+        first = self.client.get("/api/content/landing/")
+
+        with self.assertNumQueries(0), patch("rest_framework.renderers.JSONRenderer.render") as render:
+            second = self.client.get("/api/content/landing/")
+
+        render.assert_not_called()
+        self.assertEqual(second.content, first.content)
+        self.assertEqual(second["ETag"], first["ETag"])
+        self.assertEqual(second["Cache-Control"], "public, max-age=60")
+
+    def test_matching_etag_returns_not_modified(self):
+        etag = self.client.get("/api/content/landing/")["ETag"]
+
+        resp = self.client.get("/api/content/landing/", HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(resp.status_code, 304)
+        self.assertEqual(resp.content, b"")
+        self.assertEqual(resp["ETag"], etag)
+
+    def test_other_process_serves_the_shared_payload_and_etag(self):
+        first = self.client.get("/api/content/landing/")
+        # A second process starts with empty process memory.
+        landing_cache._local.clear()
+
+        with self.assertNumQueries(0), patch("rest_framework.renderers.JSONRenderer.render") as render:
+            second = self.client.get("/api/content/landing/", HTTP_IF_NONE_MATCH=first["ETag"])
+
+        render.assert_not_called()
+        self.assertEqual(second.status_code, 304)
+
+    def test_saving_content_replaces_cached_payload(self):
+        etag = self.client.get("/api/content/landing/")["ETag"]
+
+        with self.captureOnCommitCallbacks(execute=True):
+            LandingContent.objects.create(
+                hero={"title": "New title", "subtitle": "", "cta_text": "Join", "hero_images": []},
+                for_whom=[],
+                why_worth=[],
+                footer_links={"left": [], "right": []},
+            )
+
+        resp = self.client.get("/api/content/landing/", HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(resp.status_code, 200)
+        self.assertNotEqual(resp["ETag"], etag)
+        self.assertEqual(resp.json()["hero"]["title"], "New title")
+
+
+@override_settings(HOME_FRAGMENT_WORKERS=0)
+class TestHomeApi(APITestCase):
+    def setUp(self):
+        cache.clear()
+        design = Tag.objects.create(name="design")
+        wood = Tag.objects.create(name="wood")
+        self.startups = []
+        for i, tags in enumerate([[design, wood], [design], []]):
+            owner = User.objects.create_user(username=f"owner{i}", email=f"owner{i}@example.com")
+            startup = StartupProfile.objects.create(user=owner, company_name=f"Startup {i}")
+            project = Project.objects.create(
+                startup_profile=startup,
+                title=f"Project {i}",
+                slug=f"project-{i}",
+                short_description="Short",
+                description="Long",
+                target_amount=1000,
+            )
+            project.tags.set(tags)
+            self.startups.append(startup)
+
+        StartupTrendingScore.objects.create(
+            startup_profile=self.startups[0], score=5, computed_at=timezone.now()
+        )
+
+    def test_home_bundles_landing_featured_startups_and_tags(self):
+        resp = self.client.get("/api/home/")
+
+        self.assertEqual(resp.status_code, 200)
+        data = resp.json()
+        self.assertEqual(data["landing_content"]["hero"], LANDING_CONTENT["hero"])
+        self.assertEqual(
+            [startup["id"] for startup in data["featured_startups"]],
+            [self.startups[0].pk, self.startups[2].pk, self.startups[1].pk],
+        )
+        self.assertEqual(
+            data["top_tags"],
+            [
+                {"id": Tag.objects.get(name="design").pk, "name": "design", "projects_count": 2},
+                {"id": Tag.objects.get(name="wood").pk, "name": "wood", "projects_count": 1},
+            ],
+        )
+
+    def test_cached_fragments_are_not_rebuilt(self):
+        first = self.client.get("/api/home/")
+
+        with self.assertNumQueries(0):
+            second = self.client.get("/api/home/")
+
+        self.assertEqual(second.content, first.content)
+
+    @override_settings(HOME_FRAGMENT_WORKERS=2)
+    def test_missing_fragments_are_built_concurrently(self):
+        barrier = threading.Barrier(2, timeout=5)
+
+        def builder(name):
+            def build():
+                # Both builders must be running at once to pass the barrier.
+                barrier.wait()
+                return f'"{name}"'.encode()
+            return build
+
+        fragments = {name: builder(name) for name in home.FRAGMENTS}
+        with patch.dict(home.FRAGMENTS, fragments):
+            data = self.client.get("/api/home/").json()
+
+        self.assertEqual(data["featured_startups"], "featured_startups")
+        self.assertEqual(data["top_tags"], "top_tags")
+
+
+class TestSingleFlight(APITestCase):
+    def setUp(self):
+        cache.clear()
+
+    def run_concurrently(self, func, workers=8):
+        barrier = threading.Barrier(workers, timeout=5)
+        results = []
+
+        def run():
+            barrier.wait()
+            try:
+                results.append(func())
+            finally:
+                connections.close_all()
+
+        threads = [threading.Thread(target=run) for _ in range(workers)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return results
+
+    def test_concurrent_landing_misses_rebuild_once(self):
+        calls = []
+        build_payload = landing_cache.build_payload
+
+        def counting_build():
+            calls.append(1)
+            time.sleep(0.2)
+            return build_payload()
+
+        with patch.object(landing_cache, "build_payload", counting_build):
+            results = self.run_concurrently(lambda: landing_cache.get_landing_payload()[1])
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(len(results), 8)
+        self.assertEqual(len(set(results)), 1)
+
+    def test_expired_entry_is_served_stale_while_one_worker_refreshes(self):
+        single_flight("hot", lambda: "old", ttl=0, stale_ttl=60)
+        calls = []
+
+        def refresh():
+            calls.append(1)
+            time.sleep(0.2)
+            return "new"
+
+        results = self.run_concurrently(lambda: single_flight("hot", refresh, ttl=60))
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(results.count("new"), 1)
+        self.assertEqual(results.count("old"), 7)
+        self.assertEqual(single_flight("hot", refresh, ttl=60), "new")
@@ -1,6 +1,8 @@
 from django.urls import path
-from .views import landing_content
+from .views import home, landing_content, landing_stats
 
 urlpatterns = [
     path("api/content/landing/", landing_content, name="landing-content"),
+    path("api/content/landing/stats/", landing_stats, name="landing-stats"),
+    path("api/home/", home, name="home"),
 ]
\ No newline at end of file
@@ -1,17 +1,35 @@
-from django.db.utils import OperationalError, ProgrammingError
+from django.conf import settings
+from django.http import HttpResponse, HttpResponseNotModified
+from django.utils.http import parse_etags
 from rest_framework.decorators import api_view
 from rest_framework.response import Response
 
-from .landing_content import LANDING_CONTENT
-from .models import LandingContent
+from analytics.platform_stats import get_platform_stats
+from .home import render_home
+from .landing_cache import get_landing_payload
 
 
 @api_view(["GET"])
 def landing_content(request):
-    try:
-        obj = LandingContent.objects.order_by("-updated_at").first()
-    except (OperationalError, ProgrammingError):
-        obj = None
+    body, etag = get_landing_payload()
+    if_none_match = request.headers.get("If-None-Match", "")
+    if if_none_match == "*" or etag in parse_etags(if_none_match):
+        response = HttpResponseNotModified()
+    else:
+        response = HttpResponse(body, content_type="application/json")
 
-    data = obj.as_dict() if obj else LANDING_CONTENT
-    return Response(data)
+    response["ETag"] = etag
+    response["Cache-Control"] = f"public, max-age={int(getattr(settings, 'LANDING_CACHE_MAX_AGE', 60))}"
+    return response
+
+
+@api_view(["GET"])
+def landing_stats(request):
+    # One snapshot: the counts and total raised all come from the
+    # platform_stats view, stamped with when it was last refreshed.
+    return Response(get_platform_stats())
+
+
+@api_view(["GET"])
+def home(request):
+    return HttpResponse(render_home(), content_type="application/json")
@@ -0,0 +1,37 @@
+"""
+Process-wide background thread pools.
+
+Work that must not hold up a request (password rehashing, notification
+fan-out, saved-search percolation, home fragments) runs on small named
+pools. Each pool is created on first use, sized by its setting, and then
+shared by every thread of the process. Callers treat a size of 0 as "run
+inline" and never ask for the pool in that case.
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+
+
+_executors = {}
+_executors_lock = threading.Lock()
+
+
+def executor_workers(setting, default):
+    return int(getattr(settings, setting, default))
+
+
+def get_executor(name, setting, default):
+    """
+    Return the pool called ``name``, creating it with ``setting`` workers
+    (``default`` when unset) on first use. Its threads are named after it.
+    """
+    with _executors_lock:
+        executor = _executors.get(name)
+        if executor is None:
+            executor = _executors[name] = ThreadPoolExecutor(
+                max_workers=executor_workers(setting, default),
+                thread_name_prefix=name,
+            )
+    return executor
@@ -0,0 +1,15 @@
+"""
+Snapshots of model field values for change detection in signal handlers.
+
+Values are read from the instance ``__dict__`` rather than through the
+attributes, so a field deferred by ``only()``/``defer()`` reads as None
+instead of costing a query just to be remembered.
+"""
+
+
+def loaded_value(instance, field):
+    return instance.__dict__.get(field)
+
+
+def loaded_values(instance, fields):
+    return tuple(loaded_value(instance, field) for field in fields)
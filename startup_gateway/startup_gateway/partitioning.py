@@ -0,0 +1,214 @@
+"""
+Monthly range partitioning for the append-heavy tables.
+
+Each table is partitioned on its creation timestamp into one partition per
+calendar month, named ``<table>_pYYYYMM``, plus a ``<table>_default``
+partition that catches rows outside the months created so far. Retention
+detaches and drops whole partitions instead of deleting rows.
+"""
+
+import re
+from datetime import datetime, timezone
+
+from django.db import connection, transaction
+from django.db.models import CheckConstraint
+
+
+PARTITIONED_TABLES = {
+    "notifications": "created_at",
+    "messages": "created_at",
+    "project_audit": "timestamp",
+}
+
+
+def month_start(value):
+    return datetime(value.year, value.month, 1, tzinfo=timezone.utc)
+
+
+def add_months(month, months):
+    index = month.year * 12 + month.month - 1 + months
+    return datetime(index // 12, index % 12 + 1, 1, tzinfo=timezone.utc)
+
+
+def partition_name(table, month):
+    return f"{table}_p{month:%Y%m}"
+
+
+def default_partition_name(table):
+    return f"{table}_default"
+
+
+def list_partitions(table, using=None):
+    """
+    Return ``{month: partition_name}`` for the monthly partitions attached
+    to ``table``. The default partition is not included.
+    """
+    conn = using or connection
+    pattern = re.compile(rf"^{re.escape(table)}_p(\d{{4}})(\d{{2}})$")
+    with conn.cursor() as cursor:
+        cursor.execute(
+            """
+            SELECT child.relname
+            FROM pg_inherits
+            JOIN pg_class AS parent ON parent.oid = pg_inherits.inhparent
+            JOIN pg_class AS child ON child.oid = pg_inherits.inhrelid
+            WHERE parent.relname = %s
+            """,
+            [table],
+        )
+        names = [row[0] for row in cursor.fetchall()]
+
+    partitions = {}
+    for name in names:
+        match = pattern.match(name)
+        if match:
+            month = datetime(int(match[1]), int(match[2]), 1, tzinfo=timezone.utc)
+            partitions[month] = name
+    return partitions
+
+
+def create_partition(table, month, using=None):
+    """
+    Create and attach the partition for ``month`` unless it exists. Rows
+    for that month already sitting in the default partition are moved into
+    it first, otherwise Postgres refuses the attach.
+    """
+    conn = using or connection
+    column = PARTITIONED_TABLES[table]
+    name = partition_name(table, month)
+    qn = conn.ops.quote_name
+    lower, upper = month, add_months(month, 1)
+
+    with transaction.atomic(using=conn.alias), conn.cursor() as cursor:
+        cursor.execute("SELECT to_regclass(%s)", [name])
+        if cursor.fetchone()[0] is not None:
+            return False
+
+        cursor.execute(f"CREATE TABLE {qn(name)} (LIKE {qn(table)} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)")
+        cursor.execute(
+            f"""
+            WITH moved AS (
+                DELETE FROM {qn(default_partition_name(table))}
+                WHERE {qn(column)} >= %s AND {qn(column)} < %s
+                RETURNING *
+            )
+            INSERT INTO {qn(name)} SELECT * FROM moved
+            """,
+            [lower, upper],
+        )
+        cursor.execute(
+            f"ALTER TABLE {qn(table)} ATTACH PARTITION {qn(name)} FOR VALUES FROM (%s) TO (%s)",
+            [lower, upper],
+        )
+    return True
+
+
+def ensure_partitions(table, months_ahead, start=None, using=None):
+    """
+    Make sure partitions exist from ``start`` (default: this month) through
+    ``months_ahead`` months from now. Returns the names created.
+    """
+    current = month_start(datetime.now(timezone.utc))
+    month = month_start(start) if start else current
+    last = add_months(current, months_ahead)
+
+    created = []
+    while month <= last:
+        if create_partition(table, month, using=using):
+            created.append(partition_name(table, month))
+        month = add_months(month, 1)
+    return created
+
+
+def drop_partition(table, month, using=None):
+    """Detach the partition for ``month`` from ``table`` and drop it."""
+    conn = using or connection
+    qn = conn.ops.quote_name
+    name = partition_name(table, month)
+    with transaction.atomic(using=conn.alias), conn.cursor() as cursor:
+        cursor.execute(f"ALTER TABLE {qn(table)} DETACH PARTITION {qn(name)}")
+        cursor.execute(f"DROP TABLE {qn(name)}")
+
+
+def convert_to_partitioned(schema_editor, model, months_ahead=3):
+    """
+    Rebuild ``model``'s table as a partitioned table, for use from a
+    migration's RunPython.
+
+    Postgres needs the partition key in the primary key, so the table gets
+    a composite (id, <timestamp>) primary key; Django keeps treating ``id``
+    as the primary key and queries are unchanged. Defaults and CHECK
+    constraints are copied with the columns; indexes and foreign keys are
+    recreated from the model under their usual names. Nothing may hold
+    a database-level foreign key to the table.
+    """
+    table = model._meta.db_table
+    column = PARTITIONED_TABLES[table]
+    pk = model._meta.pk.column
+    legacy = f"{table}_legacy"
+    qn = schema_editor.quote_name
+
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute(f"ALTER TABLE {qn(table)} RENAME TO {qn(legacy)}")
+        cursor.execute(
+            f"CREATE TABLE {qn(table)} (LIKE {qn(legacy)} INCLUDING DEFAULTS INCLUDING CONSTRAINTS) "
+            f"PARTITION BY RANGE ({qn(column)})"
+        )
+        cursor.execute(
+            f"CREATE TABLE {qn(default_partition_name(table))} PARTITION OF {qn(table)} DEFAULT"
+        )
+        cursor.execute(f"SELECT min({qn(column)}) FROM {qn(legacy)}")
+        oldest = cursor.fetchone()[0]
+
+    ensure_partitions(table, months_ahead, start=oldest, using=schema_editor.connection)
+
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute(f"INSERT INTO {qn(table)} SELECT * FROM {qn(legacy)}")
+        cursor.execute(f"DROP TABLE {qn(legacy)}")
+        cursor.execute(
+            f"ALTER TABLE {qn(table)} ALTER COLUMN {qn(pk)} ADD GENERATED BY DEFAULT AS IDENTITY"
+        )
+        cursor.execute(
+            f"SELECT setval(pg_get_serial_sequence(%s, %s), "
+            f"coalesce((SELECT max({qn(pk)}) FROM {qn(table)}), 0) + 1, false)",
+            [table, pk],
+        )
+        cursor.execute(
+            f"ALTER TABLE {qn(table)} ADD CONSTRAINT {qn(table + '_pkey')} "
+            f"PRIMARY KEY ({qn(pk)}, {qn(column)})"
+        )
+
+    for statement in schema_editor._model_indexes_sql(model):
+        schema_editor.execute(statement)
+    for field in model._meta.local_fields:
+        if field.remote_field and field.db_constraint:
+            schema_editor.execute(
+                schema_editor._create_fk_sql(model, field, "_fk_%(to_table)s_%(to_column)s")
+            )
+
+
+def ensure_check_constraints(schema_editor, model):
+    """
+    Add ``model``'s CHECK constraints that its table is missing, for tables
+    partitioned before convert_to_partitioned copied them. Attached
+    partitions inherit constraints added to the parent.
+    """
+    table = model._meta.db_table
+    qn = schema_editor.quote_name
+
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT conname FROM pg_constraint WHERE conrelid = %s::regclass AND contype = 'c'",
+            [table],
+        )
+        existing = {row[0] for row in cursor.fetchall()}
+
+    for field in model._meta.local_fields:
+        check = field.db_check(schema_editor.connection)
+        # Postgres' own name for an inline column CHECK.
+        name = f"{table}_{field.column}_check"
+        if check and name not in existing:
+            schema_editor.execute(f"ALTER TABLE {qn(table)} ADD CONSTRAINT {qn(name)} CHECK ({check})")
+    for constraint in model._meta.constraints:
+        if isinstance(constraint, CheckConstraint) and constraint.name not in existing:
+            schema_editor.add_constraint(model, constraint)
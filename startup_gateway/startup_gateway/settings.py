@@ -56,6 +56,7 @@ INSTALLED_APPS = [
     'messages',
     'dashboard',
     'notifications',
+    'analytics',
     'startup_gateway.content',
 ]
 
@@ -120,7 +121,7 @@ REST_FRAMEWORK = {
         'rest_framework.permissions.AllowAny',
     ],
     'DEFAULT_AUTHENTICATION_CLASSES': [
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        'users.authentication.CachedJWTAuthentication',
         'rest_framework.authentication.SessionAuthentication',
     ],
 
@@ -129,6 +130,111 @@ REST_FRAMEWORK = {
     ],
 }
 
+SIMPLE_JWT = {
+    'TOKEN_OBTAIN_SERIALIZER': 'users.serializers.UserTokenObtainPairSerializer',
+}
+
+# Every process must share one cache: single_flight leases, early refreshes,
+# the landing payload and its ETag only coalesce across workers that see the
+# same entries. Without REDIS_URL each process gets its own LocMemCache,
+# which is only suitable for tests and single-process development.
+REDIS_URL = os.getenv("REDIS_URL")
+if REDIS_URL:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": REDIS_URL,
+        }
+    }
+else:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        }
+    }
+
+AUTH_USER_CACHE_TTL = int(os.getenv("AUTH_USER_CACHE_TTL", "60"))
+UNREAD_COUNTS_CACHE_TTL = int(os.getenv("UNREAD_COUNTS_CACHE_TTL", "30"))
+
+# "postgres" fans realtime events out through LISTEN/NOTIFY; "memory" keeps them in-process.
+REALTIME_BROKER = os.getenv("REALTIME_BROKER", "postgres")
+REALTIME_HEARTBEAT_SECONDS = int(os.getenv("REALTIME_HEARTBEAT_SECONDS", "25"))
+
+# 0 delivers follower notifications inline after commit; >0 uses a background pool.
+NOTIFICATION_FANOUT_WORKERS = int(os.getenv("NOTIFICATION_FANOUT_WORKERS", "2"))
+NOTIFICATION_FANOUT_BATCH_SIZE = int(os.getenv("NOTIFICATION_FANOUT_BATCH_SIZE", "1000"))
+NOTIFICATION_COALESCE_WINDOW_SECONDS = int(os.getenv("NOTIFICATION_COALESCE_WINDOW_SECONDS", str(60 * 60)))
+NOTIFICATION_DIGEST_AFTER_HOURS = int(os.getenv("NOTIFICATION_DIGEST_AFTER_HOURS", "24"))
+
+# Monthly partitions for notifications, messages and project_audit.
+# Retention is in whole months; 0 keeps a table's partitions forever.
+PARTITION_MONTHS_AHEAD = int(os.getenv("PARTITION_MONTHS_AHEAD", "3"))
+NOTIFICATION_RETENTION_MONTHS = int(os.getenv("NOTIFICATION_RETENTION_MONTHS", "12"))
+MESSAGE_RETENTION_MONTHS = int(os.getenv("MESSAGE_RETENTION_MONTHS", "24"))
+PROJECT_AUDIT_RETENTION_MONTHS = int(os.getenv("PROJECT_AUDIT_RETENTION_MONTHS", "24"))
+
+# Detail page views are buffered per process and flushed to daily rollups
+# every VIEW_COUNTER_FLUSH_SECONDS or once this many counters are pending:
+# by a background thread, or, with the thread off (tests), synchronously at
+# the end of the request that finds a flush due.
+VIEW_COUNTER_BACKGROUND_FLUSH = os.getenv("VIEW_COUNTER_BACKGROUND_FLUSH", "1") == "1"
+VIEW_COUNTER_FLUSH_SECONDS = int(os.getenv("VIEW_COUNTER_FLUSH_SECONDS", "30"))
+VIEW_COUNTER_MAX_PENDING = int(os.getenv("VIEW_COUNTER_MAX_PENDING", "1000"))
+
+# Trending startups: signals older than the window are ignored, newer ones
+# lose half their weight every TRENDING_HALF_LIFE_DAYS.
+TRENDING_WINDOW_DAYS = int(os.getenv("TRENDING_WINDOW_DAYS", "14"))
+TRENDING_HALF_LIFE_DAYS = float(os.getenv("TRENDING_HALF_LIFE_DAYS", "3"))
+
+# build_daily_rollups stops this far behind now. Source rows are stamped
+# when written, not when committed, so a row whose transaction commits more
+# than this long after its timestamp is never counted; keep it well above
+# the longest write transaction (requests, commands, imports).
+ANALYTICS_ROLLUP_LAG_SECONDS = int(os.getenv("ANALYTICS_ROLLUP_LAG_SECONDS", str(15 * 60)))
+
+# Funding totals are converted into this currency via exchange_rates.
+FUNDING_BASE_CURRENCY = os.getenv("FUNDING_BASE_CURRENCY", "UAH")
+FUNDING_CACHE_TTL = int(os.getenv("FUNDING_CACHE_TTL", str(60 * 60)))
+
+# Landing page counts come from the platform_stats materialized view,
+# rebuilt by refresh_platform_stats; readers cache them this long.
+PLATFORM_STATS_CACHE_TTL = int(os.getenv("PLATFORM_STATS_CACHE_TTL", str(5 * 60)))
+
+# The rendered landing payload is kept in process memory and the shared
+# cache for LANDING_CACHE_TTL seconds (content saves and stats refreshes
+# replace it sooner); clients may reuse it for LANDING_CACHE_MAX_AGE.
+LANDING_CACHE_TTL = int(os.getenv("LANDING_CACHE_TTL", "60"))
+LANDING_CACHE_MAX_AGE = int(os.getenv("LANDING_CACHE_MAX_AGE", "60"))
+
+# /api/home/ fragments (featured startups, top tags) are cached this long;
+# misses are built on a pool of this many threads (0 builds them inline).
+HOME_FRAGMENT_TTL = int(os.getenv("HOME_FRAGMENT_TTL", "60"))
+HOME_FRAGMENT_WORKERS = int(os.getenv("HOME_FRAGMENT_WORKERS", "2"))
+HOME_TOP_TAGS = int(os.getenv("HOME_TOP_TAGS", "12"))
+
+# Serialized startup list cards are cached per startup and dropped when the
+# startup, its regions or its projects change.
+STARTUP_CARD_CACHE_TTL = int(os.getenv("STARTUP_CARD_CACHE_TTL", str(60 * 60)))
+# Listing pages (ids and links) and public profiles; follower counts on
+# profiles may lag by up to STARTUP_PROFILE_CACHE_TTL.
+STARTUP_PAGE_CACHE_TTL = int(os.getenv("STARTUP_PAGE_CACHE_TTL", "30"))
+STARTUP_PROFILE_CACHE_TTL = int(os.getenv("STARTUP_PROFILE_CACHE_TTL", "60"))
+
+# Hot cache entries are rebuilt by one worker at a time: it holds a lease
+# for up to SINGLE_FLIGHT_LEASE_SECONDS while others wait or serve the
+# previous value, which stays usable SINGLE_FLIGHT_STALE_SECONDS past expiry.
+SINGLE_FLIGHT_LEASE_SECONDS = int(os.getenv("SINGLE_FLIGHT_LEASE_SECONDS", "10"))
+SINGLE_FLIGHT_STALE_SECONDS = int(os.getenv("SINGLE_FLIGHT_STALE_SECONDS", "60"))
+
+# Neighbours kept per project by build_similar_projects.
+SIMILAR_PROJECTS_TOP_K = int(os.getenv("SIMILAR_PROJECTS_TOP_K", "5"))
+
+# Startups stored per investor by refresh_investor_matches.
+INVESTOR_MATCHES_TOP_N = int(os.getenv("INVESTOR_MATCHES_TOP_N", "20"))
+SAVED_SEARCH_BATCH_SIZE = int(os.getenv("SAVED_SEARCH_BATCH_SIZE", "500"))
+# 0 percolates changed startups/projects inline after commit; >0 uses a background pool.
+SAVED_SEARCH_PERCOLATION_WORKERS = int(os.getenv("SAVED_SEARCH_PERCOLATION_WORKERS", "2"))
+
 
 # Password validation
 # https://docs.djangoproject.com/en/6.0/ref/settings/#auth-password-validators
@@ -171,3 +277,19 @@ DEFAULT_FROM_EMAIL = os.getenv("DEFAULT_FROM_EMAIL", "no-reply@example.com")
 EMAIL_BACKEND = os.getenv("EMAIL_BACKEND", "django.core.mail.backends.console.EmailBackend")
 EMAIL_VERIFICATION_TOKEN_MAX_AGE = int(os.getenv("EMAIL_VERIFICATION_TOKEN_MAX_AGE", str(60 * 60 * 24)))
 
+# 0 hashes registration passwords inline; >0 stores a cheap interim hash
+# and hands the full hash to a bounded background pool. The interim hasher
+# must stay listed so those passwords keep working until upgraded.
+PASSWORD_HASHERS = [
+    "django.contrib.auth.hashers.PBKDF2PasswordHasher",
+    "django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher",
+    "django.contrib.auth.hashers.Argon2PasswordHasher",
+    "django.contrib.auth.hashers.BCryptSHA256PasswordHasher",
+    "django.contrib.auth.hashers.ScryptPasswordHasher",
+    "users.hashers.PendingPBKDF2PasswordHasher",
+]
+PASSWORD_HASH_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", "0"))
+PASSWORD_HASH_QUEUE_SIZE = int(os.getenv("PASSWORD_HASH_QUEUE_SIZE", "100"))
+
+UNVERIFIED_USER_MAX_AGE_DAYS = int(os.getenv("UNVERIFIED_USER_MAX_AGE_DAYS", "7"))
+
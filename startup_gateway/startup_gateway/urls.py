@@ -35,6 +35,10 @@ urlpatterns = [
     path('api/', include(('startups.api.urls', 'startups'), namespace='startups')),
 
     path("api/", include("projects.urls")),
+    path("api/", include("messages.urls")),
+    path("api/", include("notifications.urls")),
+    path("api/", include("dashboard.urls")),
+    path("api/", include("analytics.urls")),
 
     path('api/token/', TokenObtainPairView.as_view(), name='token_obtain_pair'),
     path('api/token/refresh/', TokenRefreshView.as_view(), name='token_refresh'),
@@ -3,3 +3,6 @@ from django.apps import AppConfig
 
 class StartupsConfig(AppConfig):
     name = 'startups'
+
+    def ready(self):
+        from . import signals  # noqa: F401
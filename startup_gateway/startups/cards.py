@@ -0,0 +1,65 @@
+"""
+Per-startup caches of serialized list cards and public profiles.
+
+Listing pages combine many filters, so whole responses rarely repeat, but
+the same cards do. A page loads only startup ids, fetches their cached
+cards with one ``get_many``, serializes just the misses and backfills
+them. Funding is cached separately and merged in per page. Cards and
+profiles are dropped when the startup, its regions or its projects
+change; bumping CARD_VERSION retires every entry after a change to their
+shape. Listing pages (ids and links) and profiles go through
+``single_flight`` so an expired hot entry is rebuilt by one worker.
+"""
+
+import hashlib
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+from analytics.funding import get_startup_funding_many
+from .models import StartupProfile
+from .serializers import StartupCardSerializer
+
+
+CARD_VERSION = 1
+
+
+def card_key(startup_profile_id):
+    return f"startup:card:v{CARD_VERSION}:{startup_profile_id}"
+
+
+def profile_key(startup_profile_id):
+    return f"startup:profile:v{CARD_VERSION}:{startup_profile_id}"
+
+
+def page_key(url):
+    return f"startup:page:{hashlib.sha1(url.encode()).hexdigest()}"
+
+
+def get_startup_cards(startup_profile_ids):
+    """Cards for ``startup_profile_ids``, in the same order, with funding."""
+    keys = {card_key(pk): pk for pk in startup_profile_ids}
+    cards = {keys[key]: card for key, card in cache.get_many(list(keys)).items()}
+
+    missing = [pk for pk in startup_profile_ids if pk not in cards]
+    if missing:
+        startups = StartupProfile.objects.filter(pk__in=missing).prefetch_related("projects__tags", "region")
+        built = {card["id"]: dict(card) for card in StartupCardSerializer(startups, many=True).data}
+        cache.set_many(
+            {card_key(pk): card for pk, card in built.items()},
+            int(getattr(settings, "STARTUP_CARD_CACHE_TTL", 60 * 60)),
+        )
+        cards.update(built)
+
+    funding = get_startup_funding_many(startup_profile_ids)
+    return [
+        {**cards[pk], "funding": funding[pk]}
+        for pk in startup_profile_ids
+        if pk in cards
+    ]
+
+
+def invalidate_startup_cache(startup_profile_id):
+    keys = [card_key(startup_profile_id), profile_key(startup_profile_id)]
+    transaction.on_commit(lambda: cache.delete_many(keys))
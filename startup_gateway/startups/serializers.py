@@ -1,12 +1,37 @@
 from rest_framework import serializers
+
+from analytics.funding import get_startup_funding, get_startup_funding_many
 from .models import StartupProfile
 
 
+class FundingListSerializer(serializers.ListSerializer):
+    """Loads funding totals for the whole page in one cache round trip."""
+
+    def to_representation(self, data):
+        items = list(data.all() if hasattr(data, "all") else data)
+        self.context["funding"] = get_startup_funding_many([item.pk for item in items])
+        return super().to_representation(items)
+
+
+class FundingField(serializers.Field):
+    def __init__(self, **kwargs):
+        kwargs["source"] = "*"
+        kwargs["read_only"] = True
+        super().__init__(**kwargs)
+
+    def to_representation(self, obj):
+        funding = self.context.get("funding") or {}
+        if obj.pk in funding:
+            return funding[obj.pk]
+        return get_startup_funding(obj.pk)
+
+
 class StartupPublicSerializer(serializers.ModelSerializer):
     tags = serializers.SerializerMethodField()
     followers_count = serializers.SerializerMethodField()
     projects_count = serializers.SerializerMethodField()
     contact = serializers.SerializerMethodField()
+    funding = FundingField()
 
     class Meta:
         model = StartupProfile
@@ -23,6 +48,7 @@ class StartupPublicSerializer(serializers.ModelSerializer):
             'tags',
             'followers_count',
             'projects_count',
+            'funding',
             'created_at',
         )
 
@@ -45,7 +71,9 @@ class StartupPublicSerializer(serializers.ModelSerializer):
         return list(tags)
     
 
-class StartupListSerializer(serializers.ModelSerializer):
+class StartupCardSerializer(serializers.ModelSerializer):
+    """A startup card without funding; cached per startup by ``cards``."""
+
     short_description = serializers.CharField(source='short_pitch', read_only=True)
     thumbnail_url = serializers.CharField(source='logo_url', read_only=True)
     regions = serializers.SerializerMethodField()
@@ -62,16 +90,22 @@ class StartupListSerializer(serializers.ModelSerializer):
             'tags',
         )
 
+    # Read through .all() so ``cards`` can prefetch projects, tags and
+    # regions for a whole batch.
     def get_regions(self, obj):
-        return list(
-            obj.region
-            .values_list('name', flat=True)
-            .distinct()
-        )
+        return list(dict.fromkeys(region.name for region in obj.region.all()))
 
     def get_tags(self, obj):
-        return list(
-            obj.projects
-            .values_list('tags__name', flat=True)
-            .distinct()
-        )
\ No newline at end of file
+        return list(dict.fromkeys(
+            tag.name
+            for project in obj.projects.all()
+            for tag in project.tags.all()
+        ))
+
+
+class StartupListSerializer(StartupCardSerializer):
+    funding = FundingField()
+
+    class Meta(StartupCardSerializer.Meta):
+        list_serializer_class = FundingListSerializer
+        fields = StartupCardSerializer.Meta.fields + ('funding',)
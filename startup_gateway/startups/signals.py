@@ -0,0 +1,62 @@
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+
+from projects.models import Project, Tag
+from .cards import invalidate_startup_cache
+from .models import Region, StartupProfile
+
+
+# Reverse clears carry no pk_set, so those are handled before the rows go.
+M2M_ACTIONS = ("post_add", "post_remove", "pre_clear")
+
+
+def _invalidate_many(startup_profile_ids):
+    for startup_profile_id in set(startup_profile_ids):
+        invalidate_startup_cache(startup_profile_id)
+
+
+@receiver(post_save, sender=StartupProfile)
+@receiver(post_delete, sender=StartupProfile)
+def invalidate_card_on_startup_change(sender, instance, **kwargs):
+    invalidate_startup_cache(instance.pk)
+
+
+@receiver(post_save, sender=Project)
+@receiver(post_delete, sender=Project)
+def invalidate_card_on_project_change(sender, instance, **kwargs):
+    invalidate_startup_cache(instance.startup_profile_id)
+
+
+@receiver(m2m_changed, sender=StartupProfile.region.through)
+def invalidate_card_on_regions_change(sender, instance, action, reverse, pk_set, **kwargs):
+    if action not in M2M_ACTIONS:
+        return
+    if not reverse:
+        invalidate_startup_cache(instance.pk)
+    elif pk_set:
+        _invalidate_many(pk_set)
+    else:
+        _invalidate_many(instance.startups.values_list("pk", flat=True))
+
+
+@receiver(m2m_changed, sender=Project.tags.through)
+def invalidate_card_on_tags_change(sender, instance, action, reverse, pk_set, **kwargs):
+    if action not in M2M_ACTIONS:
+        return
+    if not reverse:
+        invalidate_startup_cache(instance.startup_profile_id)
+    else:
+        projects = Project.objects.filter(pk__in=pk_set) if pk_set else instance.projects.all()
+        _invalidate_many(projects.values_list("startup_profile_id", flat=True))
+
+
+@receiver(post_save, sender=Region)
+def invalidate_cards_on_region_rename(sender, instance, created, **kwargs):
+    if not created:
+        _invalidate_many(instance.startups.values_list("pk", flat=True))
+
+
+@receiver(post_save, sender=Tag)
+def invalidate_cards_on_tag_rename(sender, instance, created, **kwargs):
+    if not created:
+        _invalidate_many(instance.projects.values_list("startup_profile_id", flat=True))
@@ -1,7 +1,11 @@
 from django.urls import reverse
 from rest_framework.test import APITestCase
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.utils import timezone
 
+from analytics.models import StartupTrendingScore
+from startups.cards import card_key
 from startups.models import StartupProfile, Region
 from projects.models import Project, Tag
 
@@ -65,6 +69,8 @@ class StartupListAPITest(APITestCase):
         )
         project2.tags.add(cls.tag_ai)
 
+    def setUp(self):
+        cache.clear()
 
     def test_startup_list_returns_200(self):
         url = reverse("startup-list")
@@ -155,4 +161,56 @@ class StartupListAPITest(APITestCase):
         response = self.client.get(url, {"page_size": 1})
 
         self.assertEqual(len(response.data["results"]), 1)
-        self.assertIsNotNone(response.data["next"])
\ No newline at end of file
+        self.assertIsNotNone(response.data["next"])
+
+    def test_ordering_trending_uses_stored_scores(self):
+        now = timezone.now()
+        StartupTrendingScore.objects.create(startup_profile=self.startup1, score=10, computed_at=now)
+        StartupTrendingScore.objects.create(startup_profile=self.startup2, score=10, computed_at=now)
+
+        response = self.client.get(reverse("startup-list"), {"ordering": "trending"})
+
+        # Equal scores fall back to the newest startup.
+        ids = [item["id"] for item in response.data["results"]]
+        self.assertEqual(ids, [self.startup2.pk, self.startup1.pk])
+
+    def test_ordering_trending_skips_unscored_startups(self):
+        StartupTrendingScore.objects.create(startup_profile=self.startup1, score=10, computed_at=timezone.now())
+
+        response = self.client.get(reverse("startup-list"), {"ordering": "trending"})
+
+        ids = [item["id"] for item in response.data["results"]]
+        self.assertEqual(ids, [self.startup1.pk])
+
+    def test_cached_cards_are_not_reserialized(self):
+        url = reverse("startup-list")
+        first = self.client.get(url)
+
+        # Page ids, cards and funding all come from the cache.
+        with self.assertNumQueries(0):
+            second = self.client.get(url)
+
+        self.assertEqual(second.data["results"], first.data["results"])
+
+    def test_only_missing_cards_are_serialized(self):
+        url = reverse("startup-list")
+        self.client.get(url)
+        cache.delete_many([card_key(self.startup1.pk), card_key(self.startup2.pk)])
+
+        # Startups, projects, tags and regions: one query each, not per card.
+        with self.assertNumQueries(4):
+            response = self.client.get(url)
+
+        handmade = next(s for s in response.data["results"] if s["id"] == self.startup1.pk)
+        self.assertCountEqual(handmade["tags"], ["craft", "pottery"])
+
+    def test_card_dropped_when_project_tags_change(self):
+        url = reverse("startup-list")
+        self.client.get(url)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.startup2.projects.get().tags.add(self.tag_craft)
+
+        response = self.client.get(url, {"tag": "craft"})
+        tech = next(s for s in response.data["results"] if s["id"] == self.startup2.pk)
+        self.assertCountEqual(tech["tags"], ["ai", "craft"])
@@ -1,5 +1,13 @@
+from django.conf import settings
+from django.db.models import F
+from django.http import Http404
 from django.shortcuts import render
 from rest_framework.generics import RetrieveAPIView, ListAPIView
+from rest_framework.response import Response
+
+from analytics.services import record_view
+from startup_gateway.caching import single_flight
+from .cards import get_startup_cards, page_key, profile_key
 from .models import StartupProfile
 from .serializers import StartupPublicSerializer, StartupListSerializer
 from .pagination import StartupListPagination
@@ -14,12 +22,31 @@ class StartupPublicDetailView(RetrieveAPIView):
     serializer_class = StartupPublicSerializer
     lookup_field = 'slug'
 
+    def retrieve(self, request, *args, **kwargs):
+        startup_id = StartupProfile.objects.filter(slug=kwargs["slug"]).values_list("pk", flat=True).first()
+        if startup_id is None:
+            raise Http404
+        record_view("startup", startup_id)
+        data = single_flight(
+            profile_key(startup_id),
+            lambda: dict(self.get_serializer(self.get_object()).data),
+            int(getattr(settings, "STARTUP_PROFILE_CACHE_TTL", 60)),
+        )
+        return Response(data)
+
 class StartupListView(ListAPIView):
     serializer_class = StartupListSerializer
     pagination_class = StartupListPagination
 
     def get_queryset(self):
-        queryset = StartupProfile.objects.all().prefetch_related('projects__tags', 'region').order_by("-id")
+        queryset = StartupProfile.objects.all().order_by("-id")
+
+        if self.request.query_params.get('ordering') == 'trending':
+            # Only scored startups trend. The inner join lets Postgres walk
+            # startup_trending_rank_idx (score DESC, startup_profile_id DESC).
+            queryset = queryset.filter(trending_score__isnull=False).order_by(
+                F('trending_score__score').desc(), F('trending_score__startup_profile_id').desc()
+            )
 
         tag = self.request.query_params.get('tag')
         if tag:
@@ -29,4 +56,27 @@ class StartupListView(ListAPIView):
         if search:
             queryset = queryset.filter(company_name__icontains=search)
 
-        return queryset
\ No newline at end of file
+        return queryset
+
+    def list(self, request, *args, **kwargs):
+        # Cards are cached per startup, so a page only needs its ids.
+        page = single_flight(
+            page_key(request.build_absolute_uri()),
+            self.get_page_ids,
+            int(getattr(settings, "STARTUP_PAGE_CACHE_TTL", 30)),
+        )
+        return Response({
+            "count": page["count"],
+            "next": page["next"],
+            "previous": page["previous"],
+            "results": get_startup_cards(page["ids"]),
+        })
+
+    def get_page_ids(self):
+        ids = self.paginate_queryset(self.filter_queryset(self.get_queryset()).values_list("id", flat=True))
+        return {
+            "count": self.paginator.page.paginator.count,
+            "next": self.paginator.get_next_link(),
+            "previous": self.paginator.get_previous_link(),
+            "ids": list(ids),
+        }
@@ -0,0 +1,136 @@
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+
+from users.models import Role, mask_to_roles, resolve_active_role, roles_to_mask
+
+
+User = get_user_model()
+
+USER_SNAPSHOT_FIELDS = (
+    "id",
+    "username",
+    "email",
+    "first_name",
+    "last_name",
+    "is_active",
+    "is_staff",
+    "is_superuser",
+    "verified",
+)
+
+ROLE_CLAIM = "role"
+VERIFIED_CLAIM = "verified"
+STARTUP_PROFILE_CLAIM = "startup_profile_id"
+INVESTOR_PROFILE_CLAIM = "investor_profile_id"
+
+
+def _user_snapshot_key(user_id):
+    return f"auth:user:{user_id}"
+
+
+def invalidate_user_snapshot(user_id):
+    if user_id is not None:
+        cache.delete(_user_snapshot_key(user_id))
+
+
+def load_user_snapshot(user_id):
+    row = (
+        User.objects
+        .filter(pk=user_id)
+        .values(*USER_SNAPSHOT_FIELDS, "startup_profile__id", "investor_profile__id")
+        .first()
+    )
+    if row is None:
+        return None
+
+    snapshot = {field: row[field] for field in USER_SNAPSHOT_FIELDS}
+    snapshot["startup_profile_id"] = row["startup_profile__id"]
+    snapshot["investor_profile_id"] = row["investor_profile__id"]
+    snapshot["role_mask"] = roles_to_mask(
+        Role.objects.filter(userrole__user_id=user_id).values_list("name", flat=True)
+    )
+    return snapshot
+
+
+def get_user_snapshot(user_id):
+    """
+    Return the cached auth view of a user: core flags, role bitmask and owned
+    profile ids. Entries live for AUTH_USER_CACHE_TTL seconds and are dropped
+    by users.signals whenever the user, its roles or its profiles change.
+    """
+    key = _user_snapshot_key(user_id)
+    snapshot = cache.get(key)
+    if snapshot is None:
+        snapshot = load_user_snapshot(user_id)
+        if snapshot is None:
+            return None
+        cache.set(key, snapshot, timeout=int(getattr(settings, "AUTH_USER_CACHE_TTL", 60)))
+    return snapshot
+
+
+def user_from_snapshot(snapshot, claims=None):
+    """
+    Build a User instance without touching the database.
+
+    Only USER_SNAPSHOT_FIELDS are loaded; the rest are deferred, so an
+    accidental save() cannot overwrite the password or other columns.
+    Verification and profile ids always come from the snapshot, which is
+    invalidated on change, never from claims a refresh token may carry
+    over; the role claim only picks among the roles the snapshot holds.
+    """
+    claims = claims or {}
+    # from_db() expects values in concrete field order.
+    field_names = [
+        field.attname
+        for field in User._meta.concrete_fields
+        if field.attname in USER_SNAPSHOT_FIELDS
+    ]
+    user = User.from_db(
+        DEFAULT_DB_ALIAS,
+        field_names,
+        [snapshot[name] for name in field_names],
+    )
+
+    role_mask = snapshot["role_mask"]
+
+    user.verified = snapshot["verified"]
+    user.role_mask = role_mask
+    user.role_names = mask_to_roles(role_mask)
+    user.active_role = resolve_active_role(claims.get(ROLE_CLAIM), role_mask)
+    user.startup_profile_id = snapshot["startup_profile_id"]
+    user.investor_profile_id = snapshot["investor_profile_id"]
+    return user
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """
+    JWT authentication that resolves the user from token claims and the
+    user snapshot cache, so authenticated requests normally run no auth
+    queries at all.
+    """
+
+    def get_user(self, validated_token):
+        if api_settings.CHECK_REVOKE_TOKEN:
+            return super().get_user(validated_token)
+
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError as e:
+            raise InvalidToken(_("Token contained no recognizable user identification")) from e
+
+        snapshot = get_user_snapshot(user_id)
+        if snapshot is None:
+            raise AuthenticationFailed(_("User not found"), code="user_not_found")
+
+        user = user_from_snapshot(snapshot, claims=validated_token.payload)
+
+        if api_settings.CHECK_USER_IS_ACTIVE and not user.is_active:
+            raise AuthenticationFailed(_("User is inactive"), code="user_inactive")
+
+        return user
@@ -0,0 +1,13 @@
+from django.contrib.auth.hashers import PBKDF2PasswordHasher
+
+
+class PendingPBKDF2PasswordHasher(PBKDF2PasswordHasher):
+    """
+    Cheap interim hash stored at registration when full hashing is deferred
+    to the password-hash pool. It keeps the password usable if the pool
+    never gets to it, and since it is not the preferred hasher Django
+    rehashes it with the full cost on the user's next successful login.
+    """
+
+    algorithm = "pbkdf2_sha256_pending"
+    iterations = 1000
@@ -0,0 +1,92 @@
+import time
+import uuid
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.core.management.base import BaseCommand, CommandError
+from django.test.utils import override_settings
+
+from users.serializers import RegisterSerializer
+from users.services import PENDING_HASHER
+
+
+User = get_user_model()
+
+
+class Command(BaseCommand):
+    help = (
+        "Measure registrations per second on a single core with inline and "
+        "deferred password hashing. Each registration commits like a real "
+        "request so the deferred path includes the background rehash; the "
+        "benchmark users are deleted afterwards."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--count", type=int, default=50)
+        parser.add_argument(
+            "--timeout",
+            type=float,
+            default=300.0,
+            help="Seconds to wait for the background pool to upgrade every interim hash.",
+        )
+
+    def handle(self, *args, **options):
+        count = options["count"]
+        timeout = options["timeout"]
+
+        inline_rate, _ = self._measure(count, workers=0, timeout=timeout)
+        request_rate, end_to_end_rate = self._measure(count, workers=1, timeout=timeout)
+        hash_rate = self._measure_hashing(count)
+
+        self.stdout.write(f"inline hashing:   {inline_rate:.1f} registrations/s per core")
+        self.stdout.write(f"deferred hashing: {request_rate:.1f} registrations/s per core (request path)")
+        self.stdout.write(f"                  {end_to_end_rate:.1f} registrations/s end to end (full hash stored)")
+        self.stdout.write(f"background pool:  {hash_rate:.1f} password hashes/s per worker")
+        self.stdout.write(
+            "Interim hashes use 1,000 PBKDF2 iterations and are weak until the pool "
+            "upgrades them; sustained throughput is the end-to-end figure."
+        )
+
+    def _measure(self, count, workers, timeout):
+        payloads = [
+            {
+                "email": f"bench-{uuid.uuid4().hex}@example.com",
+                "password": "P@ssw0rd!123",
+                "role": "startup",
+                "company_name": "Bench Co",
+            }
+            for _ in range(count)
+        ]
+
+        emails = [payload["email"] for payload in payloads]
+        try:
+            with override_settings(PASSWORD_HASH_WORKERS=workers):
+                started = time.perf_counter()
+                for payload in payloads:
+                    serializer = RegisterSerializer(data=payload)
+                    serializer.is_valid(raise_exception=True)
+                    serializer.save()
+                request_elapsed = time.perf_counter() - started
+                self._wait_for_full_hashes(emails, started + timeout)
+                total_elapsed = time.perf_counter() - started
+        finally:
+            User.objects.filter(email__in=emails).delete()
+
+        return (
+            count / request_elapsed if request_elapsed else 0.0,
+            count / total_elapsed if total_elapsed else 0.0,
+        )
+
+    def _wait_for_full_hashes(self, emails, deadline):
+        pending = User.objects.filter(email__in=emails, password__startswith=f"{PENDING_HASHER}$")
+        while pending.exists():
+            if time.perf_counter() > deadline:
+                raise CommandError(f"{pending.count()} interim password hashes were not upgraded in time.")
+            time.sleep(0.01)
+
+    def _measure_hashing(self, count):
+        started = time.perf_counter()
+        for _ in range(count):
+            make_password("P@ssw0rd!123")
+        elapsed = time.perf_counter() - started
+        return count / elapsed if elapsed else 0.0
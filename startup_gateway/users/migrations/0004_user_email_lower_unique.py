@@ -0,0 +1,56 @@
+import django.db.models.functions.text
+from django.db import migrations, models
+from django.db.models import Count
+from django.db.models.functions import Lower
+
+
+def check_case_duplicates(apps, schema_editor):
+    """
+    Refuse to migrate while two accounts share an email up to case; the
+    unique index would fail anyway, and which account survives is a
+    decision for an operator, not for a migration.
+    """
+    User = apps.get_model("users", "User")
+    duplicates = (
+        User.objects.exclude(email="")
+        .values(email_lower=Lower("email"))
+        .annotate(count=Count("id"))
+        .filter(count__gt=1)
+        .order_by("email_lower")
+    )
+    if not duplicates:
+        return
+    lines = []
+    for row in duplicates:
+        accounts = User.objects.filter(email__iexact=row["email_lower"]).order_by("id")
+        listed = ", ".join(f"#{pk} {email}" for pk, email in accounts.values_list("id", "email"))
+        lines.append(f"  {row['email_lower']}: {listed}")
+    raise RuntimeError(
+        "Cannot add users_email_lower_uniq: these accounts share an email up to case. "
+        "Merge or rename them, then re-run migrate.\n" + "\n".join(lines)
+    )
+
+
+def lowercase_emails(apps, schema_editor):
+    User = apps.get_model("users", "User")
+    User.objects.exclude(email=Lower("email")).update(email=Lower("email"))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("users", "0003_user_email_verification_nonce"),
+    ]
+
+    operations = [
+        migrations.RunPython(check_case_duplicates, migrations.RunPython.noop),
+        migrations.RunPython(lowercase_emails, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name="user",
+            constraint=models.UniqueConstraint(
+                django.db.models.functions.text.Lower("email"),
+                condition=models.Q(("email", ""), _negated=True),
+                name="users_email_lower_uniq",
+            ),
+        ),
+    ]
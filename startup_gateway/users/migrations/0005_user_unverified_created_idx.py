@@ -0,0 +1,18 @@
+# Generated by Django 5.2.10 on 2026-10-19 10:50
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auth', '0012_alter_user_first_name_max_length'),
+        ('users', '0004_user_email_lower_unique'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='user',
+            index=models.Index(condition=models.Q(('verified', False)), fields=['created_at'], name='users_unverified_created_idx'),
+        ),
+    ]
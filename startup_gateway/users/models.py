@@ -1,6 +1,32 @@
 from django.db import models
+from django.db.models.functions import Lower
 from django.contrib.auth.models import AbstractUser
 
+# Compact role membership used in cached user snapshots and token checks.
+ROLE_BITS = {
+    'startup': 1 << 0,
+    'investor': 1 << 1,
+}
+
+
+def roles_to_mask(role_names):
+    mask = 0
+    for name in role_names:
+        mask |= ROLE_BITS.get(name, 0)
+    return mask
+
+
+def mask_to_roles(mask):
+    return tuple(name for name, bit in ROLE_BITS.items() if mask & bit)
+
+
+def resolve_active_role(requested, mask):
+    if requested in ROLE_BITS and mask & ROLE_BITS[requested]:
+        return requested
+    roles = mask_to_roles(mask)
+    return roles[0] if roles else None
+
+
 class Role(models.Model):
     """
     Roles: 'startup', 'investor'.
@@ -38,6 +64,20 @@ class User(AbstractUser):
 
     class Meta:
         db_table = 'users'
+        constraints = [
+            models.UniqueConstraint(
+                Lower('email'),
+                condition=~models.Q(email=''),
+                name='users_email_lower_uniq',
+            ),
+        ]
+        indexes = [
+            models.Index(
+                fields=['created_at'],
+                condition=models.Q(verified=False),
+                name='users_unverified_created_idx',
+            ),
+        ]
 
     def __str__(self):
         return self.username
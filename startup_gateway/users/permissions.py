@@ -0,0 +1,41 @@
+from rest_framework.permissions import BasePermission
+
+from users.authentication import get_user_snapshot
+from users.models import ROLE_BITS
+
+
+def user_has_role(user, role):
+    role_mask = getattr(user, "role_mask", None)
+    if role_mask is None:
+        snapshot = get_user_snapshot(user.pk) or {}
+        role_mask = snapshot.get("role_mask", 0)
+    return bool(role_mask & ROLE_BITS.get(role, 0))
+
+
+class HasActiveRole(BasePermission):
+    """
+    JWT users act in the role carried by their token; other authenticated
+    users may act in any role they hold.
+    """
+
+    required_role = None
+
+    def has_permission(self, request, view):
+        user = getattr(request, "user", None)
+        if not (user and user.is_authenticated):
+            return False
+
+        self.message = f"This action requires the {self.required_role} role."
+
+        if hasattr(user, "active_role"):
+            return user.active_role == self.required_role
+
+        return user_has_role(user, self.required_role)
+
+
+class IsStartupRole(HasActiveRole):
+    required_role = "startup"
+
+
+class IsInvestorRole(HasActiveRole):
+    required_role = "investor"
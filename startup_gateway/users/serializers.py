@@ -4,8 +4,10 @@ from django.contrib.auth import get_user_model
 from django.contrib.auth.password_validation import validate_password
 from django.core.exceptions import ValidationError as DjangoValidationError
 from rest_framework import serializers
+from rest_framework_simplejwt.serializers import TokenObtainPairSerializer
 from .services import register_user
-from users.models import Role
+from .tokens import UserRefreshToken
+from users.models import ROLE_BITS, Role
 
 User = get_user_model()
 
@@ -64,3 +66,10 @@ class VerifyEmailSerializer(serializers.Serializer):
 class ResendVerificationSerializer(serializers.Serializer):
     email = serializers.EmailField()
 
+
+class SwitchRoleSerializer(serializers.Serializer):
+    role = serializers.ChoiceField(choices=[(r, r) for r in ROLE_BITS])
+
+
+class UserTokenObtainPairSerializer(TokenObtainPairSerializer):
+    token_class = UserRefreshToken
@@ -1,14 +1,18 @@
 import logging
+import threading
 import uuid
 from django.core.cache import cache
 
 from investors.models import InvestorProfile
 from startups.models import StartupProfile
+from startup_gateway.executors import executor_workers, get_executor
 from users.models import Role
 
-from django.db import transaction
+from django.db import IntegrityError, connections, transaction
+from django.db.models.functions import Lower
 from django.conf import settings
 from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
 from django.core.mail import send_mail
 from django.core.signing import BadSignature, SignatureExpired, TimestampSigner
 from django.utils.crypto import salted_hmac
@@ -18,6 +22,23 @@ logger = logging.getLogger(__name__)
 
 User = get_user_model()
 
+_password_hash_slots = None
+_password_hash_lock = threading.Lock()
+
+
+def get_user_by_email(email, user_model=None):
+    user_model = user_model or User
+    email = (email or "").strip().lower()
+    if not email:
+        return None
+
+    return (
+        user_model.objects
+        .alias(email_lower=Lower("email"))
+        .filter(email_lower=email)
+        .first()
+    )
+
 
 def build_email_verification_token(user):
     signer = TimestampSigner(salt="users.email.verify")
@@ -118,6 +139,75 @@ def verify_email_token(token):
 
 
 
+def is_password_hash_deferred():
+    return executor_workers("PASSWORD_HASH_WORKERS", 0) > 0
+
+
+def _get_password_hash_slots():
+    # Running plus queued hashes; beyond this the caller hashes inline.
+    global _password_hash_slots
+
+    with _password_hash_lock:
+        if _password_hash_slots is None:
+            queue_size = int(getattr(settings, "PASSWORD_HASH_QUEUE_SIZE", 100))
+            _password_hash_slots = threading.BoundedSemaphore(
+                executor_workers("PASSWORD_HASH_WORKERS", 0) + queue_size
+            )
+    return _password_hash_slots
+
+
+PENDING_HASHER = "pbkdf2_sha256_pending"
+
+
+def is_password_hash_pending(encoded):
+    return (encoded or "").startswith(f"{PENDING_HASHER}$")
+
+
+def _store_password_hash(user_id, raw_password, user_model):
+    # Only replace the interim hash; a login may already have upgraded it,
+    # or the user may have set a new password meanwhile.
+    user_model.objects.filter(pk=user_id, password__startswith=f"{PENDING_HASHER}$").update(
+        password=make_password(raw_password)
+    )
+
+
+def _run_password_hash(user_id, raw_password, user_model):
+    try:
+        _store_password_hash(user_id, raw_password, user_model)
+    except Exception:
+        logger.exception("Failed to store password hash for user %s", user_id)
+    finally:
+        connections.close_all()
+
+
+def schedule_password_hash(user_id, raw_password, user_model=None):
+    """
+    Replace a user's interim password hash with the full one, off the
+    request thread.
+
+    Work goes to a bounded thread pool. When every worker is busy and the
+    queue is full, the caller hashes inline, so bursts slow registrations
+    down instead of growing an unbounded backlog. If the pool fails or the
+    process dies first, the interim hash still works and is upgraded on
+    the user's next login.
+    """
+    user_model = user_model or User
+
+    if not is_password_hash_deferred():
+        _store_password_hash(user_id, raw_password, user_model)
+        return None
+
+    slots = _get_password_hash_slots()
+    if not slots.acquire(blocking=False):
+        _store_password_hash(user_id, raw_password, user_model)
+        return None
+
+    executor = get_executor("password-hash", "PASSWORD_HASH_WORKERS", 0)
+    future = executor.submit(_run_password_hash, user_id, raw_password, user_model)
+    future.add_done_callback(lambda _: slots.release())
+    return future
+
+
 @transaction.atomic
 def register_user(validated_data, user_model):
     email = validated_data["email"].strip().lower()
@@ -127,7 +217,7 @@ def register_user(validated_data, user_model):
     website = validated_data.get("website", "")
     phone = validated_data.get("contact_phone", "")
 
-    existing = user_model.objects.filter(email__iexact=email).first()
+    existing = get_user_by_email(email, user_model=user_model)
     if existing:
         should_send_email = not getattr(existing, "verified", False)
         return existing, False, should_send_email
@@ -139,8 +229,27 @@ def register_user(validated_data, user_model):
         verified=False,
         is_active=False,
     )
-    user.set_password(validated_data["password"])
-    user.save()
+    raw_password = validated_data["password"]
+    defer_hash = is_password_hash_deferred()
+    if defer_hash:
+        user.password = make_password(raw_password, hasher=PENDING_HASHER)
+    else:
+        user.set_password(raw_password)
+
+    try:
+        with transaction.atomic():
+            user.save()
+    except IntegrityError:
+        existing = get_user_by_email(email, user_model=user_model)
+        if existing is None:
+            raise
+        should_send_email = not getattr(existing, "verified", False)
+        return existing, False, should_send_email
+
+    if defer_hash:
+        transaction.on_commit(
+            lambda: schedule_password_hash(user.pk, raw_password, user_model=user_model)
+        )
 
     role_obj, _ = Role.objects.get_or_create(name=role_name)
     user.roles.add(role_obj)
@@ -0,0 +1,39 @@
+from django.contrib.auth import get_user_model
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+
+from investors.models import InvestorProfile
+from startups.models import StartupProfile
+from users.authentication import invalidate_user_snapshot
+from users.models import UserRole
+
+
+User = get_user_model()
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def invalidate_user_on_change(sender, instance, **kwargs):
+    invalidate_user_snapshot(instance.pk)
+
+
+@receiver(post_save, sender=UserRole)
+@receiver(post_delete, sender=UserRole)
+@receiver(post_save, sender=StartupProfile)
+@receiver(post_delete, sender=StartupProfile)
+@receiver(post_save, sender=InvestorProfile)
+@receiver(post_delete, sender=InvestorProfile)
+def invalidate_user_on_related_change(sender, instance, **kwargs):
+    invalidate_user_snapshot(instance.user_id)
+
+
+@receiver(m2m_changed, sender=User.roles.through)
+def invalidate_user_on_roles_change(sender, instance, action, reverse, pk_set, **kwargs):
+    if not action.startswith("post_"):
+        return
+
+    if reverse:
+        for user_id in pk_set or ():
+            invalidate_user_snapshot(user_id)
+    else:
+        invalidate_user_snapshot(instance.pk)
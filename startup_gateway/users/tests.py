@@ -1,13 +1,29 @@
+from datetime import timedelta
+from importlib import import_module
+from io import StringIO
+
+from django.apps import apps
 from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
 from django.core import mail
 from django.core.cache import cache
+from django.core.management import call_command
 from django.core.signing import SignatureExpired, TimestampSigner
+from django.db import IntegrityError, connection, transaction
 from unittest.mock import patch
 from django.test import override_settings
-from rest_framework.test import APITestCase
+from django.utils import timezone
+from rest_framework.test import APIRequestFactory, APITestCase
+from rest_framework_simplejwt.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.tokens import AccessToken
 
 from startups.models import StartupProfile
 from investors.models import InvestorProfile
+from users.authentication import CachedJWTAuthentication
+from users.models import Role, mask_to_roles, roles_to_mask
+from users.permissions import IsInvestorRole, IsStartupRole
+from users.services import is_password_hash_pending, schedule_password_hash
+from users.tokens import UserRefreshToken
 
 
 User = get_user_model()
@@ -373,3 +389,279 @@ class TestResendVerificationApi(APITestCase):
 
         user.refresh_from_db()
         self.assertEqual(user.email_verification_nonce, nonce_after_first)
+
+
+@override_settings(EMAIL_BACKEND="django.core.mail.backends.locmem.EmailBackend")
+class TestEmailUniqueness(APITestCase):
+    def test_duplicate_email_different_case_blocked_by_database(self):
+        User.objects.create_user(username="alice", email="alice@example.com", password="P@ssw0rd!123")
+
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            User.objects.create_user(username="alice2", email="Alice@Example.com", password="P@ssw0rd!123")
+
+    def test_blank_emails_are_not_unique(self):
+        User.objects.create_user(username="first", password="P@ssw0rd!123")
+        User.objects.create_user(username="second", password="P@ssw0rd!123")
+
+        self.assertEqual(User.objects.filter(email="").count(), 2)
+
+    def test_migration_refuses_case_duplicates(self):
+        migration = import_module("users.migrations.0004_user_email_lower_unique")
+        constraint = next(c for c in User._meta.constraints if c.name == "users_email_lower_uniq")
+        with connection.schema_editor() as editor:
+            editor.remove_constraint(User, constraint)
+        first = User.objects.create_user(username="alice", email="alice@example.com", password="P@ssw0rd!123")
+        second = User.objects.create_user(username="alice2", email="other@example.com", password="P@ssw0rd!123")
+        User.objects.filter(pk=second.pk).update(email="Alice@Example.com")
+
+        with self.assertRaisesMessage(RuntimeError, f"alice@example.com: #{first.pk} alice@example.com, #{second.pk}"):
+            migration.check_case_duplicates(apps, None)
+
+    def test_register_mixed_case_email_matches_existing_user(self):
+        User.objects.create_user(
+            username="alice",
+            email="alice@example.com",
+            password="P@ssw0rd!123",
+            verified=True,
+            is_active=True,
+        )
+
+        payload = {
+            "email": "ALICE@example.com",
+            "password": "P@ssw0rd!123",
+            "role": "startup",
+            "company_name": "Handmade Co",
+        }
+
+        with self.captureOnCommitCallbacks(execute=True):
+            resp = self.client.post("/api/auth/register/", payload, format="json")
+
+        self.assertEqual(resp.status_code, 201)
+        self.assertEqual(User.objects.count(), 1)
+        self.assertEqual(len(mail.outbox), 0)
+
+
+@override_settings(EMAIL_BACKEND="django.core.mail.backends.locmem.EmailBackend")
+class TestDeferredPasswordHashing(APITestCase):
+    payload = {
+        "email": "alice@example.com",
+        "password": "P@ssw0rd!123",
+        "role": "startup",
+        "company_name": "Handmade Co",
+    }
+
+    def test_inline_hashing_by_default(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.post("/api/auth/register/", self.payload, format="json")
+
+        user = User.objects.get(email="alice@example.com")
+        self.assertTrue(user.check_password("P@ssw0rd!123"))
+
+    @override_settings(PASSWORD_HASH_WORKERS=1)
+    def test_deferred_hashing_scheduled_after_commit(self):
+        with patch("users.services.schedule_password_hash") as schedule:
+            with self.captureOnCommitCallbacks(execute=True):
+                resp = self.client.post("/api/auth/register/", self.payload, format="json")
+
+        self.assertEqual(resp.status_code, 201)
+        user = User.objects.get(email="alice@example.com")
+        self.assertTrue(is_password_hash_pending(user.password))
+        self.assertTrue(user.check_password("P@ssw0rd!123"))
+        schedule.assert_called_once_with(user.pk, "P@ssw0rd!123", user_model=User)
+
+    @override_settings(PASSWORD_HASH_WORKERS=1)
+    def test_login_finalizes_hash_the_pool_never_stored(self):
+        with patch("users.services.schedule_password_hash"):
+            with self.captureOnCommitCallbacks(execute=True):
+                self.client.post("/api/auth/register/", self.payload, format="json")
+        User.objects.filter(email="alice@example.com").update(username="alice", is_active=True, verified=True)
+
+        resp = self.client.post("/api/token/", {"username": "alice", "password": "P@ssw0rd!123"}, format="json")
+
+        self.assertEqual(resp.status_code, 200, resp.data)
+        user = User.objects.get(email="alice@example.com")
+        self.assertFalse(is_password_hash_pending(user.password))
+        self.assertTrue(user.check_password("P@ssw0rd!123"))
+
+    def test_pool_does_not_overwrite_a_finalized_hash(self):
+        user = User.objects.create_user(username="alice", email="alice@example.com", password="New-P@ss1")
+
+        schedule_password_hash(user.pk, "P@ssw0rd!123")
+
+        user.refresh_from_db()
+        self.assertTrue(user.check_password("New-P@ss1"))
+
+    def test_schedule_password_hash_inline_fallback(self):
+        user = User.objects.create_user(username="alice", email="alice@example.com")
+        User.objects.filter(pk=user.pk).update(password=make_password("P@ssw0rd!123", hasher="pbkdf2_sha256_pending"))
+
+        schedule_password_hash(user.pk, "P@ssw0rd!123")
+
+        user.refresh_from_db()
+        self.assertTrue(user.check_password("P@ssw0rd!123"))
+
+
+class TestCachedJWTAuthentication(APITestCase):
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+        self.user = User.objects.create_user(
+            username="owner",
+            email="owner@example.com",
+            password="P@ssw0rd!123",
+            verified=True,
+            is_active=True,
+        )
+        self.user.roles.add(Role.objects.get(name="startup"))
+        self.startup = StartupProfile.objects.create(user=self.user, company_name="Handmade Co")
+
+    def authenticate(self, token):
+        request = APIRequestFactory().get("/", HTTP_AUTHORIZATION=f"Bearer {token}")
+        return CachedJWTAuthentication().authenticate(request)
+
+    def test_obtain_pair_embeds_user_claims(self):
+        resp = self.client.post(
+            "/api/token/",
+            {"username": "owner", "password": "P@ssw0rd!123"},
+            format="json",
+        )
+        self.assertEqual(resp.status_code, 200)
+
+        access = AccessToken(resp.data["access"])
+        self.assertEqual(access["role"], "startup")
+        self.assertTrue(access["verified"])
+        self.assertEqual(access["startup_profile_id"], self.startup.pk)
+        self.assertIsNone(access["investor_profile_id"])
+
+    def test_cached_user_needs_no_queries(self):
+        token = UserRefreshToken.for_user(self.user).access_token
+        self.authenticate(token)
+
+        with self.assertNumQueries(0):
+            user, _ = self.authenticate(token)
+
+        self.assertEqual(user, self.user)
+        self.assertEqual(user.active_role, "startup")
+        self.assertEqual(user.startup_profile_id, self.startup.pk)
+
+    def test_profile_change_invalidates_cache(self):
+        token = AccessToken.for_user(self.user)
+        user, _ = self.authenticate(token)
+        self.assertIsNone(user.investor_profile_id)
+
+        investor = InvestorProfile.objects.create(user=self.user, company_name="Example Investor")
+
+        user, _ = self.authenticate(token)
+        self.assertEqual(user.investor_profile_id, investor.pk)
+
+    def test_snapshot_overrides_stale_token_claims(self):
+        token = UserRefreshToken.for_user(self.user).access_token
+        self.assertTrue(token["verified"])
+        self.assertEqual(token["startup_profile_id"], self.startup.pk)
+
+        self.user.verified = False
+        self.user.save(update_fields=["verified"])
+        self.startup.delete()
+
+        user, _ = self.authenticate(token)
+        self.assertFalse(user.verified)
+        self.assertIsNone(user.startup_profile_id)
+
+    def test_inactive_user_rejected(self):
+        token = AccessToken.for_user(self.user)
+        self.user.is_active = False
+        self.user.save(update_fields=["is_active"])
+
+        with self.assertRaises(AuthenticationFailed):
+            self.authenticate(token)
+
+
+class TestSwitchRole(APITestCase):
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+        self.user = User.objects.create_user(username="both", email="both@example.com", password="P@ssw0rd!123")
+        self.user.roles.add(Role.objects.get(name="startup"), Role.objects.get(name="investor"))
+
+    def test_switch_issues_token_scoped_to_role(self):
+        access = UserRefreshToken.for_user(self.user, role="startup").access_token
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {access}")
+
+        resp = self.client.post("/api/auth/switch-role/", {"role": "investor"}, format="json")
+
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(AccessToken(resp.data["access"])["role"], "investor")
+        self.assertEqual(AccessToken(resp.data["refresh"], verify=False)["role"], "investor")
+
+    def test_switch_to_role_not_held_forbidden(self):
+        investor_role = Role.objects.get(name="investor")
+        self.user.roles.remove(investor_role)
+
+        access = UserRefreshToken.for_user(self.user).access_token
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {access}")
+
+        resp = self.client.post("/api/auth/switch-role/", {"role": "investor"}, format="json")
+        self.assertEqual(resp.status_code, 403)
+
+    def test_role_permission_reads_active_role_without_queries(self):
+        access = UserRefreshToken.for_user(self.user, role="investor").access_token
+        request = APIRequestFactory().get("/", HTTP_AUTHORIZATION=f"Bearer {access}")
+        CachedJWTAuthentication().authenticate(request)
+
+        with self.assertNumQueries(0):
+            request.user, _ = CachedJWTAuthentication().authenticate(request)
+            self.assertTrue(IsInvestorRole().has_permission(request, None))
+            self.assertFalse(IsStartupRole().has_permission(request, None))
+
+    def test_role_mask(self):
+        self.assertEqual(mask_to_roles(roles_to_mask(["investor", "startup"])), ("startup", "investor"))
+        self.assertEqual(roles_to_mask(["unknown"]), 0)
+
+
+class TestPurgeUnverifiedUsers(APITestCase):
+    def create_user(self, username, days_old, verified=False):
+        user = User.objects.create_user(
+            username=username,
+            email=f"{username}@example.com",
+            verified=verified,
+            is_active=verified,
+        )
+        User.objects.filter(pk=user.pk).update(created_at=timezone.now() - timedelta(days=days_old))
+        return user
+
+    def test_purges_stale_unverified_users_in_batches(self):
+        stale = [self.create_user(f"stale{i}", days_old=30) for i in range(3)]
+        StartupProfile.objects.create(user=stale[0], company_name="Bot Co")
+        fresh = self.create_user("fresh", days_old=1)
+        verified = self.create_user("verified", days_old=30, verified=True)
+
+        out = StringIO()
+        call_command("purge_unverified_users", "--older-than-days=7", "--batch-size=2", stdout=out)
+
+        self.assertFalse(User.objects.filter(pk__in=[u.pk for u in stale]).exists())
+        self.assertFalse(StartupProfile.objects.filter(company_name="Bot Co").exists())
+        self.assertEqual(User.objects.filter(pk__in=[fresh.pk, verified.pk]).count(), 2)
+        self.assertIn("Batch 2:", out.getvalue())
+        self.assertIn("Deleted 3 unverified users", out.getvalue())
+
+    def test_user_verified_after_batch_read_is_kept(self):
+        stale = self.create_user("stale", days_old=30)
+        atomic = transaction.atomic
+
+        def verify_then_atomic(*args, **kwargs):
+            User.objects.filter(pk=stale.pk).update(verified=True, is_active=True)
+            return atomic(*args, **kwargs)
+
+        with patch("django.db.transaction.atomic", side_effect=verify_then_atomic):
+            call_command("purge_unverified_users", stdout=StringIO())
+
+        self.assertTrue(User.objects.filter(pk=stale.pk).exists())
+
+    def test_dry_run_deletes_nothing(self):
+        self.create_user("stale", days_old=30)
+
+        out = StringIO()
+        call_command("purge_unverified_users", "--dry-run", stdout=out)
+
+        self.assertTrue(User.objects.filter(username="stale").exists())
+        self.assertIn("1 unverified users", out.getvalue())
@@ -0,0 +1,33 @@
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from users.models import resolve_active_role
+
+from .authentication import (
+    INVESTOR_PROFILE_CLAIM,
+    ROLE_CLAIM,
+    STARTUP_PROFILE_CLAIM,
+    VERIFIED_CLAIM,
+    get_user_snapshot,
+)
+
+
+def add_user_claims(token, user, role=None):
+    snapshot = get_user_snapshot(user.pk) or {}
+
+    token[VERIFIED_CLAIM] = bool(snapshot.get("verified", getattr(user, "verified", False)))
+    token[ROLE_CLAIM] = resolve_active_role(role, snapshot.get("role_mask", 0))
+    token[STARTUP_PROFILE_CLAIM] = snapshot.get("startup_profile_id")
+    token[INVESTOR_PROFILE_CLAIM] = snapshot.get("investor_profile_id")
+    return token
+
+
+class UserRefreshToken(RefreshToken):
+    """
+    Refresh token carrying the claims CachedJWTAuthentication reads; they are
+    copied into every access token derived from it.
+    """
+
+    @classmethod
+    def for_user(cls, user, role=None):
+        token = super().for_user(user)
+        return add_user_claims(token, user, role=role)
@@ -1,8 +1,9 @@
 from django.urls import path
-from .views import RegisterView, VerifyEmailView, ResendVerificationView
+from .views import RegisterView, VerifyEmailView, ResendVerificationView, SwitchRoleView
 
 urlpatterns = [
     path("register/", RegisterView.as_view(), name="auth-register"),
     path("verify-email/", VerifyEmailView.as_view(), name="auth-verify-email"),
     path("resend-verification/", ResendVerificationView.as_view(), name="auth-resend-verification"),
+    path("switch-role/", SwitchRoleView.as_view(), name="auth-switch-role"),
 ]
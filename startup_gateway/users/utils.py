@@ -0,0 +1,26 @@
+from investors.models import InvestorProfile
+from startups.models import StartupProfile
+
+
+PROFILE_MODELS = {
+    "investor": InvestorProfile,
+    "startup": StartupProfile,
+}
+
+
+def cached_profile_id(user, kind):
+    """
+    Return the id of the user's ``kind`` ("startup" or "investor") profile,
+    or None when they have none. Users resolved by CachedJWTAuthentication
+    already carry it; anyone else costs one query.
+    """
+    attr = f"{kind}_profile_id"
+    if hasattr(user, attr):
+        return getattr(user, attr)
+
+    return (
+        PROFILE_MODELS[kind].objects
+        .filter(user_id=user.pk)
+        .values_list("pk", flat=True)
+        .first()
+    )
@@ -5,10 +5,22 @@ from django.contrib.auth import get_user_model
 from rest_framework import status
 from rest_framework.views import APIView
 from rest_framework.response import Response
-from rest_framework.permissions import AllowAny
-
-from .serializers import RegisterSerializer, VerifyEmailSerializer, ResendVerificationSerializer
-from .services import send_verification_email, verify_email_token, is_resend_verification_throttled
+from rest_framework.permissions import AllowAny, IsAuthenticated
+
+from .permissions import user_has_role
+from .serializers import (
+    RegisterSerializer,
+    ResendVerificationSerializer,
+    SwitchRoleSerializer,
+    VerifyEmailSerializer,
+)
+from .services import (
+    get_user_by_email,
+    is_resend_verification_throttled,
+    send_verification_email,
+    verify_email_token,
+)
+from .tokens import UserRefreshToken
 
 
 User = get_user_model()
@@ -66,7 +78,7 @@ class ResendVerificationView(APIView):
                 status=status.HTTP_200_OK,
             )
 
-        user = User.objects.filter(email__iexact=email).first()
+        user = get_user_by_email(email)
         if not user or getattr(user, "verified", False):
             return Response(
                 {"detail": "If the email address is valid, a verification email has been sent."},
@@ -86,3 +98,27 @@ class ResendVerificationView(APIView):
             status=status.HTTP_200_OK,
         )
 
+
+class SwitchRoleView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request):
+        serializer = SwitchRoleSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        role = serializer.validated_data["role"]
+        if not user_has_role(request.user, role):
+            return Response(
+                {"detail": "You do not have this role."},
+                status=status.HTTP_403_FORBIDDEN,
+            )
+
+        refresh = UserRefreshToken.for_user(request.user, role=role)
+        return Response(
+            {
+                "refresh": str(refresh),
+                "access": str(refresh.access_token),
+                "role": role,
+            },
+            status=status.HTTP_200_OK,
+        )